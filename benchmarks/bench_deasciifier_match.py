@@ -0,0 +1,111 @@
+"""
+Micro-benchmark of the per-character cost of deasciifier pattern matching.
+
+Compares ``DeasciifierBuiltin.turkish_match_pattern`` on the original pickled pattern
+dictionaries, which looks up every substring of the context window, with the compiled
+``PatternAutomaton`` on the contexts of every candidate character of a sample text. The
+automata are measured both compiled in memory and memory-mapped from the binary pattern
+file, which holds the compiled transition tables.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_deasciifier_match
+"""
+import pickle
+import timeit
+
+from mintlemon.normalizer._builtin import (
+    ASCII_PICKLE_PATH,
+    TURKISH_ASCIIFY_TABLE,
+    DeasciifierBuiltin,
+)
+from mintlemon.normalizer._patterns import (
+    PATTERNS_BIN_PATH,
+    PatternAutomaton,
+    PatternTable,
+)
+
+TEXT = (
+    "O sirada bahcede cicekleri kokluyorduk. "
+    "Hersey bahcivanin islik calmasiyla yasandi... "
+    "Istanbul'da cok guzel bir gun gecirdik, aksam Izmir'e gitmeyi dusunuyoruz. "
+)
+
+
+def main(repeat: int = 5) -> None:
+    start = timeit.default_timer()
+    with open(ASCII_PICKLE_PATH, "rb") as file:
+        table = pickle.load(file)
+    unpickle_time = timeit.default_timer() - start
+
+    reference = DeasciifierBuiltin(TEXT)
+    reference.turkish_pattern_table = table
+
+    cases = []
+    for point, char in enumerate(TEXT):
+        letter = TURKISH_ASCIIFY_TABLE.get(char, char).lower()
+        if letter in table:
+            context = reference.turkish_get_context(
+                DeasciifierBuiltin.context_size, point
+            )
+            cases.append((letter, point, context))
+
+    start = timeit.default_timer()
+    automata = {
+        letter: PatternAutomaton.from_patterns(patterns)
+        for letter, patterns in table.items()
+    }
+    compile_time = timeit.default_timer() - start
+
+    start = timeit.default_timer()
+    mapped = PatternTable.load(PATTERNS_BIN_PATH)
+    load_time = timeit.default_timer() - start
+
+    def run_reference():
+        for letter, point, _ in cases:
+            reference.turkish_match_pattern(table[letter], point)
+
+    def run_automaton():
+        for letter, _, context in cases:
+            automata[letter].match(context)
+
+    def run_mapped():
+        for letter, _, context in cases:
+            mapped[letter].match(context)
+
+    # turkish_match_pattern builds its own context, measure that part separately to
+    # isolate matching.
+    def run_context():
+        for _, point, _ in cases:
+            reference.turkish_get_context(DeasciifierBuiltin.context_size, point)
+
+    reference_time = min(timeit.repeat(run_reference, number=10, repeat=repeat)) / (
+        10 * len(cases)
+    )
+    context_time = min(timeit.repeat(run_context, number=10, repeat=repeat)) / (
+        10 * len(cases)
+    )
+    automaton_time = min(timeit.repeat(run_automaton, number=10, repeat=repeat)) / (
+        10 * len(cases)
+    )
+    mapped_time = min(timeit.repeat(run_mapped, number=10, repeat=repeat)) / (
+        10 * len(cases)
+    )
+
+    print(f"candidate characters        : {len(cases)}")
+    print(f"pickle load time            : {unpickle_time * 1e3:.2f} ms")
+    print(f"automata compile time       : {compile_time * 1e3:.1f} ms")
+    print(f"binary pattern file load    : {load_time * 1e3:.2f} ms")
+    print(
+        f"substring lookups per char  : {(reference_time - context_time) * 1e6:.2f} us"
+    )
+    print(f"automaton per char          : {automaton_time * 1e6:.2f} us")
+    print(f"mapped automaton per char   : {mapped_time * 1e6:.2f} us")
+    print(
+        "speedup                     : "
+        f"{(reference_time - context_time) / automaton_time:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
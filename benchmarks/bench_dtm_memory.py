@@ -0,0 +1,77 @@
+"""
+Memory benchmark of the output modes of ``TextRootDTMVectorizer.fit_transform``.
+
+Builds synthetic corpora whose words follow a Zipf distribution and measures the peak
+memory allocated by ``fit_transform`` with a dense DataFrame, a sparse DataFrame and a
+CSR matrix. The root cache is filled beforehand so that only the vectorization is
+measured, and dense matrices that would take more than ``MAX_DENSE_BYTES`` are estimated
+instead of allocated.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_dtm_memory
+"""
+import logging
+import random
+import tracemalloc
+
+import pandas as pd
+
+from mintlemon import RootCache, TextRootDTMVectorizer
+
+MAX_DENSE_BYTES = 2 * 1024**3
+VOCABULARY = [f"kelime{index}" for index in range(20000)]
+WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+
+def peak_memory(function) -> int:
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(sizes=(1000, 10000, 50000), words_per_document: int = 50) -> None:
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(0)
+    root_cache = RootCache(maxsize=None)
+    for word in VOCABULARY:
+        root_cache.get(word, lambda word: word)
+
+    print(
+        f"{'documents':>10} {'roots':>7} {'dense frame':>13} {'sparse frame':>13}"
+        f" {'csr matrix':>12}"
+    )
+    for size in sizes:
+        texts = [
+            " ".join(rng.choices(VOCABULARY, WEIGHTS, k=words_per_document))
+            for _ in range(size)
+        ]
+        vectorizer = TextRootDTMVectorizer(
+            pd.DataFrame({"text": texts}),
+            "text",
+            tokenizer="builtin",
+            root_cache=root_cache,
+        )
+        matrix, roots = vectorizer.fit_transform(sparse=True, as_frame=False)
+
+        dense_bytes = matrix.shape[0] * matrix.shape[1] * matrix.dtype.itemsize
+        if dense_bytes <= MAX_DENSE_BYTES:
+            dense_peak = peak_memory(lambda: vectorizer.fit_transform(sparse=False))
+            dense = f"{dense_peak / 1024**2:.1f}MB"
+        else:
+            dense = f"~{dense_bytes / 1024**2:.0f}MB"
+        sparse = peak_memory(lambda: vectorizer.fit_transform(sparse=True)) / 1024**2
+        csr = (
+            peak_memory(lambda: vectorizer.fit_transform(sparse=True, as_frame=False))
+            / 1024**2
+        )
+        print(
+            f"{size:>10} {len(roots):>7} {dense:>13} {sparse:>11.1f}MB {csr:>10.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
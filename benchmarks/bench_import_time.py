@@ -0,0 +1,59 @@
+"""
+Benchmark of the time and memory it takes to import mintlemon.
+
+Every case runs in a fresh interpreter and reports the wall-clock time of its imports
+and the peak resident set size of the process. ``TextRootDTMVectorizer`` is loaded
+lazily, so only the last case pays for zeyrek, pandas, scikit-learn and nltk.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_import_time
+"""
+import json
+import subprocess
+import sys
+
+CASES = [
+    ("python", "pass"),
+    ("import mintlemon", "import mintlemon"),
+    (
+        "Normalizer.lower_case",
+        "from mintlemon import Normalizer; Normalizer.lower_case('İSTANBUL')",
+    ),
+    ("SentenceSplitter", "from mintlemon import SentenceSplitter; SentenceSplitter()"),
+    ("TextRootDTMVectorizer", "from mintlemon import TextRootDTMVectorizer"),
+]
+
+SCRIPT = """
+import json, resource, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss]))
+"""
+
+
+def measure(code: str, repeat: int) -> tuple:
+    results = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", SCRIPT.format(code=code)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return min(elapsed for elapsed, _ in results), max(rss for _, rss in results)
+
+
+def main(repeat: int = 5) -> None:
+    print(f"{'case':24} {'import time':>12} {'peak RSS':>10}")
+    for name, code in CASES:
+        elapsed, rss = measure(code, repeat)
+        # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+        megabytes = rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+        print(f"{name:24} {elapsed * 1e3:>10.1f}ms {megabytes:>8.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
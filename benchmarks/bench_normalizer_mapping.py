@@ -0,0 +1,123 @@
+"""
+Micro-benchmark of the per-call cost of ``Normalizer.lower_case`` and
+``Normalizer.remove_accent_marks``.
+
+Compares the current implementations with the original ones, which rebuilt their
+dictionaries on every call and replaced every Turkish capital, and with a single
+``str.translate`` table on 1 KB and 100 KB inputs.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_normalizer_mapping
+"""
+import timeit
+import unicodedata
+
+from mintlemon import Normalizer
+
+TEXT = (
+    "Merhâbâ DÜNYA!!! Bugün 2,5 kilo elma aldım, 12.34 TL ödedim... Çok GÜZEL bir gün; "
+    "değil mi? İyi akşamlar, Işık Hanım. Kâğıt ve kalemi masaya bırakır mısın? "
+)
+
+LOWER_CASE_TABLE = str.maketrans("İIĞÜÖŞÇ", "iığüöşç")
+ACCENT_TABLE = str.maketrans("âôîêûÂÔÎÊÛ", "aoieuAOİEU")
+
+
+def original_lower_case(text: str) -> str:
+    turkish_lowercase_dict = {
+        "İ": "i",
+        "I": "ı",
+        "Ğ": "ğ",
+        "Ü": "ü",
+        "Ö": "ö",
+        "Ş": "ş",
+        "Ç": "ç",
+    }
+    for k, v in turkish_lowercase_dict.items():
+        text = text.replace(k, v)
+    return text.lower()
+
+
+def original_remove_accent_marks(text: str, accent_mapping=None) -> str:
+    if accent_mapping is None:
+        accent_mapping = {
+            "â": "a",
+            "ô": "o",
+            "î": "i",
+            "ê": "e",
+            "û": "u",
+            "Â": "A",
+            "Ô": "O",
+            "Î": "İ",
+            "Ê": "E",
+            "Û": "U",
+        }
+    for mark, letter in accent_mapping.items():
+        text = text.replace(mark, letter)
+    return text
+
+
+def per_call(function, text: str, repeat: int) -> float:
+    number = max(1, 200_000 // len(text))
+    return (
+        min(timeit.repeat(lambda: function(text), number=number, repeat=repeat))
+        / number
+    )
+
+
+def main(repeat: int = 5) -> None:
+    custom_mapping = {"ä": "a", "ö": "o", "ü": "u", "ë": "e", "â": "a"}
+    # Every precomposed letter mapped to its base letter.
+    base_mapping = {
+        char: unicodedata.normalize("NFD", char)[0]
+        for char in map(chr, range(0xC0, 0x2000))
+        if char.isalpha() and unicodedata.normalize("NFD", char)[0] != char
+    }
+    cases = [
+        (
+            "lower_case",
+            original_lower_case,
+            Normalizer.lower_case,
+            lambda text: text.translate(LOWER_CASE_TABLE).lower(),
+        ),
+        (
+            "remove_accent_marks",
+            original_remove_accent_marks,
+            Normalizer.remove_accent_marks,
+            lambda text: text.translate(ACCENT_TABLE),
+        ),
+        (
+            "remove_accent_marks(mapping)",
+            lambda text: original_remove_accent_marks(text, custom_mapping),
+            lambda text: Normalizer.remove_accent_marks(text, custom_mapping),
+            lambda text: text.translate(str.maketrans(custom_mapping)),
+        ),
+        (
+            f"remove_accent_marks({len(base_mapping)} marks)",
+            lambda text: original_remove_accent_marks(text, base_mapping),
+            lambda text: Normalizer.remove_accent_marks(text, base_mapping),
+            lambda text: text.translate(str.maketrans(base_mapping)),
+        ),
+    ]
+
+    print(
+        f"{'function':32} {'size':>6} {'original':>10} {'current':>10}"
+        f" {'translate':>10} {'speedup':>8}"
+    )
+    for size in (1_000, 100_000):
+        text = (TEXT * (size // len(TEXT) + 1))[:size]
+        for name, original, current, translate in cases:
+            assert current(text) == original(text)
+            original_time = per_call(original, text, repeat)
+            current_time = per_call(current, text, repeat)
+            translate_time = per_call(translate, text, repeat)
+            print(
+                f"{name:32} {size // 1000:>4}KB {original_time * 1e6:>8.1f}us"
+                f" {current_time * 1e6:>8.1f}us "
+                f"{translate_time * 1e6:>8.1f}us {original_time / current_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark of the conversion of numbers to Turkish words.
+
+Compares the original ``NormBuiltin.number_to_word``, which rebuilt its word lists and
+the words of every group of three digits on every call, and the original
+``num_to_tr_text``, which parsed every number with ``float``, with the current
+table-driven ones, on numbers of 1 to 21 digits and on a document of about 2000 numbers.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_number_words
+"""
+import random
+import re
+import timeit
+import warnings
+
+from mintlemon import Normalizer
+from mintlemon.normalizer._builtin import NormBuiltin
+
+ORIGINAL_NUMBER_WORD_REGEX = re.compile(r"[-+]?\d*.\d+|\d+")
+
+
+def original_number_to_word(number: int) -> str:
+    negative_expression = None
+    if int(number) < 0:
+        number = int(str(number).split("-")[1])
+        negative_expression = "eksi "
+
+    ones = [
+        "sıfır",
+        "bir",
+        "iki",
+        "üç",
+        "dört",
+        "beş",
+        "altı",
+        "yedi",
+        "sekiz",
+        "dokuz",
+    ]
+    tens = [
+        "on",
+        "yirmi",
+        "otuz",
+        "kırk",
+        "elli",
+        "altmış",
+        "yetmiş",
+        "seksen",
+        "doksan",
+    ]
+    scales = ["", "bin", "milyon", "milyar", "trilyon", "katrilyon", "kentilyon"]
+    word = ""
+
+    if number == 0:
+        return ones[0]
+
+    group = 0
+    while number > 0:
+        number, remainder = divmod(number, 1000)
+        if remainder > 0:
+            group_description = NormBuiltin.convert_group(remainder, ones, tens)
+            if group > 0:
+                group_description += " " + scales[group]
+            ne = " " if negative_expression is None else f"{negative_expression}"
+            word = ne + group_description + word
+        group += 1
+
+    return word
+
+
+def original_number_to_words(match) -> str:
+    number = float(match.group(0).replace(",", "."))
+    if number >= 1e21:
+        return warnings.warn(
+            "The number is too big to convert it to words in Turkish language."
+        )
+    elif number == int(number):
+        return original_number_to_word(number=int(number))
+    else:
+        return warnings.warn(
+            "In Turkish language, decimal numbers are expressed with commas."
+        )
+
+
+def original_num_to_tr_text(text: str) -> str:
+    return ORIGINAL_NUMBER_WORD_REGEX.sub(
+        original_number_to_words, text.replace(",", " virgül ")
+    ).lstrip()
+
+
+def per_call(function, argument, number: int, repeat: int) -> float:
+    return (
+        min(timeit.repeat(lambda: function(argument), number=number, repeat=repeat))
+        / number
+    )
+
+
+def main(repeat: int = 5) -> None:
+    rng = random.Random(0)
+    print(f"{'function':30} {'digits':>6} {'per number':>12} {'speedup':>8}")
+    for digits in (1, 3, 6, 12, 18, 21):
+        numbers = [rng.randrange(10 ** (digits - 1), 10**digits) for _ in range(1000)]
+        baseline = None
+        for name, function in [
+            ("original number_to_word", original_number_to_word),
+            ("NormBuiltin.number_to_word", NormBuiltin.number_to_word),
+        ]:
+            elapsed = per_call(
+                lambda numbers: [function(number) for number in numbers],
+                numbers,
+                20,
+                repeat,
+            )
+            elapsed /= len(numbers)
+            baseline = baseline or elapsed
+            print(
+                f"{name:30} {digits:>6} {elapsed * 1e6:>10.2f}us"
+                f" {baseline / elapsed:>7.1f}x"
+            )
+
+    # Amounts, dates and counts of up to 15 digits, like in a financial report.
+    document = " ".join(
+        f"{rng.randrange(10 ** rng.randrange(1, 16))} TL ve {rng.randrange(1, 32)} gün"
+        for _ in range(1000)
+    )
+    print(f"\n{'function':30} {'numbers':>6} {'per document':>12} {'speedup':>8}")
+    baseline = None
+    for name, function in [
+        ("original num_to_tr_text", original_num_to_tr_text),
+        ("num_to_tr_text", Normalizer.num_to_tr_text),
+    ]:
+        elapsed = per_call(function, document, 5, repeat)
+        baseline = baseline or elapsed
+        print(
+            f"{name:30} {2000:>6} {elapsed * 1e3:>10.2f}ms {baseline / elapsed:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark of the normalization of a pandas Series of texts.
+
+Compares ``Series.apply`` of the original ``normalize_chars``, which built its table and
+went through ``str.translate`` for every text, and of the original
+``remove_punctuations`` and ``remove_numbers``, which replaced every space by a space
+when collapsing the whitespace, ``Series.apply`` of the current ``Normalizer`` methods
+and the ``mintlemon`` Series accessor, on 100,000 short texts.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_pandas_accessor
+"""
+import random
+import re
+import timeit
+
+import pandas as pd
+
+from mintlemon import Normalizer
+
+# Registers the Series.mintlemon accessor.
+from mintlemon.normalizer import pandas_accessor  # noqa: F401
+from mintlemon.normalizer.normalizer import NUMBER_REGEXES, PUNCTUATION_REGEX
+
+WORDS = (
+    "Bu bir örnek cümle, gereksiz kelimeleri çıkarmak istiyorum. "
+    "Ama İstanbul'da hava 2,5 gün çok güzeldi ve biz de bu yüzden dışarı çıktık! "
+    "Işıklar yanınca EVE döndük, saat 23.30 idi."
+).split()
+
+ORIGINAL_SPACES_REGEX = re.compile(r"\s+")
+ORIGINAL_SPACES_AND_COMMAS_REGEX = re.compile(r"[\s,]+")
+
+
+def original_normalize_chars(text: str) -> str:
+    return text.translate(str.maketrans("ğĞıİöÖüÜşŞçÇ", "gGiIoOuUsScC"))
+
+
+def original_remove_punctuations(text: str) -> str:
+    return ORIGINAL_SPACES_REGEX.sub(" ", PUNCTUATION_REGEX.sub("", text)).strip()
+
+
+def original_remove_numbers(text: str) -> str:
+    return ORIGINAL_SPACES_AND_COMMAS_REGEX.sub(
+        " ", NUMBER_REGEXES[True, True].sub("", text)
+    ).strip()
+
+
+def elapsed(function, repeat: int) -> float:
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main(size: int = 100_000, repeat: int = 5) -> None:
+    rng = random.Random(0)
+    series = pd.Series(
+        [" ".join(rng.choices(WORDS, k=rng.randrange(5, 25))) for _ in range(size)]
+    )
+    originals = {
+        "normalize_chars": original_normalize_chars,
+        "remove_punctuations": original_remove_punctuations,
+        "remove_numbers": original_remove_numbers,
+    }
+    steps = [
+        "lower_case",
+        "remove_accent_marks",
+        "normalize_chars",
+        "remove_punctuations",
+        "remove_numbers",
+        "remove_stopwords",
+    ]
+    print(f"{'step':22} {'original':>10} {'apply':>10} {'accessor':>10} {'speedup':>8}")
+    for step in steps:
+        method = getattr(Normalizer, step)
+        applied = elapsed(lambda: series.apply(method), repeat)
+        original = (
+            elapsed(lambda: series.apply(originals[step]), repeat)
+            if step in originals
+            else applied
+        )
+        accessed = elapsed(lambda: getattr(series.mintlemon, step)(), repeat)
+        print(
+            f"{step:22} {original * 1e3:>8.1f}ms {applied * 1e3:>8.1f}ms"
+            f" {accessed * 1e3:>8.1f}ms"
+            f" {original / accessed:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark of the startup time and memory of the deasciifier pattern table per worker.
+
+Compares the original pickled pattern dictionaries, which every process unpickles into
+its own objects, with the binary pattern file, which every process memory-maps and
+matches in place. Every case starts several worker processes that load the table and
+deasciify a sample text, then wait for each other so that the pages of the pattern
+file are mapped by all of them when their memory is measured.
+
+The memory is read from ``/proc/self/smaps_rollup``: the growth of the resident set,
+of its proportional share (PSS, shared pages being divided between the processes
+mapping them) and of its private pages. Without it, only the growth of the peak
+resident set is reported.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_pattern_loading
+"""
+import multiprocessing
+import pickle
+import resource
+import sys
+import time
+
+from mintlemon.normalizer._builtin import ASCII_PICKLE_PATH, DeasciifierBuiltin
+from mintlemon.normalizer._patterns import PATTERNS_BIN_PATH, PatternTable
+
+TEXT = (
+    "O sirada bahcede cicekleri kokluyorduk. "
+    "Hersey bahcivanin islik calmasiyla yasandi... "
+    "Istanbul'da cok guzel bir gun gecirdik, aksam Izmir'e gitmeyi dusunuyoruz. "
+)
+
+
+def load_pickle():
+    with open(ASCII_PICKLE_PATH, "rb") as file:
+        return pickle.load(file)
+
+
+def load_mmap():
+    return PatternTable.load(PATTERNS_BIN_PATH)
+
+
+LOADERS = {"pickle": load_pickle, "mmap": load_mmap}
+
+
+def memory() -> dict:
+    """Returns the resident, proportional and private memory of the process in KB"""
+    try:
+        with open("/proc/self/smaps_rollup") as file:
+            fields = {
+                line.split(":")[0]: int(line.split()[1])
+                for line in file
+                if line.endswith("kB\n")
+            }
+    except OSError:
+        # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return {"rss": rss // 1024 if sys.platform == "darwin" else rss}
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "private": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def worker(loader: str, barrier) -> tuple:
+    before = memory()
+    start = time.perf_counter()
+    table = LOADERS[loader]()
+    load_time = time.perf_counter() - start
+
+    deasciifier = DeasciifierBuiltin(TEXT)
+    deasciifier.turkish_pattern_table = table
+    deasciifier.convert_to_turkish()
+    first_use_time = time.perf_counter() - start
+
+    barrier.wait()
+    after = memory()
+    return load_time, first_use_time, {key: after[key] - before[key] for key in after}
+
+
+def main(workers: int = 4) -> None:
+    context = multiprocessing.get_context("spawn")
+    print(f"{workers} workers, {PATTERNS_BIN_PATH}")
+    print(
+        f"{'loader':8} {'load':>9} {'first use':>10} {'RSS':>9} {'PSS':>9}"
+        f" {'private':>9}"
+    )
+    for loader in LOADERS:
+        barrier = context.Manager().Barrier(workers)
+        with context.Pool(workers) as pool:
+            results = pool.starmap(worker, [(loader, barrier)] * workers)
+        load_time = max(result[0] for result in results)
+        first_use_time = max(result[1] for result in results)
+        growth = {
+            key: max(result[2][key] for result in results) / 1024
+            for key in results[0][2]
+        }
+        print(
+            f"{loader:8} {load_time * 1e3:>7.2f}ms {first_use_time * 1e3:>8.2f}ms"
+            + "".join(
+                f" {growth[key]:>7.1f}MB" if key in growth else f" {'-':>9}"
+                for key in ("rss", "pss", "private")
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark of ``SentenceSplitter.split_sentences``.
+
+Compares the current single scan, which looks the word preceding every candidate dot up
+in a set of prefixes, with the original implementation, which removed the dots of
+non-breaking prefixes with an alternation of all of them before splitting the altered
+text. Then splits the corpus written to a file with ``split_file``, serially and with a
+worker per CPU.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_sentence_splitter
+"""
+import os
+import re
+import tempfile
+import timeit
+
+from mintlemon import SentenceSplitter
+from mintlemon.sentence_splitter.sentence_splitter import PATH
+
+SENTENCES = [
+    "Dr. Ahmet Öztürk, Türkiye genelinde birçok hastanede çalışmıştır.",
+    "Bu hastaneler arasında Ankara Üniversitesi Tıp Fakültesi de vardır.",
+    "Prof. Dr. Ayşe Hanım 5. kattaki ofisinde mi?",
+    "Toplantı saat 14.30'da başlayacak!",
+    "Yrd. Doç. Mehmet Bey, vs. konulara da değindi.",
+]
+
+
+def original_splitter():
+    with open(PATH, "r", encoding="utf-8") as file:
+        prefixes = file.read().splitlines()
+    prefix_regex = re.compile(r"(?:^|\s)(" + "|".join(prefixes) + r")\.")
+    boundary_regex = re.compile(r"(?<=[.!?])\s")
+    return lambda text: boundary_regex.split(prefix_regex.sub(r"\1", text))
+
+
+def main(documents: int = 20000, repeat: int = 3) -> None:
+    corpus = [
+        " ".join(SENTENCES[(index + offset) % len(SENTENCES)] for offset in range(4))
+        for index in range(documents)
+    ]
+    characters = sum(map(len, corpus))
+    splitter = SentenceSplitter()
+    cases = [
+        ("original", original_splitter()),
+        ("SentenceSplitter.split_sentences", splitter.split_sentences),
+    ]
+
+    print(f"corpus: {documents} documents, {characters / 1e6:.1f}M characters")
+    baseline = None
+    for name, split in cases:
+        elapsed = min(
+            timeit.repeat(
+                lambda: [split(text) for text in corpus], number=1, repeat=repeat
+            )
+        )
+        baseline = baseline or elapsed
+        print(
+            f"{name:34} {elapsed:>8.3f}s {characters / elapsed / 1e6:>8.1f}M chars/s"
+            f" {baseline / elapsed:>6.1f}x"
+        )
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.txt")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n".join(corpus))
+        for n_jobs in (1, -1):
+            name = f"split_file(n_jobs={n_jobs})"
+
+            def run():
+                return sum(1 for _ in splitter.split_file(path, n_jobs=n_jobs))
+
+            elapsed = min(timeit.repeat(run, number=1, repeat=repeat))
+            speed = characters / elapsed / 1e6
+            print(
+                f"{name:34} {elapsed:>8.3f}s {speed:>8.1f}M chars/s"
+                f" {baseline / elapsed:>6.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
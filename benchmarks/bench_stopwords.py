@@ -0,0 +1,70 @@
+"""
+Benchmark of the per-document cost of stop word removal.
+
+Compares the original ``Normalizer.remove_stopwords``, which read the stop word file
+again for every document and lowercased every word with ``str.lower``, with the current
+one and with a ``StopwordFilter`` created once, on documents of about 100 and 2000
+characters. Both versions of ``remove_stopwords`` are also measured with a set of stop
+words given by the caller.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_stopwords
+"""
+import timeit
+
+from mintlemon import Normalizer, StopwordFilter
+from mintlemon.normalizer.stopwords import ST_WR_PATH
+
+TEXT = (
+    "Bu bir örnek cümle, gereksiz kelimeleri çıkarmak istiyorum. "
+    "Ama İstanbul'da hava çok güzel ve biz de bu yüzden dışarı çıktık. "
+    "Işıklar yanınca EVE döndük, çünkü geç olmuştu. "
+)
+
+
+def original_remove_stopwords(text: str, stopwords=None) -> str:
+    if stopwords is None:
+        with open(ST_WR_PATH, "r", encoding="utf-8") as file:
+            stopwords = set(file.read().split())
+    elif isinstance(stopwords, list):
+        stopwords = set(stopwords)
+    return " ".join(word for word in text.split() if word.lower() not in stopwords)
+
+
+def per_call(function, text: str, repeat: int) -> float:
+    number = max(1, 200_000 // len(text))
+    return (
+        min(timeit.repeat(lambda: function(text), number=number, repeat=repeat))
+        / number
+    )
+
+
+def main(repeat: int = 5) -> None:
+    stopwords = StopwordFilter()
+    custom = set(stopwords.stopwords)
+    cases = [
+        ("original", original_remove_stopwords),
+        ("Normalizer.remove_stopwords", Normalizer.remove_stopwords),
+        ("StopwordFilter.filter", stopwords.filter),
+        ("original with a set", lambda text: original_remove_stopwords(text, custom)),
+        (
+            "remove_stopwords with a set",
+            lambda text: Normalizer.remove_stopwords(text, custom),
+        ),
+    ]
+    print(f"{'function':30} {'size':>6} {'per document':>14} {'speedup':>8}")
+    for size in (100, 2000):
+        text = (TEXT * (size // len(TEXT) + 1))[:size]
+        baseline = None
+        for name, function in cases:
+            elapsed = per_call(function, text, repeat)
+            baseline = baseline or elapsed
+            print(
+                f"{name:30} {size:>6} {elapsed * 1e6:>12.1f}us"
+                f" {baseline / elapsed:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark of the word tokenizers available to ``TextRootDTMVectorizer``.
+
+Tokenizes a synthetic corpus with the regex based ``WordTokenizer`` and with
+``nltk.word_tokenize``. The latter needs the nltk punkt models, if they are not
+installed only its word tokenizer is measured, without the sentence splitting it runs
+first.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_tokenizer
+"""
+import timeit
+
+import nltk
+from nltk.tokenize import NLTKWordTokenizer
+
+from mintlemon import WordTokenizer
+
+SENTENCES = [
+    "O sırada bahçede çiçekleri kokluyorduk.",
+    "Herşey bahçıvanın ıslık çalmasıyla yaşandı...",
+    "İstanbul'da 3,5 saat kaldık, 1990'lı yıllardan kalma bir otelde!",
+    "Dr. Ahmet Öztürk, Ankara Üniversitesi'nde saat 12:30'da ders veriyor mu?",
+    "E-posta adresimi unutmuşum; yarın tekrar yazarım.",
+]
+
+
+def main(documents: int = 20000, repeat: int = 3) -> None:
+    corpus = [
+        " ".join(SENTENCES[(index + offset) % len(SENTENCES)] for offset in range(4))
+        for index in range(documents)
+    ]
+    characters = sum(map(len, corpus))
+    tokenizer = WordTokenizer()
+
+    cases = [
+        (
+            "WordTokenizer.tokenize",
+            lambda: [tokenizer.tokenize(text) for text in corpus],
+        ),
+        (
+            "WordTokenizer.iter_tokens",
+            lambda: [list(tokenizer.iter_tokens(text)) for text in corpus],
+        ),
+    ]
+    try:
+        nltk.data.find("tokenizers/punkt")
+        cases.append(
+            (
+                "nltk.word_tokenize",
+                lambda: [nltk.word_tokenize(text) for text in corpus],
+            )
+        )
+    except LookupError:
+        word_tokenizer = NLTKWordTokenizer()
+        cases.append(
+            (
+                "NLTKWordTokenizer (no punkt)",
+                lambda: [word_tokenizer.tokenize(text) for text in corpus],
+            )
+        )
+
+    print(f"corpus: {documents} documents, {characters / 1e6:.1f}M characters")
+    baseline = None
+    for name, run in reversed(cases):
+        elapsed = min(timeit.repeat(run, number=1, repeat=repeat))
+        baseline = baseline or elapsed
+        print(
+            f"{name:30} {elapsed:>8.3f}s {characters / elapsed / 1e6:>8.1f}M chars/s"
+            f" {baseline / elapsed:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,27 @@
+from .normalizer import Deasciifier, Normalizer, RootCache, StopwordFilter
 from .sentence_splitter import SentenceSplitter
-from .normalizer import Normalizer
-from .normalizer import TextRootDTMVectorizer
+from .tokenizer import WordTokenizer
 
-__all__ = ["SentenceSplitter", "Normalizer", "TextRootDTMVectorizer"]
+__all__ = [
+    "SentenceSplitter",
+    "WordTokenizer",
+    "Normalizer",
+    "Deasciifier",
+    "RootCache",
+    "StopwordFilter",
+    "TextRootDTMVectorizer",
+    "HashingRootVectorizer",
+]
+
+
+def __getattr__(name):
+    # Forwarded to the lazy attributes of mintlemon.normalizer.
+    if name in ("TextRootDTMVectorizer", "HashingRootVectorizer"):
+        from . import normalizer
+
+        return getattr(normalizer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
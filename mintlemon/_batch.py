@@ -0,0 +1,53 @@
+from typing import Callable
+
+
+def map_texts(function: Callable[[str], object], texts):
+    """
+    Applies function to every text of a list, a NumPy array or a pandas Series.
+
+    NumPy arrays and pandas Series are returned as an array of the same shape or a
+    Series with the same index, any other iterable as a list. Neither NumPy nor pandas
+    is imported unless such an object is given.
+
+    Raises
+    ------
+    TypeError
+        If texts is a pandas DataFrame, whose iteration gives its column names rather
+        than texts.
+    """
+    if _is_dataframe(texts):
+        raise TypeError(
+            "Expected texts, got a DataFrame: pass one of its columns instead."
+        )
+    if _is_series(texts):
+        return type(texts)(
+            [function(text) for text in texts.tolist()],
+            index=texts.index,
+            name=texts.name,
+            dtype=object,
+        )
+    if _is_ndarray(texts):
+        import numpy
+
+        results = [function(text) for text in texts.ravel().tolist()]
+        if texts.dtype.kind == "U" and all(
+            isinstance(result, str) for result in results
+        ):
+            return numpy.array(results, dtype=str).reshape(texts.shape)
+        array = numpy.empty(len(results), dtype=object)
+        for index, result in enumerate(results):
+            array[index] = result
+        return array.reshape(texts.shape)
+    return [function(text) for text in texts]
+
+
+def _is_series(texts) -> bool:
+    return type(texts).__module__.startswith("pandas") and hasattr(texts, "index")
+
+
+def _is_dataframe(texts) -> bool:
+    return type(texts).__module__.startswith("pandas") and hasattr(texts, "columns")
+
+
+def _is_ndarray(texts) -> bool:
+    return type(texts).__module__ == "numpy" and hasattr(texts, "ravel")
@@ -0,0 +1,98 @@
+import os
+from collections import deque
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional
+
+
+def effective_n_jobs(n_jobs: Optional[int]) -> int:
+    """
+    Resolves the number of worker processes the way scikit-learn does.
+
+    ``None`` means 1, negative values count back from the number of CPUs, ``-1`` using
+    all of them.
+
+    Raises
+    ------
+    ValueError
+        If n_jobs is 0.
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise ValueError("n_jobs must not be 0.")
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def iter_chunks(iterable: Iterable, chunksize: int) -> Iterator[List]:
+    """
+    Yields consecutive lists of at most chunksize items from the iterable.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer.")
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def imap_chunks(
+    func: Callable[[List], object],
+    iterable: Iterable,
+    n_jobs: Optional[int] = None,
+    chunksize: int = 256,
+    initializer: Optional[Callable] = None,
+    initargs: tuple = (),
+) -> Iterator:
+    """
+    Applies func to consecutive chunks of the iterable and yields its results in input
+    order.
+
+    With more than one job the chunks are processed by a pool of worker processes, each
+    of them running the initializer once. At most two chunks per worker are in flight,
+    so the iterable is consumed lazily and arbitrarily long inputs run in bounded
+    memory.
+
+    Parameters
+    ----------
+    func : callable
+        A picklable function taking a list of items.
+    iterable : iterable
+        The items to process.
+    n_jobs : int, optional
+        The number of worker processes, see ``effective_n_jobs``. With a single job the
+        chunks are processed in the calling process without starting a pool.
+    chunksize : int, optional
+        The number of items sent to a worker at once.
+    initializer : callable, optional
+        A picklable function run once in every worker process.
+    initargs : tuple, optional
+        The arguments of the initializer.
+    """
+    n_jobs = effective_n_jobs(n_jobs)
+    chunks = iter_chunks(iterable, chunksize)
+    if n_jobs == 1:
+        for chunk in chunks:
+            yield func(chunk)
+        return
+
+    # Importing the process pool machinery is slow, only pay for it when a pool is used.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        n_jobs, initializer=initializer, initargs=initargs
+    ) as executor:
+        pending = deque()
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(func, chunk))
+                if len(pending) >= 2 * n_jobs:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
@@ -1,4 +1,27 @@
+from ._deasciifier import Deasciifier
 from .normalizer import Normalizer
-from .text_to_root_dtm import TextRootDTMVectorizer
+from .root_cache import RootCache
+from .stopwords import StopwordFilter
 
-__all__ = ["Normalizer", "TextRootDTMVectorizer"]
+__all__ = [
+    "Normalizer",
+    "Deasciifier",
+    "RootCache",
+    "StopwordFilter",
+    "TextRootDTMVectorizer",
+    "HashingRootVectorizer",
+]
+
+
+def __getattr__(name):
+    # The vectorizers need zeyrek, pandas, scikit-learn and nltk, which are only
+    # imported on first use.
+    if name in ("TextRootDTMVectorizer", "HashingRootVectorizer"):
+        from . import text_to_root_dtm
+
+        return getattr(text_to_root_dtm, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,9 +1,82 @@
-import pickle
+import operator
 import string
+import threading
+from functools import lru_cache
 from pathlib import Path
+from typing import Tuple
+
+from ._patterns import PATTERNS_BIN_PATH, PatternAutomaton, PatternTable
 
 ASCII_PICKLE_PATH = str(Path(__file__).parent.parent / "data/ascii_to_str_dict.pickle")
 
+TURKISH_ASCIIFY_TABLE = {
+    "ç": "c",
+    "Ç": "C",
+    "ğ": "g",
+    "Ğ": "G",
+    "ö": "o",
+    "Ö": "O",
+    "ü": "u",
+    "Ü": "U",
+    "ı": "i",
+    "İ": "I",
+    "ş": "s",
+    "Ş": "S",
+}
+
+TURKISH_DOWNCASE_ASCIIFY_TABLE = {
+    **{ch: ch.lower() for ch in string.ascii_uppercase},
+    **{ch.lower(): ch.lower() for ch in string.ascii_uppercase},
+    **{
+        turkish_char: ascii_char.lower()
+        for turkish_char, ascii_char in TURKISH_ASCIIFY_TABLE.items()
+    },
+}
+
+TURKISH_UPCASE_ACCENTS_TABLE = {
+    **{ch: ch.lower() for ch in string.ascii_uppercase},
+    **{ch.lower(): ch.lower() for ch in string.ascii_uppercase},
+    **{
+        turkish_char: ascii_char.upper()
+        for turkish_char, ascii_char in TURKISH_ASCIIFY_TABLE.items()
+    },
+}
+
+TURKISH_TOGGLE_ACCENT_TABLE = {
+    **{
+        ascii_char: turkish_char
+        for turkish_char, ascii_char in TURKISH_ASCIIFY_TABLE.items()
+    },
+    **TURKISH_ASCIIFY_TABLE,
+}
+
+_pattern_table = None
+_pattern_table_lock = threading.Lock()
+
+
+def get_pattern_table() -> PatternTable:
+    """
+    Returns the deasciifier pattern table shared by every deasciifier in the process.
+
+    The table is memory-mapped from ``data/deasciifier_patterns.bin`` on first use only,
+    see ``PatternTable``. Concurrent first calls from several threads wait for a single
+    load. ``data/ascii_to_str_dict.pickle`` is the source the binary file is converted
+    from.
+
+    Returns
+    -------
+    PatternTable
+          A mapping of each ASCII letter to the automaton of its patterns and their
+          ranks.
+    """
+    global _pattern_table
+    if _pattern_table is None:
+        with _pattern_table_lock:
+            if _pattern_table is None:
+                _pattern_table = PatternTable.load(PATTERNS_BIN_PATH)
+    return _pattern_table
+
+
 class DeasciifierBuiltin:
     """
     This system is based on the turkish-mode by Dr. Deniz Yüret
@@ -43,7 +116,9 @@ class DeasciifierBuiltin:
     turkish_toggle_accent(char, position)
           Toggles the accent of the character.
     """
+
     context_size = 10
+
     def __init__(self, ascii_string):
         """
         This function initializes the DeasciifierBuiltin class.
@@ -56,58 +131,12 @@ class DeasciifierBuiltin:
               - turkish_downcase_accents_table: a dictionary containing the mapping of Turkish characters to their lowercase equivalents.
               - turkish_upcase_accents_table: a dictionary containing the mapping of Turkish characters to their uppercase equivalents.
         """
-        with open(ASCII_PICKLE_PATH, "rb") as file:
-            turkish_pattern_table = pickle.load(file)
-        del file
-        self.turkish_pattern_table = turkish_pattern_table
+        self.turkish_pattern_table = get_pattern_table()
         self.ascii_string = ascii_string
         self.converted_string = ascii_string
-        self.turkish_asciify_table = {
-            "ç": "c",
-            "Ç": "C",
-            "ğ": "g",
-            "Ğ": "G",
-            "ö": "o",
-            "Ö": "O",
-            "ü": "u",
-            "Ü": "U",
-            "ı": "i",
-            "İ": "I",
-            "ş": "s",
-            "Ş": "S",
-        }
-        self.turkish_downcase_asciify_table = {
-            **{ch: ch.lower() for ch in string.ascii_uppercase},
-            **{ch.lower(): ch.lower() for ch in string.ascii_uppercase},
-            "ç": "c",
-            "Ç": "c",
-            "ğ": "g",
-            "Ğ": "g",
-            "ö": "o",
-            "Ö": "o",
-            "ü": "u",
-            "Ü": "u",
-            "ı": "i",
-            "İ": "i",
-            "ş": "s",
-            "Ş": "s",
-        }
-        self.turkish_upcase_accents_table = {
-            **{ch: ch.lower() for ch in string.ascii_uppercase},
-            **{ch.lower(): ch.lower() for ch in string.ascii_uppercase},
-            "ç": "C",
-            "Ç": "C",
-            "ğ": "G",
-            "Ğ": "G",
-            "ö": "O",
-            "Ö": "O",
-            "ü": "U",
-            "Ü": "U",
-            "ı": "I",
-            "İ": "I",
-            "ş": "S",
-            "Ş": "S",
-        }
+        self.turkish_asciify_table = TURKISH_ASCIIFY_TABLE
+        self.turkish_downcase_asciify_table = TURKISH_DOWNCASE_ASCIIFY_TABLE
+        self.turkish_upcase_accents_table = TURKISH_UPCASE_ACCENTS_TABLE
 
     def set_char_at(self, str, position, char):
         """
@@ -149,9 +178,13 @@ class DeasciifierBuiltin:
         for index in range(len(self.converted_string)):
             char = self.converted_string[index]
             if self.turkish_need_correction(char, point=index):
-                self.converted_string = self.set_char_at(self.converted_string, index, self.turkish_toggle_accent(char))
+                self.converted_string = self.set_char_at(
+                    self.converted_string, index, self.turkish_toggle_accent(char)
+                )
             else:
-                self.converted_string = self.set_char_at(self.converted_string, index, char)
+                self.converted_string = self.set_char_at(
+                    self.converted_string, index, char
+                )
 
         return self.converted_string
 
@@ -175,33 +208,7 @@ class DeasciifierBuiltin:
         >>> toggle_accent
         'ı'
         """
-        turkish_toggle_accent_table = {
-            "c": "ç",
-            "C": "Ç",
-            "g": "ğ",
-            "G": "Ğ",
-            "o": "ö",
-            "O": "Ö",
-            "u": "ü",
-            "U": "Ü",
-            "i": "ı",
-            "I": "İ",
-            "s": "ş",
-            "S": "Ş",
-            "ç": "c",
-            "Ç": "C",
-            "ğ": "g",
-            "Ğ": "G",
-            "ö": "o",
-            "Ö": "O",
-            "ü": "u",
-            "Ü": "U",
-            "ı": "i",
-            "İ": "I",
-            "ş": "s",
-            "Ş": "S",
-        }
-        return turkish_toggle_accent_table.get(c, c)
+        return TURKISH_TOGGLE_ACCENT_TABLE.get(c, c)
 
     def turkish_need_correction(self, char, point=0):
         """
@@ -252,8 +259,9 @@ class DeasciifierBuiltin:
 
         Parameters
         ----------
-        pattern_list : dict
-              A dictionary of patterns and their corresponding ranks.
+        pattern_list : dict or PatternAutomaton
+              A dictionary of patterns and their corresponding ranks. Compiled automata
+              are matched in a single pass over the context.
         point : int, optional
               The point in the text to check for the pattern, by default 0.
 
@@ -269,8 +277,11 @@ class DeasciifierBuiltin:
         >>> deasciifier.turkish_match_pattern(pattern_list, point = 2)
         True
         """
-        rank = 2 * len(dlist)
         str = self.turkish_get_context(DeasciifierBuiltin.context_size, point=point)
+        if isinstance(dlist, PatternAutomaton):
+            return dlist.match(str)
+
+        rank = 2 * len(dlist)
         start = 0
         end = 0
 
@@ -356,6 +367,51 @@ class DeasciifierBuiltin:
         return s
 
 
+NUMBER_ONES = (
+    "sıfır",
+    "bir",
+    "iki",
+    "üç",
+    "dört",
+    "beş",
+    "altı",
+    "yedi",
+    "sekiz",
+    "dokuz",
+)
+NUMBER_TENS = (
+    "on",
+    "yirmi",
+    "otuz",
+    "kırk",
+    "elli",
+    "altmış",
+    "yetmiş",
+    "seksen",
+    "doksan",
+)
+NUMBER_SCALES = ("", "bin", "milyon", "milyar", "trilyon", "katrilyon", "kentilyon")
+# Numbers are converted to words up to, but excluding, 10**21.
+NUMBER_WORD_LIMIT = 1000 ** len(NUMBER_SCALES)
+
+
+@lru_cache(maxsize=None)
+def _group_words() -> Tuple[Tuple[str, ...], ...]:
+    """
+    Returns, for every scale, the words of the groups of three digits 0 to 999 followed
+    by the scale, an empty string for 0. The table is built once per process, on first
+    use.
+    """
+    groups = [
+        NormBuiltin.convert_group(number, NUMBER_ONES, NUMBER_TENS)
+        for number in range(1000)
+    ]
+    return tuple(
+        tuple(f"{group} {scale}" if scale and group else group for group in groups)
+        for scale in NUMBER_SCALES
+    )
+
+
 class NormBuiltin:
     """
     These functions in NormBuiltin are specific to the normalizer module and are used to convert numbers to words in Turkish language.
@@ -410,42 +466,57 @@ class NormBuiltin:
         This function converts a given number to words in Turkish language.
         The number is first checked if it is negative, if so, it is converted
         to positive and 'eksi' is added to the beginning. The number is then
-        divided into groups of 1000, and the groups are converted to words
-        using the provided lists of ones and tens. The final word is returned.
+        divided into groups of 1000, whose words, followed by their scale, are
+        looked up in a table of the groups 0 to 999 built once. The final word
+        is returned, starting with a space unless it is negative or zero.
 
         Parameters
         ----------
         number : int
-            The number to be converted to words
+            The number to be converted to words, an integer or a string of an
+            integer, whose absolute value is less than 10**21.
 
         Returns
         -------
         word : str
             The number in words in Turkish language
-        """
-        negative_expression = None
-        if int(number) < 0:
-            number = str(number).split("-")[1]
-            negative_expression = "eksi "
-            number = int(number)
-
-        ones = ["sıfır", "bir", "iki", "üç", "dört", "beş", "altı", "yedi", "sekiz", "dokuz"]
-        tens = ["on", "yirmi", "otuz", "kırk", "elli", "altmış", "yetmiş", "seksen", "doksan"]
-        scales = ["", "bin", "milyon", "milyar", "trilyon", "katrilyon"]
-        word = ""
 
-        if number == 0:
-            return ones[0]
+        Raises
+        ------
+        ValueError
+            If the number is a string that is not an integer, or if its absolute
+            value is 10**21 or more.
+        TypeError
+            If the number is neither an integer nor a string, such as a float.
 
-        group = 0
-        while number > 0:
+        Example
+        -------
+        >>> NormBuiltin.number_to_word(1250)
+        ' bir bin iki yüz elli'
+        >>> NormBuiltin.number_to_word(-1000005)
+        'eksi bir milyon beş'
+        """
+        number = int(number) if isinstance(number, str) else operator.index(number)
+        prefix = " "
+        if number < 0:
+            number = -number
+            prefix = "eksi "
+        if number >= NUMBER_WORD_LIMIT:
+            raise ValueError(
+                "The number is too big to convert it to words in Turkish language."
+            )
+        if number == 0:
+            return NUMBER_ONES[0]
+
+        groups = _group_words()
+        if number < 1000:
+            return prefix + groups[0][number]
+        words = []
+        scale = 0
+        while number:
             number, remainder = divmod(number, 1000)
-            if remainder > 0:
-                group_description = NormBuiltin.convert_group(remainder, ones, tens)
-                if group > 0:
-                    group_description += " " + scales[group]
-                ne = " " if negative_expression is None else f"{negative_expression}"
-                word = ne + group_description + word
-            group += 1
-
-        return word
+            if remainder:
+                words.append(groups[scale][remainder])
+            scale += 1
+        words.reverse()
+        return prefix + " ".join(words)
@@ -0,0 +1,319 @@
+import re
+import threading
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Optional
+
+from ._builtin import (
+    TURKISH_ASCIIFY_TABLE,
+    TURKISH_DOWNCASE_ASCIIFY_TABLE,
+    TURKISH_TOGGLE_ACCENT_TABLE,
+    TURKISH_UPCASE_ACCENTS_TABLE,
+    get_pattern_table,
+)
+from ._patterns import PatternAutomaton
+
+# Only these letters have patterns, every other character is copied unchanged.
+_CANDIDATE = re.compile(r"[cCgGiIoOsSuUçÇğĞıİöÖşŞüÜ]")
+
+# Letters contribute to the context window, a run of any other characters acts as a
+# single space.
+_NON_LETTERS = re.compile(r"[^A-Za-zçÇğĞıİöÖşŞüÜ]+")
+_WORDS = re.compile(r"[A-Za-zçÇğĞıİöÖşŞüÜ]+")
+
+# Context to the right of a character is read from the not yet converted text.
+_RIGHT_CONTEXT_TABLE = str.maketrans(TURKISH_DOWNCASE_ASCIIFY_TABLE)
+
+# Context to the left of a character is read from the already converted text.
+_LEFT_CONTEXT_TABLE = str.maketrans(TURKISH_UPCASE_ACCENTS_TABLE)
+
+
+class Deasciifier:
+    """
+    Linear-time implementation of the turkish-mode deasciifier by Dr. Deniz Yüret.
+
+    It produces exactly the same output as ``DeasciifierBuiltin`` but only visits the
+    characters that can change (c, g, i, o, s, u and their Turkish forms). Their context
+    windows are sliced from a copy of the text in which every run of non-letters is
+    collapsed to a single space, the way the context window sees them, and which is
+    updated in place as characters are converted. A text without any candidate character
+    is returned as is.
+
+    With a word cache, the conversion of a word is memoized. The right context of a
+    letter never reaches past the end of its word, so a word converts the same way
+    whenever it is preceded by the same converted characters, and only the part of that
+    left context which the first candidate of the word can see is part of the cache key.
+
+    Parameters
+    ----------
+    pattern_table : PatternTable or dict, optional
+          The pattern table mapping each ASCII letter to its patterns and their ranks.
+          Pattern dictionaries are compiled into automata on first use. If not provided,
+          the memory-mapped table shared by the whole process is used, see
+          ``get_pattern_table``.
+    cache_size : int, optional
+          The maximum number of words kept in the word cache, the least recently used
+          words being evicted first. ``None`` or 0 disables the cache.
+
+    Notes
+    -----
+    The instance keeps no per-text state apart from its counters and word cache, so a
+    single deasciifier can be reused for any number of texts and shared between threads.
+
+    Examples
+    --------
+    >>> deasciifier = Deasciifier()
+    >>> deasciifier.convert("Hersey bahcivanin islik calmasiyla yasandi")
+    'Herşey bahçıvanın ıslık çalmasıyla yaşandı'
+    >>> deasciifier.stats()
+    {'texts': 1, 'characters': 42, 'evaluated': 12}
+    """
+
+    context_size = 10
+
+    def __init__(self, pattern_table=None, cache_size: Optional[int] = None):
+        self._pattern_table = pattern_table
+        self._automata = None
+        self._stats = Counter(texts=0, characters=0, evaluated=0)
+        self._stats_lock = threading.Lock()
+        self.set_cache_size(cache_size)
+
+    @property
+    def cache_size(self) -> Optional[int]:
+        """
+        The maximum number of words in the word cache, ``None`` if the cache is
+        disabled.
+        """
+        return (
+            None if self._word_cache is None else self._word_cache.cache_info().maxsize
+        )
+
+    def set_cache_size(self, cache_size: Optional[int]) -> None:
+        """
+        Enables, resizes or disables the word cache. Cached words are dropped.
+
+        Parameters
+        ----------
+        cache_size : int, optional
+              The maximum number of cached words. ``None`` or 0 disables the cache.
+
+        Raises
+        ------
+        ValueError
+              If cache_size is negative.
+        """
+        if cache_size is not None and cache_size < 0:
+            raise ValueError("cache_size must not be negative.")
+        self._word_cache = (
+            lru_cache(maxsize=cache_size)(self._convert_word) if cache_size else None
+        )
+
+    @property
+    def pattern_table(self):
+        """
+        The pattern table, resolved on first use so that creating a deasciifier is
+        free.
+        """
+        if self._pattern_table is None:
+            self._pattern_table = get_pattern_table()
+        return self._pattern_table
+
+    @property
+    def automata(self):
+        """
+        The pattern automaton of every letter that has patterns, compiled on first use
+        if needed.
+        """
+        if self._automata is None:
+            self._automata = {
+                letter: patterns
+                if isinstance(patterns, PatternAutomaton)
+                else PatternAutomaton.from_patterns(patterns)
+                for letter, patterns in self.pattern_table.items()
+            }
+        return self._automata
+
+    def convert(self, text: str) -> str:
+        """
+        Converts an ASCII-only string to a Turkish string.
+
+        Parameters
+        ----------
+        text : str
+              The ASCII-only string to be converted.
+
+        Returns
+        -------
+        str
+              The converted Turkish string.
+        """
+        if _CANDIDATE.search(text) is None:
+            self._record(len(text), 0)
+            return text
+        if self._word_cache is not None:
+            return self._convert_cached(text)
+
+        size = self.context_size
+        automata = self.automata
+        collapsed = _NON_LETTERS.sub(" ", text)
+        right = collapsed.translate(_RIGHT_CONTEXT_TABLE)
+        left = list(collapsed.translate(_LEFT_CONTEXT_TABLE))
+        chars = None
+        evaluated = 0
+
+        # Candidates are letters, so they appear in the same order in the text and its
+        # collapsed copy.
+        for source, target in zip(
+            _CANDIDATE.finditer(text), _CANDIDATE.finditer(collapsed)
+        ):
+            char = source.group()
+            index = target.start()
+            evaluated += 1
+
+            if index >= size:
+                context = "".join(left[index - size : index])
+            else:
+                context = " " * (size - index) + "".join(left[:index])
+            window = right[index + 1 : index + 1 + size]
+            boundary = window.find(" ")
+            if boundary >= 0:
+                window = window[: boundary + 1]
+
+            ascii_char = TURKISH_ASCIIFY_TABLE.get(char, char)
+            match = automata[ascii_char.lower()].match(context + "X" + window)
+            if ascii_char == "I":
+                need_correction = match != (char == ascii_char)
+            else:
+                need_correction = match == (char == ascii_char)
+
+            if need_correction:
+                char = TURKISH_TOGGLE_ACCENT_TABLE[char]
+                left[index] = TURKISH_UPCASE_ACCENTS_TABLE[char]
+                if chars is None:
+                    chars = list(text)
+                chars[source.start()] = char
+
+        self._record(len(text), evaluated)
+        return text if chars is None else "".join(chars)
+
+    def _convert_cached(self, text: str) -> str:
+        size = self.context_size
+        collapsed = _NON_LETTERS.sub(" ", text)
+        left = list(collapsed.translate(_LEFT_CONTEXT_TABLE))
+        chars = None
+
+        # Words are runs of letters, so they appear in the same order in the text and
+        # its collapsed copy.
+        for source, target in zip(_WORDS.finditer(text), _WORDS.finditer(collapsed)):
+            word = source.group()
+            candidate = _CANDIDATE.search(word)
+            if candidate is None:
+                continue
+
+            start, end = target.span()
+            seen = size - candidate.start()
+            if seen <= 0:
+                before = ""
+            elif start >= seen:
+                before = "".join(left[start - seen : start])
+            else:
+                before = " " * (seen - start) + "".join(left[:start])
+
+            converted = self._word_cache(before, word, end == len(collapsed))
+            if converted != word:
+                left[start:end] = converted.translate(_LEFT_CONTEXT_TABLE)
+                if chars is None:
+                    chars = list(text)
+                chars[source.start() : source.end()] = converted
+
+        self._record(len(text), 0)
+        return text if chars is None else "".join(chars)
+
+    def _convert_word(self, before: str, word: str, at_end: bool) -> str:
+        """
+        Converts a word given the converted characters its first candidate sees to its
+        left.
+        """
+        size = self.context_size
+        automata = self.automata
+        offset = len(before) - size
+        left = list(before + word.translate(_LEFT_CONTEXT_TABLE))
+        right = word.translate(_RIGHT_CONTEXT_TABLE) + ("" if at_end else " ")
+        chars = list(word)
+        evaluated = 0
+
+        for candidate in _CANDIDATE.finditer(word):
+            char = candidate.group()
+            index = candidate.start()
+            evaluated += 1
+
+            context = "".join(left[index + offset : index + offset + size])
+            window = right[index + 1 : index + 1 + size]
+            boundary = window.find(" ")
+            if boundary >= 0:
+                window = window[: boundary + 1]
+
+            ascii_char = TURKISH_ASCIIFY_TABLE.get(char, char)
+            match = automata[ascii_char.lower()].match(context + "X" + window)
+            if ascii_char == "I":
+                need_correction = match != (char == ascii_char)
+            else:
+                need_correction = match == (char == ascii_char)
+
+            if need_correction:
+                char = TURKISH_TOGGLE_ACCENT_TABLE[char]
+                left[index + offset + size] = TURKISH_UPCASE_ACCENTS_TABLE[char]
+                chars[index] = char
+
+        with self._stats_lock:
+            self._stats["evaluated"] += evaluated
+        return "".join(chars)
+
+    def cache_info(self) -> Optional[Dict[str, int]]:
+        """
+        Returns the counters of the word cache.
+
+        Returns
+        -------
+        dict or None
+              The number of cache ``hits`` and ``misses``, its ``maxsize`` and the
+              number of words it currently holds as ``currsize``. ``None`` if the cache
+              is disabled.
+        """
+        if self._word_cache is None:
+            return None
+        return self._word_cache.cache_info()._asdict()
+
+    def cache_clear(self) -> None:
+        """
+        Drops every cached word and resets the cache counters.
+        """
+        if self._word_cache is not None:
+            self._word_cache.cache_clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the counters of the texts converted so far by this deasciifier.
+
+        Returns
+        -------
+        dict
+              ``texts`` converted, ``characters`` scanned and candidate positions
+              ``evaluated`` against the patterns.
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        """
+        Resets the counters returned by ``stats``.
+        """
+        with self._stats_lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def _record(self, characters: int, evaluated: int) -> None:
+        with self._stats_lock:
+            self._stats["texts"] += 1
+            self._stats["characters"] += characters
+            self._stats["evaluated"] += evaluated
@@ -0,0 +1,91 @@
+from functools import lru_cache, partial
+from typing import Callable, Dict, Optional, Tuple
+
+# Character mappings larger than this are applied with str.translate instead of
+# str.replace.
+MAX_REPLACEMENTS = 1024
+
+
+def translation_table(mapping: Dict[str, str]) -> Optional[Dict[int, str]]:
+    """
+    Returns a ``str.translate`` table equivalent to replacing every key of the mapping
+    by its value one after the other, or ``None`` if some key is not a single character.
+    """
+    table = {}
+    for key, value in mapping.items():
+        if not isinstance(key, str) or len(key) != 1:
+            return None
+        table = compose_tables(table, {ord(key): value})
+    return table
+
+
+def compose_tables(first: Dict, second: Dict) -> Dict[int, Optional[str]]:
+    """
+    Returns a ``str.translate`` table equivalent to translating with the first table,
+    then with the second one.
+    """
+    table = {}
+    for key, value in first.items():
+        # str.translate ignores keys that are not ordinals.
+        if not isinstance(key, int):
+            continue
+        if value is not None:
+            value = (chr(value) if isinstance(value, int) else value).translate(second)
+        if value != chr(key):
+            table[key] = value
+    for key, value in second.items():
+        if isinstance(key, int) and key not in first:
+            table[key] = chr(value) if isinstance(value, int) else value
+    return table
+
+
+def _translate(table, text: str) -> str:
+    return text.translate(table)
+
+
+def _replace(replacements: Tuple[Tuple[str, str], ...], text: str) -> str:
+    for old, new in replacements:
+        text = text.replace(old, new)
+    return text
+
+
+def mapping_function(table) -> Callable[[str], str]:
+    """
+    Returns the fastest function applying a ``str.translate`` table.
+
+    ``str.translate`` looks every character up in the table unless both the text and the
+    table are ASCII, which makes it much slower on Turkish text than a ``str.replace``
+    per entry. The replacements give the same result as long as no replacement contains
+    a character that is replaced itself.
+    """
+    if not isinstance(table, dict) or len(table) > MAX_REPLACEMENTS:
+        return partial(_translate, table)
+    replacements = []
+    for key, value in table.items():
+        if not isinstance(key, int):
+            continue
+        if isinstance(value, int):
+            value = chr(value)
+        replacements.append((chr(key), value or ""))
+    keys = {old for old, _ in replacements}
+    if any(char in keys for _, new in replacements for char in new):
+        return partial(_translate, table)
+    return partial(_replace, tuple(replacements))
+
+
+@lru_cache(maxsize=128)
+def compile_replacements(
+    replacements: Tuple[Tuple[str, str], ...]
+) -> Callable[[str], str]:
+    """
+    Returns a function replacing every old string by its new string one after the other.
+
+    Replacements of single characters are composed into a single mapping, see
+    ``mapping_function``. The functions are cached by the contents of the replacements.
+    """
+    table = None
+    if all(isinstance(new, str) for _, new in replacements):
+        table = translation_table(dict(replacements))
+    if table is not None:
+        return mapping_function(table)
+    return partial(_replace, replacements)
@@ -0,0 +1,497 @@
+import mmap
+import pickle
+import struct
+import sys
+from array import array
+from collections import deque
+from collections.abc import Mapping
+from pathlib import Path
+
+PATTERNS_BIN_PATH = str(Path(__file__).parent.parent / "data/deasciifier_patterns.bin")
+
+_MAGIC = b"MLDEASC\x00"
+_VERSION = 3
+# magic, version, number of letters
+_HEADER = struct.Struct("<8sII")
+# letter, transition and rank typecodes, states, patterns, alphabet size in bytes,
+# block offset
+_ENTRY = struct.Struct("<4s4sIIIQ")
+_ALIGNMENT = 8
+
+
+class PatternAutomaton(Mapping):
+    """
+    Deterministic Aho-Corasick automaton compiled from the patterns of a single letter.
+
+    ``DeasciifierBuiltin.turkish_match_pattern`` looks up every substring of the context
+    window that covers its centre and keeps the pattern with the lowest absolute rank.
+    The automaton finds the same pattern in a single pass over the context, following
+    one transition per character without allocating substrings.
+
+    Every state stores the lowest absolute ranked pattern among all patterns ending in
+    it, so the scan only has to compare one candidate per character. Ties are broken
+    exactly like the reference implementation, in favour of the pattern that starts
+    first.
+
+    The automaton is also a read-only mapping of patterns to ranks, so it can stand in
+    for the per-letter dictionaries of the original pickled pattern table. Its arrays
+    are either built in memory or views into a memory-mapped pattern file, see
+    ``PatternTable``, and are used as they are: nothing is compiled when a file is
+    loaded.
+
+    Parameters
+    ----------
+    alphabet : str
+          Every character used in the patterns. The character at index ``i`` uses
+          transition column ``i + 1``, column 0 is reserved for characters that do not
+          appear in any pattern.
+    transitions : array or memoryview
+          The ``states * (len(alphabet) + 1)`` transition table, flattened row by row.
+    best_ranks : array or memoryview
+          The rank of the lowest absolute ranked pattern ending in each state, 0 if none
+          does.
+    best_lengths : array or memoryview
+          The length of the pattern stored in ``best_ranks`` for each state.
+    ranks : array or memoryview
+          The rank of the pattern spelled by each state, 0 if the state is not a
+          pattern.
+    depths : array or memoryview
+          The length of the string spelled by each state.
+    pattern_count : int
+          The number of patterns the automaton was compiled from.
+    """
+
+    def __init__(
+        self,
+        alphabet,
+        transitions,
+        best_ranks,
+        best_lengths,
+        ranks,
+        depths,
+        pattern_count,
+    ):
+        self.alphabet = alphabet
+        self.symbols = {char: column for column, char in enumerate(alphabet, 1)}
+        self.width = len(alphabet) + 1
+        self.transitions = transitions
+        self.best_ranks = best_ranks
+        self.best_lengths = best_lengths
+        self.ranks = ranks
+        self.depths = depths
+        self.pattern_count = pattern_count
+        self.limit = 2 * pattern_count
+
+    @classmethod
+    def from_patterns(cls, patterns: dict) -> "PatternAutomaton":
+        """
+        Compiles the automaton from a dictionary of patterns and their ranks.
+
+        The context window contains the ``X`` placeholder only at its centre, so
+        patterns that do not contain exactly one ``X`` can never match. They are kept
+        for lookups but are never selected by ``match``.
+
+        Parameters
+        ----------
+        patterns : dict
+              A dictionary of patterns and their corresponding non-zero ranks.
+
+        Returns
+        -------
+        PatternAutomaton
+              The compiled automaton.
+
+        Raises
+        ------
+        ValueError
+              If a pattern has a zero rank or is longer than 255 characters.
+
+        Example
+        -------
+        >>> automaton = PatternAutomaton.from_patterns({"rX": -1, "Xda": 2})
+        >>> automaton.match("     o sIrXda ")
+        False
+        >>> automaton["Xda"]
+        2
+        """
+        alphabet = "".join(sorted({char for pattern in patterns for char in pattern}))
+        symbols = {char: column for column, char in enumerate(alphabet, 1)}
+        width = len(alphabet) + 1
+
+        children = [{}]
+        ranks = [0]
+        matchable = [False]
+        for pattern, rank in patterns.items():
+            if not rank or len(pattern) > 255:
+                raise ValueError(
+                    f"Pattern {pattern!r} must have a non-zero rank and at most 255 "
+                    "characters."
+                )
+            state = 0
+            for char in pattern:
+                child = children[state].get(char)
+                if child is None:
+                    child = len(children)
+                    children[state][char] = child
+                    children.append({})
+                    ranks.append(0)
+                    matchable.append(False)
+                state = child
+            ranks[state] = rank
+            matchable[state] = pattern.count("X") == 1
+
+        size = len(children)
+        rank_typecode = "h" if all(-0x8000 <= rank <= 0x7FFF for rank in ranks) else "i"
+        transitions = array("H" if size <= 0xFFFF else "I", [0]) * (size * width)
+        failures = [0] * size
+        depths = array("B", [0]) * size
+        best_ranks = array(rank_typecode, [0]) * size
+        best_lengths = array("B", [0]) * size
+
+        queue = deque([0])
+        while queue:
+            state = queue.popleft()
+            base = state * width
+            if state:
+                failure = failures[state] * width
+                transitions[base : base + width] = transitions[
+                    failure : failure + width
+                ]
+            for char, child in children[state].items():
+                column = symbols[char]
+                failures[child] = transitions[base + column] if state else 0
+                transitions[base + column] = child
+                depths[child] = depths[state] + 1
+
+                rank = ranks[child] if matchable[child] else 0
+                inherited = best_ranks[failures[child]]
+                if rank and (not inherited or abs(rank) <= abs(inherited)):
+                    best_ranks[child] = rank
+                    best_lengths[child] = depths[child]
+                else:
+                    best_ranks[child] = inherited
+                    best_lengths[child] = best_lengths[failures[child]]
+                queue.append(child)
+
+        return cls(
+            alphabet,
+            transitions,
+            best_ranks,
+            best_lengths,
+            array(rank_typecode, ranks),
+            depths,
+            len(patterns),
+        )
+
+    def match(self, context: str) -> bool:
+        """
+        Returns True if the lowest ranked pattern found in the context has a positive
+        rank.
+
+        Parameters
+        ----------
+        context : str
+              The context window with the character being checked replaced by ``X``.
+
+        Returns
+        -------
+        bool
+              The same decision as ``DeasciifierBuiltin.turkish_match_pattern``.
+        """
+        symbols = self.symbols
+        width = self.width
+        transitions = self.transitions
+        best_ranks = self.best_ranks
+        best_lengths = self.best_lengths
+
+        state = 0
+        rank = self.limit
+        start = 0
+        for end, char in enumerate(context, 1):
+            state = transitions[state * width + symbols.get(char, 0)]
+            r = best_ranks[state]
+            if r:
+                r_start = end - best_lengths[state]
+                if abs(r) < abs(rank) or (abs(r) == abs(rank) and r_start < start):
+                    rank = r
+                    start = r_start
+        return rank > 0
+
+    def __getitem__(self, pattern):
+        symbols = self.symbols
+        width = self.width
+        transitions = self.transitions
+        state = 0
+        for char in pattern:
+            column = symbols.get(char)
+            if column is None:
+                raise KeyError(pattern)
+            state = transitions[state * width + column]
+        # A walk that left the trie ends in a state spelling a shorter suffix of the
+        # pattern.
+        if self.depths[state] != len(pattern) or not self.ranks[state]:
+            raise KeyError(pattern)
+        return self.ranks[state]
+
+    def __iter__(self):
+        width = self.width
+        transitions = self.transitions
+        depths = self.depths
+        stack = [(0, "")]
+        while stack:
+            state, prefix = stack.pop()
+            if self.ranks[state]:
+                yield prefix
+            base = state * width
+            for column, char in enumerate(self.alphabet, 1):
+                child = transitions[base + column]
+                if depths[child] == depths[state] + 1:
+                    stack.append((child, prefix + char))
+
+    def __len__(self):
+        return self.pattern_count
+
+
+class PatternTable(Mapping):
+    """
+    Read-only mapping of each ASCII letter to the ``PatternAutomaton`` of its patterns.
+
+    A table is either compiled in memory from the original pickled pattern dictionaries
+    with ``from_dict`` or loaded from the binary pattern file with ``load``. A loaded
+    table does not copy or compile anything: the arrays of the automata are views into
+    the memory-mapped file, so loading is nearly free and every process deasciifying on
+    the host shares the same read-only pages.
+
+    File layout (little-endian, every block aligned to 8 bytes)::
+
+        header     magic, version, number of letters
+        directory  one entry per letter: letter, transition and rank typecodes,
+                   number of states, number of patterns, alphabet size,
+                   offset of the letter block
+        blocks     alphabet (UTF-8), transitions (states * (alphabet size + 1)),
+                   best_ranks, best_lengths (uint8), ranks, depths (uint8)
+
+    Parameters
+    ----------
+    automata : dict
+          A dictionary mapping each letter to its ``PatternAutomaton``.
+    buffer : mmap.mmap, optional
+          The memory map backing the automata, kept open as long as the table is alive.
+
+    Examples
+    --------
+    >>> table = PatternTable.load(PATTERNS_BIN_PATH)
+    >>> table["c"].match("          Xok ")
+    True
+    """
+
+    def __init__(self, automata: dict, buffer=None):
+        self.automata = automata
+        self.buffer = buffer
+
+    @classmethod
+    def from_dict(cls, table: dict) -> "PatternTable":
+        """
+        Compiles a pattern table from a dictionary of letters to their pattern
+        dictionaries.
+        """
+        return cls(
+            {
+                letter: PatternAutomaton.from_patterns(patterns)
+                for letter, patterns in table.items()
+            }
+        )
+
+    @classmethod
+    def from_pickle(cls, path: str) -> "PatternTable":
+        """
+        Compiles a pattern table from a pickled dictionary such as
+        ``data/ascii_to_str_dict.pickle``.
+        """
+        with open(path, "rb") as file:
+            return cls.from_dict(pickle.load(file))
+
+    @classmethod
+    def load(cls, path: str = PATTERNS_BIN_PATH) -> "PatternTable":
+        """
+        Memory-maps a binary pattern file written by ``save``.
+
+        Parameters
+        ----------
+        path : str, optional
+              The path of the binary pattern file, by default the one shipped with the
+              package.
+
+        Returns
+        -------
+        PatternTable
+              The pattern table backed by the read-only memory map.
+
+        Raises
+        ------
+        ValueError
+              If the file is not a pattern file of a supported version.
+        """
+        with open(path, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, letters = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            buffer.close()
+            raise ValueError(
+                f"{path} is not a version {_VERSION} deasciifier pattern file."
+            )
+
+        view = memoryview(buffer)
+        automata = {}
+        for index in range(letters):
+            (
+                letter,
+                typecodes,
+                states,
+                patterns,
+                alphabet_size,
+                offset,
+            ) = _ENTRY.unpack_from(buffer, _HEADER.size + index * _ENTRY.size)
+            transition_typecode, rank_typecode = typecodes[:2].decode("ascii")
+            alphabet = bytes(view[offset : offset + alphabet_size]).decode("utf-8")
+            offset = _align(offset + alphabet_size)
+
+            sections = []
+            for section_typecode, length in (
+                (transition_typecode, states * (len(alphabet) + 1)),
+                (rank_typecode, states),
+                ("B", states),
+                (rank_typecode, states),
+                ("B", states),
+            ):
+                size = length * array(section_typecode).itemsize
+                sections.append(
+                    _section(view[offset : offset + size], section_typecode)
+                )
+                offset = _align(offset + size)
+
+            automata[letter.rstrip(b"\x00").decode("utf-8")] = PatternAutomaton(
+                alphabet, *sections, patterns
+            )
+        return cls(automata, buffer)
+
+    def save(self, path: str) -> None:
+        """
+        Writes the table to a binary pattern file that can be memory-mapped with
+        ``load``.
+        """
+        blocks = bytearray()
+        entries = []
+        start = _align(_HEADER.size + len(self.automata) * _ENTRY.size)
+        for letter, automaton in self.automata.items():
+            offset = start + len(blocks)
+            alphabet = automaton.alphabet.encode("utf-8")
+            typecodes = _typecode(automaton.transitions) + _typecode(automaton.ranks)
+            entries.append(
+                _ENTRY.pack(
+                    letter.encode("utf-8"),
+                    typecodes.encode("ascii"),
+                    len(automaton.depths),
+                    automaton.pattern_count,
+                    len(alphabet),
+                    offset,
+                )
+            )
+            blocks += alphabet
+            for section in (
+                automaton.transitions,
+                automaton.best_ranks,
+                automaton.best_lengths,
+                automaton.ranks,
+                automaton.depths,
+            ):
+                blocks += b"\x00" * (_align(start + len(blocks)) - start - len(blocks))
+                blocks += _little_endian(section)
+            blocks += b"\x00" * (_align(start + len(blocks)) - start - len(blocks))
+
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, len(entries)))
+            file.write(b"".join(entries))
+            file.write(b"\x00" * (start - _HEADER.size - len(entries) * _ENTRY.size))
+            file.write(blocks)
+
+    def __getitem__(self, letter):
+        return self.automata[letter]
+
+    def get(self, letter, default=None):
+        return self.automata.get(letter, default)
+
+    def __iter__(self):
+        return iter(self.automata)
+
+    def __len__(self):
+        return len(self.automata)
+
+
+def convert_pickle(source: str, destination: str = PATTERNS_BIN_PATH) -> None:
+    r"""
+    Converts a pickled pattern table into the binary pattern file format.
+
+    Parameters
+    ----------
+    source : str
+          The path of the pickled dictionary of letters to their pattern dictionaries.
+    destination : str, optional
+          The path of the binary pattern file to write, by default the one shipped with
+          the package.
+
+    Example
+    -------
+    >>> convert_pickle(
+    ...     "mintlemon/data/ascii_to_str_dict.pickle", "deasciifier_patterns.bin"
+    ... )
+
+    The same conversion is available from the command line::
+
+        python -m mintlemon.normalizer._patterns \
+            mintlemon/data/ascii_to_str_dict.pickle deasciifier_patterns.bin
+    """
+    PatternTable.from_pickle(source).save(destination)
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _section(view: memoryview, typecode: str):
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+    section = array(typecode)
+    section.frombytes(view)
+    section.byteswap()
+    return section
+
+
+def _typecode(section) -> str:
+    return section.format if isinstance(section, memoryview) else section.typecode
+
+
+def _little_endian(section) -> bytes:
+    if sys.byteorder == "little":
+        return bytes(section)
+    section = array(_typecode(section), section)
+    section.byteswap()
+    return section.tobytes()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Convert a pickled deasciifier pattern table to the binary format."
+    )
+    parser.add_argument("source", help="path of the pickled pattern table")
+    parser.add_argument(
+        "destination",
+        nargs="?",
+        default=PATTERNS_BIN_PATH,
+        help="path of the binary pattern file",
+    )
+    arguments = parser.parse_args()
+    convert_pickle(arguments.source, arguments.destination)
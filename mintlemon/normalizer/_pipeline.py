@@ -0,0 +1,214 @@
+from functools import partial
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+from ._mapping import compose_tables, mapping_function, translation_table
+from .normalizer import (
+    DEFAULT_ACCENT_MAPPING,
+    DEFAULT_TRANSLATION_TABLE,
+    NUMBER_REGEXES,
+    PUNCTUATION_REGEX,
+    SPACES_AND_COMMAS_REGEX,
+    SPACES_REGEX,
+    TURKISH_LOWERCASE_DICT,
+    Normalizer,
+    _stopword_filter,
+)
+
+Step = Union[str, Tuple[str, Dict], Callable[[str], str]]
+
+# Steps that are run as they are, they cannot be fused with their neighbours.
+_OPAQUE_STEPS = ("deasciify", "num_to_tr_text")
+
+
+def _touches(table: Dict, chars: str) -> bool:
+    """
+    Whether the table maps any whitespace or any of the given characters, or produces
+    one.
+    """
+    for key, value in table.items():
+        if not isinstance(key, int):
+            continue
+        if chr(key).isspace() or chr(key) in chars:
+            return True
+        if isinstance(value, int):
+            value = chr(value)
+        if value and any(char.isspace() or char in chars for char in value):
+            return True
+    return False
+
+
+def _squeeze(pattern, text: str) -> str:
+    return pattern.sub(" ", text).strip()
+
+
+class NormalizationPipeline:
+    """
+    A chain of ``Normalizer`` steps compiled into as few passes over the text as
+    possible.
+
+    Consecutive character mappings (``lower_case``, ``remove_accent_marks`` and
+    ``normalize_chars``) are composed into a single mapping, the whitespace clean-up of
+    ``remove_punctuations`` and ``remove_numbers`` is done once for all of the steps
+    that need it, and the stop words are loaded once. The result is always the same as
+    calling the steps one after the other.
+
+    Parameters
+    ----------
+    steps : Sequence
+          The steps in the order they are applied. A step is the name of a
+          ``Normalizer`` method, a ``(name, keyword arguments)`` tuple or any function
+          taking and returning a string.
+
+    Raises
+    ------
+    ValueError
+          If a step is not a known ``Normalizer`` method.
+
+    Examples
+    --------
+    >>> pipeline = NormalizationPipeline(
+    ...     [
+    ...         "lower_case",
+    ...         "remove_punctuations",
+    ...         ("remove_numbers", {"remove_decimal": False}),
+    ...     ]
+    ... )
+    >>> pipeline("Merhaba DÜNYA!!! 2 kedi,  3 köpek...")
+    'merhaba dünya kedi köpek...'
+    >>> pipeline.plan
+    ['map', 'lower', 'delete', 'delete', 'squeeze']
+    """
+
+    def __init__(self, steps: Sequence[Step]):
+        self.steps = list(steps)
+        stages = []
+        for step in self.steps:
+            stages.extend(self._compile_step(step))
+        self._stages = self._fuse(stages)
+        self._functions = [
+            self._function(kind, argument) for kind, argument in self._stages
+        ]
+
+    def __call__(self, text: str) -> str:
+        for function in self._functions:
+            text = function(text)
+        return text
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.steps!r})"
+
+    @property
+    def plan(self) -> List[str]:
+        """The kind of every pass made over the text, in order."""
+        return [kind for kind, _ in self._stages]
+
+    @staticmethod
+    def _compile_step(step: Step) -> List[Tuple[str, object]]:
+        if callable(step):
+            return [("call", step)]
+        name, kwargs = (step, {}) if isinstance(step, str) else step
+        kwargs = dict(kwargs)
+
+        if name == "lower_case":
+            return [("map", translation_table(TURKISH_LOWERCASE_DICT)), ("lower", None)]
+
+        if name == "remove_accent_marks":
+            mapping = kwargs.get("accent_mapping")
+            if mapping is None:
+                mapping = DEFAULT_ACCENT_MAPPING
+            table = translation_table(mapping)
+            if table is None:
+                return [
+                    (
+                        "call",
+                        partial(Normalizer.remove_accent_marks, accent_mapping=mapping),
+                    )
+                ]
+            return [("map", table)]
+
+        if name == "normalize_chars":
+            table = kwargs.get("translation_table")
+            if table is None:
+                table = DEFAULT_TRANSLATION_TABLE
+            return [("map", table)]
+
+        if name == "remove_punctuations":
+            return [("delete", PUNCTUATION_REGEX), ("squeeze", SPACES_REGEX)]
+
+        if name == "remove_numbers":
+            key = bool(kwargs.get("remove_signed", True)), bool(
+                kwargs.get("remove_decimal", True)
+            )
+            return [
+                ("delete", NUMBER_REGEXES[key]),
+                ("squeeze", SPACES_AND_COMMAS_REGEX),
+            ]
+
+        if name == "remove_stopwords":
+            return [("words", _stopword_filter(kwargs.get("stopwords")))]
+
+        if name in _OPAQUE_STEPS:
+            return [("call", partial(getattr(Normalizer, name), **kwargs))]
+
+        raise ValueError(f"Unknown normalization step: {name!r}")
+
+    @staticmethod
+    def _fuse(stages: List[Tuple[str, object]]) -> List[Tuple[str, object]]:
+        # A whitespace clean-up is redundant if another one at least as broad follows,
+        # as long as nothing in between depends on the whitespace. Splitting into stop
+        # words cleans up spaces.
+        kept = []
+        for index, (kind, argument) in enumerate(stages):
+            if kind == "squeeze" and _is_redundant_squeeze(
+                argument, stages[index + 1 :]
+            ):
+                continue
+            kept.append((kind, argument))
+
+        fused = []
+        for kind, argument in kept:
+            if fused:
+                previous_kind, previous_argument = fused[-1]
+                if (
+                    kind == previous_kind == "map"
+                    and isinstance(argument, dict)
+                    and isinstance(previous_argument, dict)
+                ):
+                    fused[-1] = ("map", compose_tables(previous_argument, argument))
+                    continue
+                # Lowercasing twice is the same as lowercasing once.
+                if kind == previous_kind == "lower":
+                    continue
+            fused.append((kind, argument))
+        return fused
+
+    @staticmethod
+    def _function(kind: str, argument) -> Callable[[str], str]:
+        if kind == "map":
+            return mapping_function(argument)
+        if kind == "lower":
+            return str.lower
+        if kind == "delete":
+            return partial(argument.sub, "")
+        if kind == "squeeze":
+            return partial(_squeeze, argument)
+        if kind == "words":
+            return argument.filter
+        return argument
+
+
+def _is_redundant_squeeze(pattern, following: List[Tuple[str, object]]) -> bool:
+    commas = pattern is SPACES_AND_COMMAS_REGEX
+    for kind, argument in following:
+        if kind == "squeeze":
+            return argument is SPACES_AND_COMMAS_REGEX or not commas
+        if kind == "words":
+            return not commas
+        # Deleting numbers or punctuation neither depends on nor removes whitespace and
+        # commas.
+        if kind in ("lower", "delete"):
+            continue
+        if kind == "map" and isinstance(argument, dict) and not _touches(argument, ","):
+            continue
+        return False
+    return False
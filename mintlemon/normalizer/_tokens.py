@@ -0,0 +1,283 @@
+import re
+from functools import partial
+from itertools import compress
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .normalizer import (
+    NUMBER_REGEXES,
+    PUNCTUATION_REGEX,
+    SPACES_AND_COMMAS_REGEX,
+    Normalizer,
+    _stopword_filter,
+)
+from .stopwords import _lower
+
+WHITESPACE_TOKEN_REGEX = re.compile(r"\S+")
+
+
+def _keeps_spaces(mapping: Dict) -> bool:
+    """
+    Whether replacing the characters of a mapping or translation table one by one
+    neither adds nor removes whitespace, nor deletes characters, which could leave a
+    token empty.
+    """
+    for key, value in mapping.items():
+        if isinstance(key, int):
+            key = chr(key)
+        if isinstance(value, int):
+            value = chr(value)
+        if (
+            not isinstance(key, str)
+            or not isinstance(value, str)
+            or len(key) != 1
+            or not value
+        ):
+            return False
+        if key.isspace() or any(char.isspace() for char in value):
+            return False
+    return True
+
+
+class TokenSequence:
+    """
+    The tokens of a text, normalized token by token and joined only at the end.
+
+    The tokens never contain whitespace, so most steps run once over the tokens joined
+    by spaces, as a single ``str`` operation, instead of going through the tokens one by
+    one. The joined tokens are only split again when a step needs the tokens themselves,
+    such as ``remove_stopwords``. Every token remembers the token of the text it comes
+    from, to give its offsets. Every step returns a new sequence, the original one is
+    left unchanged.
+
+    Use ``Normalizer.tokens`` to create a sequence.
+
+    Examples
+    --------
+    >>> from mintlemon import Normalizer
+    >>> tokens = Normalizer.tokens("Bu İSTANBUL'da 2 gün kaldık, çok güzeldi!")
+    >>> tokens.lower_case().remove_stopwords().remove_numbers().join()
+    "istanbul'da gün kaldık güzeldi!"
+    >>> tokens.spans[1]
+    (3, 14)
+    """
+
+    __slots__ = ("text", "pattern", "_words", "_joined", "_origins", "_spans")
+
+    def __init__(
+        self,
+        text: str,
+        pattern: "re.Pattern",
+        words: Optional[List[str]] = None,
+        origins: Optional[Sequence[int]] = None,
+        joined: Optional[str] = None,
+    ) -> None:
+        self.text = text
+        self.pattern = pattern
+        # The tokens and the tokens joined by spaces, either of them being computed from
+        # the other one when it is first needed.
+        self._words = words
+        self._joined = joined
+        # The index of the token of the text every token comes from, None while they are
+        # the same.
+        self._origins = origins
+        self._spans = None
+
+    @property
+    def words(self) -> List[str]:
+        """
+        The tokens.
+        """
+        if self._words is None:
+            self._words = self._joined.split(" ") if self._joined else []
+        return self._words
+
+    @property
+    def joined(self) -> str:
+        """
+        The tokens joined by spaces.
+        """
+        if self._joined is None:
+            self._joined = " ".join(self._words)
+        return self._joined
+
+    @classmethod
+    def from_text(
+        cls, text: str, pattern: "re.Pattern" = WHITESPACE_TOKEN_REGEX
+    ) -> "TokenSequence":
+        """
+        Tokenizes a text, every match of pattern being a token.
+        """
+        words = (
+            text.split() if pattern is WHITESPACE_TOKEN_REGEX else pattern.findall(text)
+        )
+        return cls(text, pattern, words)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __getitem__(self, index: int) -> str:
+        return self.words[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words)
+
+    def __repr__(self) -> str:
+        return f"TokenSequence({self.words!r})"
+
+    @property
+    def origins(self) -> Sequence[int]:
+        """
+        The index of the token of the text each token comes from.
+        """
+        return range(len(self)) if self._origins is None else self._origins
+
+    @property
+    def spans(self) -> List[Tuple[int, int]]:
+        """
+        The start and end offsets in the text of the token each token comes from.
+        """
+        if self._spans is None:
+            spans = [match.span() for match in self.pattern.finditer(self.text)]
+            self._spans = [spans[origin] for origin in self.origins]
+        return self._spans
+
+    def join(self, separator: str = " ") -> str:
+        """
+        Joins the tokens into a text.
+        """
+        if separator == " ":
+            return self.joined
+        return separator.join(self.words)
+
+    def _replace(
+        self, words: List[str], origins: Optional[Sequence[int]] = None
+    ) -> "TokenSequence":
+        return TokenSequence(
+            self.text,
+            self.pattern,
+            words,
+            self._origins if origins is None else origins,
+        )
+
+    def _map(self, function: Callable[[str], str]) -> "TokenSequence":
+        # function must keep the spaces of the joined tokens, add none and delete no
+        # token.
+        if not self.joined:
+            return self
+        return TokenSequence(
+            self.text, self.pattern, None, self._origins, function(self.joined)
+        )
+
+    def _split(self, function: Callable[[str], List[str]]) -> "TokenSequence":
+        # Every token is replaced by the tokens function returns, which may be none.
+        words, origins = [], []
+        for origin, word in zip(self.origins, self.words):
+            for piece in function(word):
+                words.append(piece)
+                origins.append(origin)
+        return self._replace(words, origins)
+
+    def _drop_empty(self, words: List[str]) -> "TokenSequence":
+        if all(words):
+            return self._replace(words)
+        return self._replace(
+            list(filter(None, words)), list(compress(self.origins, words))
+        )
+
+    def lower_case(self) -> "TokenSequence":
+        """
+        Lowercases the tokens for Turkish, see ``Normalizer.lower_case``.
+        """
+        return self._map(_lower)
+
+    def remove_accent_marks(
+        self, accent_mapping: Optional[Dict[str, str]] = None
+    ) -> "TokenSequence":
+        """
+        Removes the accent marks of the tokens, see ``Normalizer.remove_accent_marks``.
+        """
+        function = partial(
+            Normalizer.remove_accent_marks, accent_mapping=accent_mapping
+        )
+        if accent_mapping is None or _keeps_spaces(accent_mapping):
+            return self._map(function)
+        return self._split(lambda word: function(word).split())
+
+    def normalize_chars(
+        self, translation_table: Optional[Dict] = None
+    ) -> "TokenSequence":
+        """
+        Replaces the characters of the tokens, see ``Normalizer.normalize_chars``.
+        """
+        function = partial(
+            Normalizer.normalize_chars, translation_table=translation_table
+        )
+        if translation_table is None or _keeps_spaces(translation_table):
+            return self._map(function)
+        return self._split(lambda word: function(word).split())
+
+    def deasciify(self) -> "TokenSequence":
+        """
+        Deasciifies the tokens, see ``Normalizer.deasciify``. Every token is converted
+        in the context of its neighbouring tokens.
+        """
+        return self._map(Normalizer.deasciify)
+
+    def remove_punctuations(self) -> "TokenSequence":
+        """
+        Removes the punctuation of the tokens, dropping the tokens left empty, see
+        ``Normalizer.remove_punctuations``.
+        """
+        if not self.joined:
+            return self
+        # The punctuation never includes whitespace, the spaces between the tokens are
+        # kept.
+        return self._drop_empty(PUNCTUATION_REGEX.sub("", self.joined).split(" "))
+
+    def remove_numbers(
+        self, remove_signed: bool = True, remove_decimal: bool = True
+    ) -> "TokenSequence":
+        """
+        Removes the numerical expressions of the tokens, dropping the tokens left empty,
+        see ``Normalizer.remove_numbers``. As there, commas separate tokens too.
+        """
+        if not self.joined:
+            return self
+        # Numbers never include whitespace and are only delimited by digits, removing
+        # them from the joined tokens is the same as removing them from every token.
+        joined = NUMBER_REGEXES[bool(remove_signed), bool(remove_decimal)].sub(
+            "", self.joined
+        )
+        words = joined.split(" ")
+        if "," not in joined:
+            return self._drop_empty(words)
+        # Only the tokens with commas are split, the others are copied slice by slice.
+        # The tokens hold no whitespace, the pattern splits them at their runs of
+        # commas.
+        split = SPACES_AND_COMMAS_REGEX.split
+        origins = self.origins
+        split_words, split_origins = [], []
+        previous = 0
+        for index in [index for index, word in enumerate(words) if "," in word]:
+            split_words += words[previous:index]
+            split_origins += origins[previous:index]
+            pieces = split(words[index])
+            split_words += pieces
+            split_origins += [origins[index]] * len(pieces)
+            previous = index + 1
+        split_words += words[previous:]
+        split_origins += origins[previous:]
+        return self._replace(split_words, split_origins)._drop_empty(split_words)
+
+    def remove_stopwords(self, stopwords=None) -> "TokenSequence":
+        """
+        Drops the stop words, see ``Normalizer.remove_stopwords``.
+        """
+        if not self.joined:
+            return self
+        stopwords = _stopword_filter(stopwords).stopwords
+        # The tokens are lowercased at once rather than one by one.
+        keep = [word not in stopwords for word in _lower(self.joined).split(" ")]
+        return self._replace(
+            list(compress(self.words, keep)), list(compress(self.origins, keep))
+        )
@@ -1,15 +1,179 @@
 import re
+import threading
 import warnings
-from typing import List, Optional, Dict, Set, Union
-from pathlib import Path
-from ._builtin import DeasciifierBuiltin, NormBuiltin
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .._batch import map_texts
+from .._parallel import imap_chunks
+from ._builtin import NUMBER_WORD_LIMIT, NormBuiltin
+from ._deasciifier import Deasciifier
+from ._mapping import MAX_REPLACEMENTS, compile_replacements, mapping_function
+
+# ST_WR_PATH is re-exported for code importing it from this module.
+from .stopwords import ST_WR_PATH, StopwordFilter  # noqa: F401
+
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+
+    from ._pipeline import NormalizationPipeline
+    from ._tokens import TokenSequence
+
+# str.lower already maps "Ğ", "Ü", "Ö", "Ş" and "Ç", only the dotted and dotless capital
+# I differ in Turkish.
+TURKISH_LOWERCASE_DICT = {
+    "İ": "i",
+    "I": "ı",
+}
+
+DEFAULT_ACCENT_MAPPING = {
+    "â": "a",
+    "ô": "o",
+    "î": "i",
+    "ê": "e",
+    "û": "u",
+    "Â": "A",
+    "Ô": "O",
+    "Î": "İ",
+    "Ê": "E",
+    "Û": "U",
+}
+
+_remove_default_accent_marks = compile_replacements(
+    tuple(DEFAULT_ACCENT_MAPPING.items())
+)
+
+DEFAULT_TRANSLATION_TABLE = str.maketrans("ğĞıİöÖüÜşŞçÇ", "gGiIoOuUsScC")
+
+_normalize_default_chars = mapping_function(DEFAULT_TRANSLATION_TABLE)
+
+PUNCTUATION_REGEX = re.compile(r"[^\w\sğüşıöçĞÜŞİÖÇ.,']")
+# Replaced by a single space, these patterns collapse every run of whitespace. They
+# leave the single spaces alone, replacing them by themselves would copy most of the
+# text for nothing.
+SPACES_REGEX = re.compile(r" \s+|[^\S ]\s*")
+# Turning the commas into spaces and then collapsing the spaces is the same as
+# collapsing every run of whitespace and commas at once.
+SPACES_AND_COMMAS_REGEX = re.compile(r" [\s,]+|(?:[^\S ]|,)[\s,]*")
+
+# remove_numbers patterns keyed by (remove_signed, remove_decimal). The leading
+# lookaheads only let the patterns be tried where a number can start, which is several
+# times faster.
+NUMBER_REGEXES = {
+    (True, True): re.compile(r"(?=[-+.\d])(?<!\d)[-+]?\d*\.?\d+(?!\d)"),
+    (True, False): re.compile(r"(?=[-+\d])(?<!\d)[-+]?\d+(?!\d)"),
+    (False, True): re.compile(r"(?=[.\d])\d*\.?\d+"),
+    (False, False): re.compile(r"\d+"),
+}
+
+# A number replaces the spaces or the whitespace character before it, if any, by a
+# space and its words, so that the space left by the comma of a decimal number such as
+# "8, 0" is not doubled.
+NUMBER_WORD_REGEX = re.compile(r"(?: +|\s)?([-+]?(?:\d*\.\d+|\d+))")
+
+_DEASCIIFIER = Deasciifier()
+
+
+def _number_to_words(match) -> str:
+    text = match.group(1)
+    try:
+        # Integers are parsed as they are, going through float would round them above
+        # 2**53.
+        number = int(text)
+    except ValueError:
+        number = float(text)
+        if number >= 1e21:
+            return warnings.warn(
+                "The number is too big to convert it to words in Turkish language."
+            )
+        elif number != int(number):
+            return warnings.warn(
+                "In Turkish language, decimal numbers are expressed with commas."
+            )
+        number = int(number)
+    if abs(number) >= NUMBER_WORD_LIMIT:
+        return warnings.warn(
+            "The number is too big to convert it to words in Turkish language."
+        )
+    return " " + NormBuiltin.number_to_word(number).lstrip()
+
+
+def _init_deasciify_worker(cache_size: Optional[int] = None) -> None:
+    """Loads the pattern table once in a deasciify_batch worker process."""
+    _DEASCIIFIER.set_cache_size(cache_size)
+    _DEASCIIFIER.automata
+
+
+def _deasciify_chunk(texts: List[str]) -> List[str]:
+    return [_DEASCIIFIER.convert(text) for text in texts]
+
+
+_DEFAULT_STOPWORD_FILTER = None
+# The filters of the latest sets of stop words, by identity of the set.
+STOPWORD_FILTER_CACHE_SIZE = 32
+_stopword_filters: "OrderedDict[int, Tuple[AbstractSet[str], StopwordFilter]]" = (
+    OrderedDict()
+)
+_stopword_filters_lock = threading.Lock()
+
+
+def _stopword_filter(stopwords) -> StopwordFilter:
+    """
+    Returns the filter removing the given stop words, the default one being created
+    once.
+
+    Creating a filter lowercases its stop words, or checks that a set is already
+    lowercased, so the filters of the latest sets are cached to keep removing the same
+    set from many texts cheap. A set is only cached if its filter stays right when the
+    set changes: a frozenset, or a set of lowercased words that the filter uses as it
+    is.
+    """
+    global _DEFAULT_STOPWORD_FILTER
+    if isinstance(stopwords, StopwordFilter):
+        return stopwords
+    if stopwords is None:
+        if _DEFAULT_STOPWORD_FILTER is None:
+            _DEFAULT_STOPWORD_FILTER = StopwordFilter()
+        return _DEFAULT_STOPWORD_FILTER
+    if not isinstance(stopwords, AbstractSet):
+        return StopwordFilter(stopwords)
+
+    # The cache holds the set, so its identity cannot be reused by another object.
+    key = id(stopwords)
+    with _stopword_filters_lock:
+        cached = _stopword_filters.get(key)
+        if cached is not None and cached[0] is stopwords:
+            _stopword_filters.move_to_end(key)
+            return cached[1]
+
+    stopword_filter = StopwordFilter(stopwords)
+    if isinstance(stopwords, frozenset) or stopword_filter.stopwords is stopwords:
+        with _stopword_filters_lock:
+            _stopword_filters[key] = (stopwords, stopword_filter)
+            _stopword_filters.move_to_end(key)
+            if len(_stopword_filters) > STOPWORD_FILTER_CACHE_SIZE:
+                _stopword_filters.popitem(last=False)
+    return stopword_filter
 
-ST_WR_PATH = str(Path(__file__).parent.parent / "data/stop_words.txt")
 
 class Normalizer:
-    
+
     STOP_WORDS = None
-        
+
     @staticmethod
     def lower_case(text: str) -> str:
         """
@@ -34,16 +198,7 @@ class Normalizer:
         >>> Normalizer.lower_case("Ex: İIĞÜÖŞÇ")
         'ex: iığüöşç'
         """
-        turkish_lowercase_dict = {
-            "İ": "i",
-            "I": "ı",
-            "Ğ": "ğ",
-            "Ü": "ü",
-            "Ö": "ö",
-            "Ş": "ş",
-            "Ç": "ç",
-        }
-        for k, v in turkish_lowercase_dict.items():
+        for k, v in TURKISH_LOWERCASE_DICT.items():
             text = text.replace(k, v)
         return text.lower()
 
@@ -52,7 +207,7 @@ class Normalizer:
         """
         Removes punctuations (!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~) from the given string.
         This function removes all the punctuation characters from the given text.
-        
+
         Parameters
         ----------
         text : str
@@ -62,20 +217,50 @@ class Normalizer:
         -------
         output : str
             Text stripped from punctuations.
-            
+
         Example:
         --------
         >>> from mintlemon import Normalizer
         >>> Normalizer.remove_punctuations("#Merhaba, Dünya! ! # $ % &'()*+,-./:; <= >?@ [\]^_`{|}~) ")
         'Merhaba Dünya'
         """
-        text = re.sub(r"[^\w\sğüşıöçĞÜŞİÖÇ.,']", "", text)  
-        text = re.sub(r"\s+", " ", text) 
-        
-        return text.strip()  
+        text = PUNCTUATION_REGEX.sub("", text)
+        text = SPACES_REGEX.sub(" ", text)
+
+        return text.strip()
 
     @staticmethod
-    def remove_accent_marks(text: str, accent_mapping: Optional[Dict[str, str]] = None) -> str:
+    def remove_punctuations_many(
+        texts: Union[Iterable[str], "numpy.ndarray", "pandas.Series"]
+    ):
+        """
+        Removes punctuations from every text of a list, NumPy array or pandas Series.
+
+        Parameters
+        ----------
+        texts : Iterable[str], numpy.ndarray or pandas.Series
+            Input texts.
+
+        Returns
+        -------
+        output : List[str], numpy.ndarray or pandas.Series
+            Texts stripped from punctuations, in the same kind of container as the
+            input.
+
+        Example:
+        --------
+        >>> from mintlemon import Normalizer
+        >>> Normalizer.remove_punctuations_many(["#Merhaba, Dünya!", "Selam :)"])
+        ['Merhaba, Dünya', 'Selam']
+        """
+        delete = PUNCTUATION_REGEX.sub
+        squeeze = SPACES_REGEX.sub
+        return map_texts(lambda text: squeeze(" ", delete("", text)).strip(), texts)
+
+    @staticmethod
+    def remove_accent_marks(
+        text: str, accent_mapping: Optional[Dict[str, str]] = None
+    ) -> str:
         """
         Removes accent marks from the given string.
 
@@ -104,18 +289,11 @@ class Normalizer:
         'fruchte'
         """
         if accent_mapping is None:
-            accent_mapping = {
-                "â": "a",
-                "ô": "o",
-                "î": "i",
-                "ê": "e",
-                "û": "u",
-                "Â": "A",
-                "Ô": "O",
-                "Î": "İ",
-                "Ê": "E",
-                "Û": "U",
-            }
+            return _remove_default_accent_marks(text)
+        # Compiling a mapping only pays off once replacing its marks one by one gets
+        # slower than translating.
+        if len(accent_mapping) > MAX_REPLACEMENTS:
+            return compile_replacements(tuple(accent_mapping.items()))(text)
 
         for mark, letter in accent_mapping.items():
             text = text.replace(mark, letter)
@@ -147,36 +325,91 @@ class Normalizer:
         >>> Normalizer.num_to_tr_text("Evi 1000000 TL Değerinde! Çok güzel bir evi var ama 3,5 ay boyunca satamamışlar...")
         'Evi bir milyon TL Değerinde! Çok güzel bir evi var ama üç virgül beş ay boyunca satamamışlar...'
         """
-        def convert_number(match):
-            number = float(match.group(0).replace(",", "."))
-            if number >= 1e21:
-                return warnings.warn(
-                    "The number is too big to convert it to words in Turkish language."
-                )
-            elif number == int(number):
-                return NormBuiltin.number_to_word(number=int(number))
-            else:
-                return warnings.warn(
-                    "In Turkish language, decimal numbers are expressed with commas."
-                )
-
-        return re.sub(
-            r"[-+]?\d*.\d+|\d+", convert_number, text.replace(",", " virgül ")
+        return NUMBER_WORD_REGEX.sub(
+            _number_to_words, text.replace(",", " virgül ")
         ).lstrip()
-        
+
     @staticmethod
-    def deasciify(input: List[str]) -> List[str]:
+    def num_to_tr_text_many(
+        texts: Union[Iterable[str], "numpy.ndarray", "pandas.Series"]
+    ):
+        """
+        Converts numbers to their Turkish text equivalents in every text of a list,
+        NumPy array or pandas Series.
+
+        Parameters
+        ----------
+        texts : Iterable[str], numpy.ndarray or pandas.Series
+            The input texts containing numerical values to be converted.
+
+        Returns
+        -------
+        texts : List[str], numpy.ndarray or pandas.Series
+            The texts with numerical values converted to Turkish words, in the same kind
+            of container as the input.
+
+        Example:
+        --------
+        >>> from mintlemon import Normalizer
+        >>> Normalizer.num_to_tr_text_many(["3 elma", "12 armut"])
+        ['üç elma', 'on iki armut']
+        """
+        convert = NUMBER_WORD_REGEX.sub
+        return map_texts(
+            lambda text: convert(
+                _number_to_words, text.replace(",", " virgül ")
+            ).lstrip(),
+            texts,
+        )
+
+    @staticmethod
+    def numbers_to_words_many(
+        numbers: Union[Iterable[Union[int, str]], "numpy.ndarray", "pandas.Series"]
+    ):
+        """
+        Converts every number of a list, NumPy array or pandas Series to its Turkish
+        words.
+
+        Parameters
+        ----------
+        numbers : Iterable[int or str], numpy.ndarray or pandas.Series
+            The integers, or strings of integers, to be converted. Their absolute values
+            must be less than 10**21.
+
+        Returns
+        -------
+        words : List[str], numpy.ndarray or pandas.Series
+            The numbers in words, in the same kind of container as the input.
+
+        Raises
+        ------
+        ValueError
+            If a string is not an integer or a number is too big to be converted.
+        TypeError
+            If a number is neither an integer nor a string, such as a float.
+
+        Example:
+        --------
+        >>> from mintlemon import Normalizer
+        >>> Normalizer.numbers_to_words_many([3, -12, "1000000"])
+        ['üç', 'eksi on iki', 'bir milyon']
+        """
+        number_to_word = NormBuiltin.number_to_word
+        return map_texts(lambda number: number_to_word(number).lstrip(), numbers)
+
+    @staticmethod
+    def deasciify(input: str) -> str:
         """
         Deasciifies the given text for Turkish.
 
         Parameters
         ----------
-        input : List[str]
-            List of input str.
+        input : str
+            Input text.
 
         Returns
         -------
-        result : List[str]
+        result : str
             The converted Turkish string.
 
         Example:
@@ -185,10 +418,252 @@ class Normalizer:
         >>> Normalizer().deasciify("O sirada bahcede cıcekleri kokluyorduk. Hersey bahcıvanın islik calmasiyla yasandi...")
         'O sırada bahçede çiçekleri kokluyorduk. Herşey bahçıvanın ıslık çalmasıyla yaşandı...'
         """
-        deasciifier = DeasciifierBuiltin(input)
-        result = deasciifier.convert_to_turkish()
+        result = _DEASCIIFIER.convert(input)
         return result
 
+    @staticmethod
+    def deasciify_stats(reset: bool = False) -> Dict[str, int]:
+        """
+        Returns the counters of the texts deasciified so far by ``deasciify`` in this
+        process.
+
+        Only the characters that can be deasciified (c, g, i, o, s, u and their Turkish
+        forms) are evaluated against the patterns, every other character is skipped.
+
+        Parameters
+        ----------
+        reset : bool, optional
+            Whether to reset the counters after reading them.
+
+        Returns
+        -------
+        stats : Dict[str, int]
+            The number of ``texts`` converted, ``characters`` scanned and candidate
+            positions ``evaluated`` against the patterns.
+
+        Example:
+        --------
+        >>> from mintlemon import Normalizer
+        >>> Normalizer.deasciify("Bu 2023 yilinda")
+        'Bu 2023 yılında'
+        >>> Normalizer.deasciify_stats()
+        {'texts': 1, 'characters': 15, 'evaluated': 3}
+        """
+        stats = _DEASCIIFIER.stats()
+        if reset:
+            _DEASCIIFIER.reset_stats()
+        return stats
+
+    @staticmethod
+    def deasciify_batch(
+        texts: Iterable[str], n_jobs: Optional[int] = None, chunksize: int = 256
+    ) -> List[str]:
+        """
+        Deasciifies many texts, optionally spreading them over a pool of worker
+        processes.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            Input texts.
+        n_jobs : int, optional
+            The number of worker processes. None means 1, -1 means using all CPUs.
+        chunksize : int, optional
+            The number of texts sent to a worker process at once.
+
+        Returns
+        -------
+        result : List[str]
+            The converted Turkish strings, in the order of the input texts.
+
+        Example:
+        --------
+        >>> from mintlemon import Normalizer
+        >>> Normalizer.deasciify_batch(
+        ...     ["Hersey bahcivanin", "islik calmasiyla yasandi"], n_jobs=2
+        ... )
+        ['Herşey bahçıvanın', 'ıslık çalmasıyla yaşandı']
+        """
+        return list(
+            Normalizer.deasciify_iter(texts, n_jobs=n_jobs, chunksize=chunksize)
+        )
+
+    @staticmethod
+    def deasciify_iter(
+        texts: Iterable[str], n_jobs: Optional[int] = None, chunksize: int = 256
+    ) -> Iterator[str]:
+        """
+        Lazily deasciifies a stream of texts, optionally spreading them over a pool of
+        worker processes.
+
+        Texts are read from the iterable only as fast as the workers process them, so
+        arbitrarily long streams can be converted in bounded memory. Every worker
+        process loads the pattern table once.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            Input texts.
+        n_jobs : int, optional
+            The number of worker processes. None means 1, -1 means using all CPUs.
+        chunksize : int, optional
+            The number of texts sent to a worker process at once.
+
+        Yields
+        ------
+        result : str
+            The converted Turkish strings, in the order of the input texts.
+
+        Example:
+        --------
+        >>> from mintlemon import Normalizer
+        >>> with open("comments.txt", encoding="utf-8") as lines:
+        ...     for line in Normalizer.deasciify_iter(lines, n_jobs=-1, chunksize=1000):
+        ...         print(line, end="")
+        """
+        for chunk in imap_chunks(
+            _deasciify_chunk,
+            texts,
+            n_jobs=n_jobs,
+            chunksize=chunksize,
+            initializer=_init_deasciify_worker,
+            initargs=(_DEASCIIFIER.cache_size,),
+        ):
+            yield from chunk
+
+    @staticmethod
+    def set_deasciify_cache(maxsize: Optional[int] = 65536) -> None:
+        """
+        Enables, resizes or disables the word cache of ``deasciify``.
+
+        With the cache enabled, the conversion of frequent words such as "cok", "guzel"
+        or "icin" is memoized together with the few converted characters preceding them
+        that the patterns can see, so the result is always the same as without the
+        cache. The least recently used words are evicted first. Cached words are dropped
+        whenever the cache is reconfigured.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The maximum number of cached words. None or 0 disables the cache, which is
+            the default until this method is called.
+
+        Example:
+        --------
+        >>> from mintlemon import Normalizer
+        >>> Normalizer.set_deasciify_cache(100000)
+        >>> Normalizer.deasciify("cok guzel")
+        'çok güzel'
+        >>> Normalizer.deasciify("cok guzel")
+        'çok güzel'
+        >>> Normalizer.deasciify_cache_info()
+        {'hits': 2, 'misses': 2, 'maxsize': 100000, 'currsize': 2}
+        >>> Normalizer.set_deasciify_cache(None)
+        """
+        _DEASCIIFIER.set_cache_size(maxsize)
+
+    @staticmethod
+    def deasciify_cache_info() -> Optional[Dict[str, int]]:
+        """
+        Returns the counters of the word cache of ``deasciify``.
+
+        Returns
+        -------
+        info : Dict[str, int] or None
+            The number of cache ``hits`` and ``misses``, its ``maxsize`` and the number
+            of cached words as ``currsize``. None if the cache is disabled, see
+            ``set_deasciify_cache``.
+        """
+        return _DEASCIIFIER.cache_info()
+
+    @staticmethod
+    def pipeline(
+        steps: Sequence[Union[str, Tuple[str, Dict], Callable[[str], str]]]
+    ) -> "NormalizationPipeline":
+        """
+        Compiles a chain of normalization steps into a single callable.
+
+        The result is the same as calling the steps one after the other, but consecutive
+        character mappings share a single ``str.translate`` table and the whitespace
+        clean-up of the steps that remove characters is done once, so the text is
+        scanned far fewer times.
+
+        Parameters
+        ----------
+        steps : Sequence
+            The steps in the order they are applied: the name of a ``Normalizer`` method
+            such as "lower_case", "remove_accent_marks", "remove_punctuations",
+            "remove_numbers", "normalize_chars", "remove_stopwords", "deasciify" or
+            "num_to_tr_text", a ``(name, keyword arguments)`` tuple, or any function
+            taking and returning a string.
+
+        Returns
+        -------
+        pipeline : NormalizationPipeline
+            A callable taking a text and returning the normalized text.
+
+        Raises
+        ------
+        ValueError
+            If a step is not a known normalization step.
+
+        Example:
+        --------
+        >>> from mintlemon import Normalizer
+        >>> normalize = Normalizer.pipeline(
+        ...     [
+        ...         "lower_case",
+        ...         "remove_accent_marks",
+        ...         "remove_punctuations",
+        ...         "remove_numbers",
+        ...     ]
+        ... )
+        >>> normalize("Merhâbâ DÜNYA!!! Bugün 2,5 kilo elma aldım.")
+        'merhaba dünya bugün kilo elma aldım.'
+        """
+        from ._pipeline import NormalizationPipeline
+
+        return NormalizationPipeline(steps)
+
+    @staticmethod
+    def tokens(text: str, split_punctuation: bool = False) -> "TokenSequence":
+        """
+        Splits a text into a sequence of tokens to be normalized token by token.
+
+        The ``TokenSequence`` has the ``lower_case``, ``remove_accent_marks``,
+        ``normalize_chars``, ``deasciify``, ``remove_punctuations``, ``remove_numbers``
+        and ``remove_stopwords`` steps of ``Normalizer``, which work on the tokens
+        without splitting and joining the text again at every step. Every token
+        remembers the token of the text it comes from, whose offsets are given by
+        ``TokenSequence.spans``.
+
+        Parameters
+        ----------
+        text : str
+            The text to be tokenized.
+        split_punctuation : bool, optional
+            Whether punctuation marks are separate tokens, as with ``WordTokenizer``. By
+            default the tokens are separated by whitespace, as in ``remove_stopwords``.
+
+        Returns
+        -------
+        tokens : TokenSequence
+            The tokens of the text.
+
+        Example:
+        --------
+        >>> from mintlemon import Normalizer
+        >>> tokens = Normalizer.tokens("Bu İSTANBUL'da 2 gün kaldık, çok güzeldi!")
+        >>> tokens.lower_case().remove_stopwords().remove_numbers().join()
+        "istanbul'da gün kaldık güzeldi!"
+        """
+        from ..tokenizer.word_tokenizer import TOKEN_REGEX
+        from ._tokens import WHITESPACE_TOKEN_REGEX, TokenSequence
+
+        return TokenSequence.from_text(
+            text, TOKEN_REGEX if split_punctuation else WHITESPACE_TOKEN_REGEX
+        )
+
     @staticmethod
     def normalize_chars(text, translation_table=None):
         """
@@ -223,7 +698,7 @@ class Normalizer:
         'Men Agcabedi seherinde yasayiram.'
         """
         if translation_table is None:
-            translation_table = str.maketrans("ğĞıİöÖüÜşŞçÇ", "gGiIoOuUsScC")
+            return _normalize_default_chars(text)
 
         result = text.translate(translation_table)
         return result
@@ -262,36 +737,69 @@ class Normalizer:
         >>> normalize.remove_numbers(text)
         'Bu cümle ile başlıyor ve ile bitiyor. İle ilgili bir şeyler söyleyebiliriz.'
         """
-        if remove_signed and remove_decimal:
-            pattern = r"(?<!\d)[-+]?\d*\.?\d+(?!\d)"
-        elif remove_signed:
-            pattern = r"(?<!\d)[-+]?\d+(?!\d)"
-        elif remove_decimal:
-            pattern = r"\d*\.?\d+"
-        else:
-            pattern = r"\d+"
-
-        cleaned_text = re.sub(pattern, "", text)
+        pattern = NUMBER_REGEXES[bool(remove_signed), bool(remove_decimal)]
 
-        cleaned_text = re.sub(r"\s*,\s*", " ", cleaned_text)
-        cleaned_text = re.sub(r"\s+", " ", cleaned_text)
+        cleaned_text = pattern.sub("", text)
 
-        cleaned_text = re.sub(r"^,", "", cleaned_text).strip()
+        cleaned_text = SPACES_AND_COMMAS_REGEX.sub(" ", cleaned_text).strip()
 
         return cleaned_text
 
+    @staticmethod
+    def remove_numbers_many(
+        texts: Union[Iterable[str], "numpy.ndarray", "pandas.Series"],
+        remove_signed=True,
+        remove_decimal=True,
+    ):
+        """
+        Removes numerical expressions from every text of a list, NumPy array or pandas
+        Series.
+
+        Parameters
+        ----------
+        texts : Iterable[str], numpy.ndarray or pandas.Series
+            The texts to remove numerical expressions from.
+
+        remove_signed : bool, optional
+            Whether to remove signed integers/decimals from the texts.
+            By default, it is set to True.
+
+        remove_decimal : bool, optional
+            Whether to remove decimal numbers from the texts.
+            By default, it is set to True.
+
+        Returns
+        -------
+        cleaned_texts : List[str], numpy.ndarray or pandas.Series
+            The cleaned texts, in the same kind of container as the input.
+
+        Example:
+        --------
+        >>> from mintlemon import Normalizer
+        >>> Normalizer.remove_numbers_many(["2,5 kilo elma", "Bugün 3 kişiyiz."])
+        ['kilo elma', 'Bugün kişiyiz.']
+        """
+        delete = NUMBER_REGEXES[bool(remove_signed), bool(remove_decimal)].sub
+        squeeze = SPACES_AND_COMMAS_REGEX.sub
+        return map_texts(lambda text: squeeze(" ", delete("", text)).strip(), texts)
+
     @classmethod
-    def remove_stopwords(cls, text: str, stopwords: Union[Set[str], List[str]] = None) -> str:
+    def remove_stopwords(
+        cls, text: str, stopwords: Union[Set[str], List[str], StopwordFilter] = None
+    ) -> str:
         """
-        Removes stop words from the given text.
+        Removes stop words from the given text, ignoring the case of its words the
+        Turkish way.
 
         Parameters
         ----------
         text : str
             The input text.
-        stopwords : Union[Set[str], List[str]], optional
-            A set or list of words to remove from the text.
+        stopwords : Union[Set[str], List[str], StopwordFilter], optional
+            A set or list of words to remove from the text, or a ``StopwordFilter``.
             If not provided, it defaults to the stop words loaded from the file.
+            A list is lowercased on every call, a set of lowercase words or a
+            ``StopwordFilter`` is used as it is.
 
         Returns
         -------
@@ -314,14 +822,7 @@ class Normalizer:
         print(cleaned_text)
         # Output: "Bu örnek cümle, kelimeleri çıkarmak."
         """
-        if stopwords is None:
-            cls.load_stopwords(ST_WR_PATH)
-            stopwords = cls.STOP_WORDS
-        elif isinstance(stopwords, list):
-            stopwords = set(stopwords)
-
-        cleaned_text = " ".join(word for word in text.split() if word.lower() not in stopwords)
-        return cleaned_text
+        return _stopword_filter(stopwords).filter(text)
 
     @classmethod
     def load_stopwords(cls, stop_words_source: Union[str, Set[str], List[str]]) -> None:
@@ -366,4 +867,4 @@ class Normalizer:
         else:
             raise ValueError(
                 "stop_words_source must be a path to a file (str), a set of words (set), or a list of words (list)."
-            )
\ No newline at end of file
+            )
@@ -0,0 +1,176 @@
+"""
+A pandas Series accessor running the ``Normalizer`` steps over a whole column of texts.
+
+Importing this module registers the ``mintlemon`` accessor on every Series. Neither
+``import mintlemon`` nor ``import mintlemon.normalizer`` imports it, pandas stays
+optional.
+
+Examples
+--------
+>>> import pandas as pd
+>>> import mintlemon.normalizer.pandas_accessor
+>>> texts = pd.Series(["Merhâbâ DÜNYA!!!", "Bugün 2,5 kilo elma aldım."])
+>>> lowered = texts.mintlemon.lower_case()
+>>> lowered.mintlemon.remove_accent_marks().mintlemon.remove_numbers()
+0          merhaba dünya!!!
+1    bugün kilo elma aldım.
+dtype: object
+"""
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import pandas as pd
+
+from ._mapping import compile_replacements, mapping_function
+from .normalizer import (
+    Normalizer,
+    _normalize_default_chars,
+    _remove_default_accent_marks,
+    _stopword_filter,
+)
+from .stopwords import StopwordFilter
+
+
+@pd.api.extensions.register_series_accessor("mintlemon")
+class NormalizerAccessor:
+    """
+    The ``Normalizer`` steps of a Series of texts, as ``series.mintlemon``.
+
+    Every step returns a new Series with the same index, name and string dtype, whose
+    texts are the same as applying the ``Normalizer`` method to every text, and whose
+    missing values are kept as they are. The texts are taken out of the Series once and
+    go through the batch methods of ``Normalizer``, such as ``remove_punctuations_many``
+    or ``deasciify_batch``, and character mappings are compiled once for the whole
+    Series rather than once per text.
+
+    Parameters
+    ----------
+    series : pandas.Series
+        A Series of texts.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import mintlemon.normalizer.pandas_accessor
+    >>> frame = pd.DataFrame({"text": ["Bu bir ÖRNEK cümle!", "Sıcak bir çay içtik."]})
+    >>> frame["text"].mintlemon.remove_stopwords().mintlemon.remove_punctuations()
+    0         ÖRNEK cümle
+    1    Sıcak çay içtik.
+    Name: text, dtype: object
+    """
+
+    def __init__(self, series: pd.Series) -> None:
+        self._series = series
+
+    def lower_case(self) -> pd.Series:
+        """
+        Lowercases every text for Turkish, see ``Normalizer.lower_case``.
+        """
+        return self._apply(Normalizer.lower_case)
+
+    def remove_accent_marks(
+        self, accent_mapping: Optional[Dict[str, str]] = None
+    ) -> pd.Series:
+        """
+        Removes the accent marks of every text, see ``Normalizer.remove_accent_marks``.
+        """
+        if accent_mapping is None:
+            return self._apply(_remove_default_accent_marks)
+        return self._apply(compile_replacements(tuple(accent_mapping.items())))
+
+    def normalize_chars(self, translation_table: Optional[Dict] = None) -> pd.Series:
+        """
+        Replaces the characters of every text, see ``Normalizer.normalize_chars``.
+        """
+        if translation_table is None:
+            return self._apply(_normalize_default_chars)
+        return self._apply(mapping_function(translation_table))
+
+    def remove_punctuations(self) -> pd.Series:
+        """
+        Removes the punctuation of every text, see ``Normalizer.remove_punctuations``.
+        """
+        return self._apply_many(Normalizer.remove_punctuations_many)
+
+    def remove_numbers(
+        self, remove_signed: bool = True, remove_decimal: bool = True
+    ) -> pd.Series:
+        """
+        Removes the numerical expressions of every text, see
+        ``Normalizer.remove_numbers``.
+        """
+        return self._apply_many(
+            partial(
+                Normalizer.remove_numbers_many,
+                remove_signed=remove_signed,
+                remove_decimal=remove_decimal,
+            )
+        )
+
+    def remove_stopwords(
+        self, stopwords: Union[Set[str], List[str], StopwordFilter] = None
+    ) -> pd.Series:
+        """
+        Removes the stop words of every text, see ``Normalizer.remove_stopwords``.
+        """
+        return self._apply_many(_stopword_filter(stopwords).filter_many)
+
+    def num_to_tr_text(self) -> pd.Series:
+        """
+        Converts the numbers of every text to Turkish words, see
+        ``Normalizer.num_to_tr_text``.
+        """
+        return self._apply_many(Normalizer.num_to_tr_text_many)
+
+    def deasciify(
+        self, n_jobs: Optional[int] = None, chunksize: int = 256
+    ) -> pd.Series:
+        """
+        Deasciifies every text, see ``Normalizer.deasciify_batch``.
+
+        Parameters
+        ----------
+        n_jobs : int, optional
+            The number of worker processes. None means 1, -1 means using all CPUs.
+        chunksize : int, optional
+            The number of texts sent to a worker process at once.
+        """
+        return self._apply_many(
+            partial(Normalizer.deasciify_batch, n_jobs=n_jobs, chunksize=chunksize)
+        )
+
+    def pipeline(
+        self, steps: Sequence[Union[str, Tuple[str, Dict], Callable[[str], str]]]
+    ) -> pd.Series:
+        """
+        Applies a chain of normalization steps to every text, see
+        ``Normalizer.pipeline``.
+        """
+        return self._apply(Normalizer.pipeline(steps))
+
+    def _apply(self, function: Callable[[str], str]) -> pd.Series:
+        return self._apply_many(lambda texts: [function(text) for text in texts])
+
+    def _apply_many(self, function: Callable[[List[str]], List[str]]) -> pd.Series:
+        """
+        Applies function to the list of every text, the missing ones being empty, and
+        puts the missing values back.
+        """
+        series = self._series
+        values = series.tolist()
+        missing = series.isna().to_numpy().nonzero()[0].tolist()
+        texts = values
+        if missing:
+            texts = list(values)
+            for position in missing:
+                texts[position] = ""
+        results = list(function(texts))
+        for position in missing:
+            results[position] = values[position]
+
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype) or not pd.api.types.is_string_dtype(
+            dtype
+        ):
+            dtype = object
+        return pd.Series(results, index=series.index, name=series.name, dtype=dtype)
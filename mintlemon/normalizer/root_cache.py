@@ -0,0 +1,182 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+_MISSING = object()
+
+
+class RootCache:
+    """
+    A thread-safe, bounded LRU cache mapping surface forms of words to their roots.
+
+    Root extraction with the Zeyrek morphological analyzer is by far the most expensive
+    step of ``TextRootDTMVectorizer``, while Turkish corpora repeat the same surface
+    forms over and over. With a cache, every distinct word is analyzed once. A cache can
+    be shared by several vectorizers and saved to disk to be reused between runs.
+
+    Parameters
+    ----------
+    maxsize : int or None, optional
+        The maximum number of cached words, the least recently used words being evicted
+        first. None means no limit.
+    path : str, optional
+        A JSON file the cache is loaded from if it exists, and saved to by ``save``.
+
+    Examples
+    --------
+    >>> from mintlemon.normalizer import RootCache
+    >>> cache = RootCache(maxsize=100000, path="roots.json")
+    >>> cache.get("kitaplar", lambda word: "kitap")
+    'kitap'
+    >>> cache.get("kitaplar", lambda word: "kitap")
+    'kitap'
+    >>> cache.stats()
+    {'hits': 1, 'misses': 1, 'maxsize': 100000, 'currsize': 1}
+    >>> cache.save()
+    """
+
+    def __init__(
+        self, maxsize: Optional[int] = 2**18, path: Optional[str] = None
+    ) -> None:
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be a positive integer or None.")
+        self.maxsize = maxsize
+        self.path = path
+        self._roots = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self._roots)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._roots
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, word: str, analyze: Callable[[str], Optional[str]]) -> Optional[str]:
+        """
+        Returns the root of the word, analyzing it only if it is not cached yet.
+
+        Parameters
+        ----------
+        word : str
+            The surface form of the word.
+        analyze : callable
+            The function extracting the root of a word, which may return None.
+
+        Returns
+        -------
+        str or None
+            The root of the word.
+        """
+        with self._lock:
+            root = self._roots.get(word, _MISSING)
+            if root is not _MISSING:
+                self._roots.move_to_end(word)
+                self._hits += 1
+                return root
+            self._misses += 1
+
+        # Analyzing outside of the lock lets other threads use the cache meanwhile.
+        root = analyze(word)
+        with self._lock:
+            self._store(word, root)
+        return root
+
+    def update(
+        self, roots: Dict[str, Optional[str]], hits: int = 0, misses: int = 0
+    ) -> None:
+        """
+        Adds the given roots to the cache, such as the roots found by another process.
+
+        Parameters
+        ----------
+        roots : dict
+            The roots of the words, which may be None.
+        hits, misses : int, optional
+            The lookups the other process made to find them, added to the counters.
+        """
+        with self._lock:
+            self._hits += hits
+            self._misses += misses
+            for word, root in roots.items():
+                self._store(word, root)
+
+    def stats(self) -> Dict[str, Optional[int]]:
+        """
+        Returns the number of cache ``hits`` and ``misses``, the ``maxsize`` of the
+        cache and the number of words it currently holds as ``currsize``.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "maxsize": self.maxsize,
+                "currsize": len(self._roots),
+            }
+
+    def clear(self) -> None:
+        """
+        Drops every cached word and resets the counters.
+        """
+        with self._lock:
+            self._roots.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Saves the cached roots to a JSON file, atomically replacing it.
+
+        Parameters
+        ----------
+        path : str, optional
+            The file to write. Defaults to the path the cache was created with.
+
+        Raises
+        ------
+        ValueError
+            If no path is given and the cache was created without one.
+        """
+        path = path or self.path
+        if path is None:
+            raise ValueError("No path to save the root cache to.")
+        with self._lock:
+            roots = dict(self._roots)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(roots, file, ensure_ascii=False)
+        os.replace(temporary, path)
+
+    def load(self, path: Optional[str] = None) -> None:
+        """
+        Adds the roots saved in a JSON file to the cache.
+
+        Parameters
+        ----------
+        path : str, optional
+            The file to read. Defaults to the path the cache was created with.
+        """
+        path = path or self.path
+        with open(path, "r", encoding="utf-8") as file:
+            roots = json.load(file)
+        self.update(roots)
+
+    def _store(self, word: str, root: Optional[str]) -> None:
+        self._roots[word] = root
+        self._roots.move_to_end(word)
+        if self.maxsize is not None and len(self._roots) > self.maxsize:
+            self._roots.popitem(last=False)
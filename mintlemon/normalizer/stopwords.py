@@ -0,0 +1,139 @@
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+
+from .._batch import map_texts
+
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+
+ST_WR_PATH = str(Path(__file__).parent.parent / "data/stop_words.txt")
+
+
+def _lower(text: str) -> str:
+    """Lowercases text for Turkish, as ``Normalizer.lower_case``."""
+    return text.replace("İ", "i").replace("I", "ı").lower()
+
+
+def _read_stopwords(path: str) -> FrozenSet[str]:
+    with open(path, "r", encoding="utf-8") as file:
+        return frozenset(map(_lower, file.read().split()))
+
+
+@lru_cache(maxsize=None)
+def _default_stopwords() -> FrozenSet[str]:
+    """Reads the stop words shipped with mintlemon once per process."""
+    return _read_stopwords(ST_WR_PATH)
+
+
+class StopwordFilter:
+    """
+    Removes stop words from texts, ignoring the case of the words the Turkish way.
+
+    The stop words are loaded and lowercased once, when the filter is created, so that
+    removing them from a text only lowercases the text once and looks its words up in a
+    frozenset.
+
+    Parameters
+    ----------
+    stopwords : str, path-like or iterable of str, optional
+        The path to a file of whitespace separated stop words or the stop words
+        themselves. A set whose words are already lowercased is used as it is, without
+        copying it, so that later changes to it are taken into account. Defaults to the
+        stop words of mintlemon.
+
+    Examples
+    --------
+    >>> from mintlemon.normalizer import StopwordFilter
+    >>> stopwords = StopwordFilter()
+    >>> stopwords.filter(
+    ...     "Bu bir örnek cümle, İçin gereksiz kelimeleri çıkarmak istiyorum."
+    ... )
+    'örnek cümle, gereksiz kelimeleri çıkarmak istiyorum.'
+    >>> "İÇİN" in stopwords
+    True
+    >>> StopwordFilter(["bir", "ve"]).filter_many(["Bir elma ve bir armut", "Ve sonra"])
+    ['elma armut', 'sonra']
+    """
+
+    def __init__(
+        self, stopwords: Optional[Union[str, "os.PathLike[str]", Iterable[str]]] = None
+    ) -> None:
+        if stopwords is None:
+            stopwords = _default_stopwords()
+        elif isinstance(stopwords, (str, os.PathLike)):
+            stopwords = _read_stopwords(os.fspath(stopwords))
+        elif not (
+            isinstance(stopwords, AbstractSet)
+            and all(_lower(word) == word for word in stopwords)
+        ):
+            stopwords = frozenset(map(_lower, stopwords))
+        self.stopwords: AbstractSet[str] = stopwords
+
+    def __contains__(self, word: str) -> bool:
+        return _lower(word) in self.stopwords
+
+    def __len__(self) -> int:
+        return len(self.stopwords)
+
+    def filter(self, text: str) -> str:
+        """
+        Removes the stop words from the text.
+
+        Parameters
+        ----------
+        text : str
+            The input text.
+
+        Returns
+        -------
+        str
+            The words of the text that are not stop words, separated by single spaces.
+        """
+        stopwords = self.stopwords
+        # Lowercasing keeps the whitespace, and every character but "İ" which is
+        # replaced first, so the words of the lowercased text are the lowercased words
+        # of the text.
+        return " ".join(
+            [
+                word
+                for word, lowered in zip(text.split(), _lower(text).split())
+                if lowered not in stopwords
+            ]
+        )
+
+    def filter_tokens(self, tokens: Iterable[str]) -> List[str]:
+        """
+        Returns the tokens that are not stop words.
+        """
+        stopwords = self.stopwords
+        return [token for token in tokens if _lower(token) not in stopwords]
+
+    def filter_many(
+        self, texts: Union[Iterable[str], "numpy.ndarray", "pandas.Series"]
+    ):
+        """
+        Removes the stop words from every given text.
+
+        Parameters
+        ----------
+        texts : Iterable[str], numpy.ndarray or pandas.Series
+            The input texts.
+
+        Returns
+        -------
+        list, numpy.ndarray or pandas.Series
+            The texts without their stop words, in the same kind of container as the
+            input.
+        """
+        return map_texts(self.filter, texts)
@@ -1,40 +1,201 @@
-import zeyrek
+import os
+import threading
+import warnings
+from collections import Counter
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+import nltk
+import numpy as np
 import pandas as pd
+import zeyrek
+from scipy import sparse as sp
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.exceptions import NotFittedError
+from sklearn.feature_extraction import FeatureHasher
 from sklearn.feature_extraction.text import CountVectorizer
-import nltk
-from typing import Optional
 
-nltk.download("punkt", quiet=True)
+from .._parallel import effective_n_jobs, imap_chunks
+from ..tokenizer import WordTokenizer
+from .root_cache import RootCache
+
+# Above this many cells, fit_transform returns a sparse matrix unless a dense one is
+# asked for.
+DENSE_CELL_LIMIT = 10_000_000
 
-class TextRootDTMVectorizer:
+# The roots go through the analyzer of CountVectorizer, which lowercases them and drops
+# single character tokens, so the terms are the ones of the original CountVectorizer.
+_analyze_terms = CountVectorizer().build_analyzer()
+
+_punkt_lock = threading.Lock()
+_punkt_checked = False
+
+
+def _ensure_punkt() -> None:
     """
-    Transform a DataFrame of text into a document-term matrix using word roots
-    extracted by the Zeyrek morphological analyzer.
+    Downloads the nltk punkt tokenizer models unless they are already installed.
 
-    Parameters
-    ----------
-    dataframe : pandas.DataFrame
-        The DataFrame containing the text data.
-    column_name : str
-        The name of the column containing the text data.
+    The check runs once per process, on the first tokenization rather than at import
+    time, so importing this module never reaches the network.
+    """
+    global _punkt_checked
+    if _punkt_checked:
+        return
+    with _punkt_lock:
+        if not _punkt_checked:
+            try:
+                nltk.data.find("tokenizers/punkt")
+            except LookupError:
+                nltk.download("punkt", quiet=True)
+            _punkt_checked = True
 
-    Examples
-    --------
-    >>> import pandas as pd
-    >>> from mintlemon import TextRootDTMVectorizer
-    >>> df = pd.DataFrame({'text': ['bu bir örnek metindir', 'başka bir örnek metin']})
-    >>> vectorizer = TextRootDTMVectorizer(df, 'text')
-    >>> vectorizer.fit_transform()
+
+def _read_texts(path: str, column_name: Optional[str], chunksize: int) -> Iterator[str]:
     """
+    Yields the texts of a file chunk by chunk, without loading the whole file.
 
-    def __init__(self, dataframe: pd.DataFrame, column_name: str) -> None:
+    ``.csv``, ``.tsv``, ``.jsonl``, ``.ndjson`` and ``.parquet`` files hold the texts in
+    their column_name column, any other file holds a text per line. Parquet files are
+    read with pyarrow, since pandas cannot read them in chunks.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if (
+        extension in (".csv", ".tsv", ".jsonl", ".ndjson", ".parquet")
+        and column_name is None
+    ):
+        raise ValueError(f"column_name is needed to read the texts of {path!r}.")
+    if extension in (".csv", ".tsv"):
+        separator = "\t" if extension == ".tsv" else ","
+        with pd.read_csv(
+            path, sep=separator, usecols=[column_name], chunksize=chunksize
+        ) as reader:
+            for chunk in reader:
+                yield from chunk[column_name].tolist()
+    elif extension in (".jsonl", ".ndjson"):
+        with pd.read_json(path, lines=True, chunksize=chunksize) as reader:
+            for chunk in reader:
+                yield from chunk[column_name].tolist()
+    elif extension == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ImportError(
+                "Reading parquet files in chunks requires pyarrow."
+            ) from error
+        for batch in pq.ParquetFile(path).iter_batches(
+            batch_size=chunksize, columns=[column_name]
+        ):
+            yield from batch.column(0).to_pylist()
+    else:
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                yield line.rstrip("\r\n")
+
+
+_ROOT_WORKER = None
+
+
+def _init_root_worker(
+    tokenizer: Union[str, Callable[[str], Iterable[str]]], root_cache: RootCache
+) -> None:
+    """Loads the morphological analyzer once in an n_jobs worker process."""
+    global _ROOT_WORKER
+    _ROOT_WORKER = _BaseRootVectorizer(tokenizer=tokenizer, root_cache=root_cache)
+    _ROOT_WORKER.analyzer
+
+
+def _analyze_chunk(
+    texts: List[str],
+) -> Tuple[List[List[str]], Dict[str, Optional[str]], int, int]:
+    """
+    Returns the terms of the texts together with the roots of the words the worker had
+    not analyzed yet and the cache hits and misses of the chunk, to be merged into the
+    root cache of the parent process.
+    """
+    worker = _ROOT_WORKER
+    tokenize = worker._get_tokenizer()
+    tokenized = [list(tokenize(text)) for text in texts]
+    new_roots = {}
+    for word in set(chain.from_iterable(tokenized)):
+        if word not in worker.root_cache:
+            new_roots[word] = worker._find_root(word)
+    worker.root_cache.update(new_roots)
+    # Every occurrence of a word is looked up once, as in the parent process: the
+    # first occurrence of a new word is a miss and all the others are hits.
+    misses = len(new_roots)
+    hits = sum(map(len, tokenized)) - misses
+    return worker._documents(tokenized), new_roots, hits, misses
+
+
+class _BaseRootVectorizer(BaseEstimator):
+    """
+    Extracts the roots of the words of streamed texts with the Zeyrek morphological
+    analyzer.
+
+    The common part of ``TextRootDTMVectorizer`` and ``HashingRootVectorizer``: reading
+    the texts chunk by chunk, tokenizing them and looking the roots of their words up in
+    the root cache, in worker processes if asked for. See ``TextRootDTMVectorizer`` for
+    the parameters.
+
+    As a scikit-learn estimator, the parameters of the constructor are available through
+    ``get_params`` and ``set_params``, so that the vectorizers can be cloned, put in a
+    Pipeline and tuned with GridSearchCV. The vectorizers format their own outputs, they
+    are not wrapped by ``set_output``.
+    """
+
+    def __init__(
+        self,
+        column_name: Optional[str] = None,
+        tokenizer: Union[str, Callable[[str], Iterable[str]]] = "nltk",
+        root_cache: Optional[RootCache] = None,
+        chunksize: int = 10_000,
+        n_jobs: Optional[int] = None,
+    ) -> None:
+        if chunksize < 1:
+            raise ValueError("chunksize must be a positive integer.")
+        self.column_name = column_name
+        self.tokenizer = tokenizer
+        self.root_cache = RootCache() if root_cache is None else root_cache
+        self.chunksize = chunksize
+        self.n_jobs = n_jobs
+        self._analyzer = None
+
+    @property
+    def analyzer(self) -> zeyrek.MorphAnalyzer:
         """
-        Initialize TextRootDTMVectorizer instance.
+        The morphological analyzer, loaded on first use since loading its lexicon takes
+        seconds and is not needed as long as the roots are cached.
         """
-        self.dataframe = dataframe
-        self.column_name = column_name
-        self.analyzer = zeyrek.MorphAnalyzer()
-        self.vectorizer = CountVectorizer()
+        if self._analyzer is None:
+            self._analyzer = zeyrek.MorphAnalyzer()
+        return self._analyzer
+
+    def __getstate__(self) -> dict:
+        # The analyzer is rebuilt on demand rather than pickled with its whole lexicon.
+        state = dict(super().__getstate__())
+        state["_analyzer"] = None
+        return state
+
+    def _get_tokenizer(self) -> Callable[[str], Iterable[str]]:
+        """
+        Returns the function splitting a text into words, see the tokenizer parameter.
+
+        Raises
+        ------
+        ValueError
+            If tokenizer is neither a known tokenizer name nor callable.
+        """
+        if callable(self.tokenizer):
+            return self.tokenizer
+        if self.tokenizer == "builtin":
+            return WordTokenizer().iter_tokens
+        if self.tokenizer == "nltk":
+            _ensure_punkt()
+            return nltk.word_tokenize
+        raise ValueError(
+            f"Unknown tokenizer: {self.tokenizer!r}, expected 'nltk', 'builtin' or a "
+            "callable."
+        )
 
     def _analyze_word(self, word: str) -> Optional[str]:
         """
@@ -53,11 +214,18 @@ class TextRootDTMVectorizer:
         Examples
         --------
         >>> from mintlemon import TextRootDTMVectorizer
-        >>> vectorizer = TextRootDTMVectorizer(None, None)
-        # dummy initialization first arg is actually mandatory
-        # but we don't need it here
+        >>> vectorizer = TextRootDTMVectorizer()
         >>> vectorizer._analyze_word('kelimelerimiz')
         """
+        return self.root_cache.get(word, self._find_root)
+
+    def _find_root(self, word: str) -> Optional[str]:
+        """
+        Extract the root of the given word with the morphological analyzer, bypassing
+        the cache.
+        """
+        if self.tokenizer != "nltk":
+            return self._parse_word(word)
         analysis = self.analyzer.analyze(word)
         if len(analysis) > 0:
             root = analysis[0][0][1]
@@ -65,30 +233,555 @@ class TextRootDTMVectorizer:
         else:
             return None
 
-    def fit_transform(self) -> pd.DataFrame:
+    def _parse_word(self, word: str) -> Optional[str]:
+        """
+        Extract the root of a word that is already tokenized.
+
+        ``MorphAnalyzer.analyze`` tokenizes its input again with ``nltk.word_tokenize``,
+        which needs the punkt models. A single token is parsed directly instead, giving
+        the same root as ``analyze`` without any download. ``MorphAnalyzer._parse`` is
+        private: zeyrek is pinned to its 0.1 releases, and the tests check that it still
+        gives the roots of ``analyze``.
+        """
+        word = word.replace("'", "").replace("’", "")
+        if not word:
+            return None
+        analyses = self.analyzer._parse(word)
+        if not analyses or analyses[0] is None:
+            return "Unk"
+        return analyses[0].dict_item.lemma
+
+    def _iter_texts(self, X) -> Iterator[str]:
+        """
+        Yields the texts to vectorize, see the X parameter of ``fit_transform``.
+        """
+        if isinstance(X, (str, os.PathLike)):
+            X = _read_texts(os.fspath(X), self.column_name, self.chunksize)
+        if isinstance(X, pd.DataFrame):
+            X = [X]
+        for item in X:
+            # Chunked readers such as pd.read_csv(..., chunksize=...) yield DataFrames.
+            if isinstance(item, pd.DataFrame):
+                yield from item[self.column_name].tolist()
+            else:
+                yield item
+
+    def _iter_document_chunks(self, X) -> Iterator[List[List[str]]]:
+        """
+        Yields the roots of the texts as the terms counted in the document-term matrix,
+        in chunks of at most ``chunksize`` documents so that the whole corpus is never
+        held in memory.
+        """
+        texts = self._iter_texts(X)
+        if effective_n_jobs(self.n_jobs) == 1:
+            tokenize = self._get_tokenizer()
+            yield from imap_chunks(
+                lambda chunk: self._documents(map(tokenize, chunk)),
+                texts,
+                chunksize=self.chunksize,
+            )
+            return
+        for documents, new_roots, hits, misses in imap_chunks(
+            _analyze_chunk,
+            texts,
+            n_jobs=self.n_jobs,
+            chunksize=self.chunksize,
+            initializer=_init_root_worker,
+            initargs=(self.tokenizer, self.root_cache),
+        ):
+            self.root_cache.update(new_roots, hits=hits, misses=misses)
+            yield documents
+
+    def _documents(self, tokenized: Iterable[Iterable[str]]) -> List[List[str]]:
+        """
+        Returns the terms of tokenized texts, the roots of their words.
+        """
+        analyze = _analyze_terms
+        documents = []
+        for words in tokenized:
+            roots = [self._analyze_word(word) for word in words]
+            documents.append(
+                analyze(" ".join(root for root in roots if root is not None))
+            )
+        return documents
+
+
+class TextRootDTMVectorizer(
+    TransformerMixin, _BaseRootVectorizer, auto_wrap_output_keys=None
+):
+    """
+    Transform a DataFrame of text into a document-term matrix using word roots
+    extracted by the Zeyrek morphological analyzer.
+
+    The vectorizer follows the scikit-learn API: ``fit`` learns the vocabulary of roots,
+    ``partial_fit`` grows it with new batches of texts and ``transform`` counts the
+    roots of any texts against it. A fitted vectorizer, its root cache included, can be
+    pickled, so that the vocabulary is fitted once and new texts only go through cached
+    root lookups and sparse counting.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame, optional
+        The DataFrame containing the text data, used when no texts are given to ``fit``,
+        ``transform`` or ``fit_transform``.
+    column_name : str, optional
+        The name of the column containing the text data, also used to pick the texts of
+        a DataFrame given to ``fit``, ``partial_fit``, ``transform`` or
+        ``fit_transform``.
+    tokenizer : {"nltk", "builtin"} or callable, optional
+        How texts are split into words before their roots are extracted. "nltk" uses
+        ``nltk.word_tokenize``, which needs the punkt models and downloads them on first
+        use. "builtin" uses the regex based ``WordTokenizer`` of mintlemon, which is
+        faster and works offline. Any function taking a text and returning an iterable
+        of words can also be given.
+    root_cache : RootCache, optional
+        The cache of the roots of the words analyzed so far, so that every distinct word
+        is analyzed once. It can be shared by vectorizers using the same kind of
+        tokenizer and saved to disk. If not provided, every vectorizer gets its own
+        ``RootCache``.
+    chunksize : int, optional
+        The number of texts read and analyzed at a time. The texts are streamed chunk by
+        chunk and their counts added to the sparse document-term matrix, so that memory
+        use is bounded by the chunk size and the size of the matrix rather than by the
+        size of the corpus.
+    n_jobs : int, optional
+        The number of worker processes tokenizing the texts and extracting their roots,
+        -1 using every CPU. Every worker loads the morphological analyzer once, starting
+        from a copy of root_cache, analyzes each distinct word of a chunk once and sends
+        the new roots back to root_cache. The output does not depend on n_jobs. A
+        callable tokenizer must be picklable to be used with more than one job.
+
+    Attributes
+    ----------
+    vocabulary_ : dict
+        The mapping of the roots to their column in the document-term matrix. Roots
+        added by ``partial_fit`` get the next columns, so the columns of a matrix stay
+        valid as the vocabulary grows.
+    vectorizer : CountVectorizer
+        Deprecated, a ``CountVectorizer`` holding a copy of ``vocabulary_``. Use
+        ``vocabulary_`` and ``get_feature_names_out`` instead.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> from mintlemon import TextRootDTMVectorizer
+    >>> df = pd.DataFrame({'text': ['bu bir örnek metindir', 'başka bir örnek metin']})
+    >>> vectorizer = TextRootDTMVectorizer(df, 'text')
+    >>> vectorizer.fit_transform()
+    >>> vectorizer = TextRootDTMVectorizer(tokenizer='builtin')
+    >>> vectorizer = vectorizer.fit(['bu bir örnek metindir'])
+    >>> vectorizer.partial_fit(['başka bir örnek metin'])
+    >>> matrix = vectorizer.transform(['yeni metinler'], sparse=True, as_frame=False)[0]
+    """
+
+    def __init__(
+        self,
+        dataframe: Optional[pd.DataFrame] = None,
+        column_name: Optional[str] = None,
+        tokenizer: Union[str, Callable[[str], Iterable[str]]] = "nltk",
+        root_cache: Optional[RootCache] = None,
+        chunksize: int = 10_000,
+        n_jobs: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize TextRootDTMVectorizer instance.
+        """
+        super().__init__(
+            column_name=column_name,
+            tokenizer=tokenizer,
+            root_cache=root_cache,
+            chunksize=chunksize,
+            n_jobs=n_jobs,
+        )
+        self.dataframe = dataframe
+
+    @property
+    def vectorizer(self) -> CountVectorizer:
+        """
+        A ``CountVectorizer`` fitted with a copy of the vocabulary of roots, unfitted if
+        the vectorizer is not. Deprecated, kept for code reading the feature names from
+        it.
+        """
+        warnings.warn(
+            "TextRootDTMVectorizer.vectorizer is deprecated and will be removed, use "
+            "vocabulary_ and get_feature_names_out instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        if not hasattr(self, "vocabulary_"):
+            return CountVectorizer()
+        return CountVectorizer(vocabulary=dict(self.vocabulary_)).fit(())
+
+    def __getstate__(self) -> dict:
+        # The DataFrame given at construction is data rather than a fitted state.
+        state = super().__getstate__()
+        state["dataframe"] = None
+        return state
+
+    def _iter_texts(self, X) -> Iterator[str]:
+        """
+        Yields the texts to vectorize, the ones of the DataFrame given at construction
+        if X is None.
+        """
+        if X is None:
+            if self.dataframe is None:
+                raise ValueError(
+                    "No texts given and the vectorizer was created without a DataFrame."
+                )
+            X = self.dataframe
+        return super()._iter_texts(X)
+
+    def _extend_vocabulary(self, terms: Iterable[str]) -> None:
+        """
+        Appends the terms missing from the vocabulary, in sorted order, as new columns.
+        """
+        vocabulary = self.vocabulary_
+        for term in sorted(set(terms).difference(vocabulary)):
+            vocabulary[term] = len(vocabulary)
+
+    def fit(self, X=None, y=None) -> "TextRootDTMVectorizer":
+        """
+        Learn the vocabulary of the roots of the given texts, replacing any fitted one.
+
+        Parameters
+        ----------
+        X : iterable of str, pandas.DataFrame, str or path-like, optional
+            The texts, see ``fit_transform``.
+        y : None
+            Ignored, for compatibility with scikit-learn.
+
+        Returns
+        -------
+        TextRootDTMVectorizer
+            The fitted vectorizer.
+        """
+        self.vocabulary_ = {}
+        return self.partial_fit(X)
+
+    def partial_fit(self, X=None, y=None) -> "TextRootDTMVectorizer":
+        """
+        Add the roots of the given texts to the vocabulary, fitting it if it is not
+        fitted yet.
+
+        The roots already in the vocabulary keep their columns and the new ones are
+        appended, in sorted order, so that a vocabulary can be grown batch by batch.
+
+        Parameters
+        ----------
+        X : iterable of str, pandas.DataFrame, str or path-like, optional
+            The texts, see ``fit_transform``.
+        y : None
+            Ignored, for compatibility with scikit-learn.
+
+        Returns
+        -------
+        TextRootDTMVectorizer
+            The fitted vectorizer.
+        """
+        if not hasattr(self, "vocabulary_"):
+            self.vocabulary_ = {}
+        terms = set()
+        for documents in self._iter_document_chunks(X):
+            for document in documents:
+                terms.update(document)
+        self._extend_vocabulary(terms)
+        return self
+
+    def transform(
+        self, X=None, sparse: Optional[bool] = None, as_frame: bool = True
+    ) -> Union[pd.DataFrame, Tuple[object, object]]:
+        """
+        Count the roots of the given texts against the fitted vocabulary.
+
+        Roots missing from the vocabulary are ignored.
+
+        Parameters
+        ----------
+        X : iterable of str, pandas.DataFrame, str or path-like, optional
+            The texts, see ``fit_transform``.
+        sparse : bool, optional
+            Whether to keep the document-term matrix sparse, see ``fit_transform``.
+        as_frame : bool, optional
+            Whether to return a pandas DataFrame, see ``fit_transform``.
+
+        Returns
+        -------
+        pandas.DataFrame or tuple
+            The document-term matrix, see ``fit_transform``.
+
+        Raises
+        ------
+        sklearn.exceptions.NotFittedError
+            If the vectorizer is not fitted yet.
+        """
+        if not hasattr(self, "vocabulary_"):
+            raise NotFittedError(
+                "This TextRootDTMVectorizer is not fitted yet, call fit or partial_fit "
+                "first."
+            )
+        return self._format_output(self._count(X, grow=False), sparse, as_frame)
+
+    def fit_transform(
+        self, X=None, y=None, sparse: Optional[bool] = None, as_frame: bool = True
+    ) -> Union[pd.DataFrame, Tuple[object, object]]:
         """
         Fit and transform the data using the vectorizer.
 
+        Parameters
+        ----------
+        X : iterable of str, pandas.DataFrame, str or path-like, optional
+            The texts to vectorize, which are streamed rather than loaded at once: any
+            iterable of texts, a DataFrame or an iterable of DataFrames such as the
+            chunked readers of ``pd.read_csv`` or ``pd.read_json`` holding them in their
+            column_name column, or the path of a file. CSV, TSV, JSON Lines and Parquet
+            files hold the texts in their column_name column, any other file holds a
+            text per line. Defaults to the DataFrame given at construction.
+        y : None
+            Ignored, for compatibility with scikit-learn.
+        sparse : bool, optional
+            Whether to keep the document-term matrix sparse. By default it is only
+            densified if it has at most ``DENSE_CELL_LIMIT`` cells, a dense matrix of a
+            large corpus easily takes tens of gigabytes.
+        as_frame : bool, optional
+            Whether to return a pandas DataFrame, using ``pd.DataFrame.sparse`` columns
+            for a sparse matrix. Otherwise the matrix is returned together with the
+            feature names.
+
         Returns
         -------
-        pandas.DataFrame
-            The transformed document-term matrix.
+        pandas.DataFrame or tuple
+            The transformed document-term matrix, or a tuple of the document-term matrix
+            as a SciPy CSR matrix or NumPy array and the array of feature names.
 
         Examples
         --------
         >>> import pandas as pd
         >>> from mintlemon import TextRootDTMVectorizer
-        >>> df = pd.DataFrame({'text': ['bu bir örnek metindir', 'başka bir örnek metin']})
-        >>> vectorizer = TextRootDTMVectorizer(df, 'text')
+        >>> df = pd.DataFrame(
+        ...     {'text': ['bu bir örnek metindir', 'başka bir örnek metin']}
+        ... )
+        >>> vectorizer = TextRootDTMVectorizer(df, 'text', tokenizer='builtin')
         >>> vectorizer.fit_transform()
+        >>> matrix, roots = vectorizer.fit_transform(sparse=True, as_frame=False)
+        >>> reader = pd.read_csv('corpus.csv', chunksize=10000)
+        >>> matrix, roots = vectorizer.fit_transform(
+        ...     reader, sparse=True, as_frame=False
+        ... )
         """
-        processed_texts = []
-        for text in self.dataframe[self.column_name]:
-            words = nltk.word_tokenize(text)
-            processed_words = [self._analyze_word(word) for word in words]
-            processed_words = [root for root in processed_words if root is not None]
-            processed_texts.append(" ".join(processed_words))
+        # A single pass numbers the roots in the order they are met, the columns are
+        # then sorted to give the vocabulary of fit.
+        self.vocabulary_ = {}
+        X = self._count(X, grow=True)
+        terms = list(self.vocabulary_)
+        order = sorted(range(len(terms)), key=terms.__getitem__)
+        columns = np.empty(len(terms), dtype=X.indices.dtype)
+        columns[order] = np.arange(len(terms), dtype=X.indices.dtype)
+        X.indices = columns[X.indices]
+        X.has_sorted_indices = False
+        X.sort_indices()
+        self.vocabulary_ = {terms[index]: column for column, index in enumerate(order)}
+        return self._format_output(X, sparse, as_frame)
 
-        X = self.vectorizer.fit_transform(processed_texts)
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        """
+        Returns the roots of the vocabulary in the order of the columns of the
+        document-term matrix.
+        """
+        if not hasattr(self, "vocabulary_"):
+            raise NotFittedError(
+                "This TextRootDTMVectorizer is not fitted yet, call fit or partial_fit "
+                "first."
+            )
+        feature_names = np.empty(len(self.vocabulary_), dtype=object)
+        for term, index in self.vocabulary_.items():
+            feature_names[index] = term
+        return feature_names
+
+    def _count(self, X, grow: bool) -> sp.csr_matrix:
+        """
+        Builds the sparse document-term matrix of the texts chunk by chunk, adding the
+        roots missing from the vocabulary if grow is true and ignoring them otherwise.
+        """
+        vocabulary: Dict[str, int] = self.vocabulary_
+        empty = np.zeros(0, dtype=np.int64)
+        values, indices, indptr = [empty], [empty], [np.zeros(1, dtype=np.int64)]
+        rows = nnz = 0
+        for documents in self._iter_document_chunks(X):
+            chunk_values, chunk_indices, chunk_indptr = [], [], []
+            for document in documents:
+                if grow:
+                    for term in document:
+                        if term not in vocabulary:
+                            vocabulary[term] = len(vocabulary)
+                counts = Counter(
+                    vocabulary[term] for term in document if term in vocabulary
+                )
+                for index in sorted(counts):
+                    chunk_indices.append(index)
+                    chunk_values.append(counts[index])
+                chunk_indptr.append(nnz + len(chunk_indices))
+            # Only the counts of the current chunk are kept in Python lists.
+            values.append(np.asarray(chunk_values, dtype=np.int64))
+            indices.append(np.asarray(chunk_indices, dtype=np.int64))
+            indptr.append(np.asarray(chunk_indptr, dtype=np.int64))
+            rows += len(documents)
+            nnz += len(chunk_indices)
+        return sp.csr_matrix(
+            (np.concatenate(values), np.concatenate(indices), np.concatenate(indptr)),
+            shape=(rows, len(vocabulary)),
+        )
+
+    def _format_output(self, X, sparse: Optional[bool], as_frame: bool):
+        """
+        Converts a sparse document-term matrix to the output asked for, see
+        ``fit_transform``.
+        """
+        if sparse is None:
+            sparse = X.shape[0] * X.shape[1] > DENSE_CELL_LIMIT
+        feature_names = self.get_feature_names_out()
+        if not as_frame:
+            return (X.tocsr() if sparse else X.toarray()), feature_names
+        if sparse:
+            return pd.DataFrame.sparse.from_spmatrix(X, columns=feature_names)
+        return pd.DataFrame(X.toarray(), columns=feature_names)
+
+
+class HashingRootVectorizer(
+    TransformerMixin, _BaseRootVectorizer, auto_wrap_output_keys=None
+):
+    """
+    Transform texts into a document-term matrix of word roots with a fixed number of
+    columns, mapping every root to a column with feature hashing instead of a
+    vocabulary.
+
+    The roots are extracted as by ``TextRootDTMVectorizer``, but nothing is learned from
+    the texts: the vectorizer needs no fitting and keeps no vocabulary, whose Python
+    dict takes gigabytes for large corpora and cannot be merged across processes. Texts
+    can thus be vectorized in parallel or in a stream, by separate vectorizers, into the
+    same columns. Different roots may share a column.
+
+    Parameters
+    ----------
+    n_features : int, optional
+        The number of columns of the document-term matrix.
+    store_roots : bool, optional
+        Whether to record the roots met in each column in ``roots_``, to inspect the
+        columns and their collisions.
+    tokenizer, root_cache, chunksize, n_jobs
+        See ``TextRootDTMVectorizer``.
+
+    Attributes
+    ----------
+    roots_ : dict
+        The set of the roots met in each column, once texts are transformed with
+        store_roots true.
+
+    Examples
+    --------
+    >>> from mintlemon import HashingRootVectorizer
+    >>> vectorizer = HashingRootVectorizer(
+    ...     n_features=2**18, tokenizer='builtin', store_roots=True
+    ... )
+    >>> matrix = vectorizer.transform(
+    ...     ['bu bir örnek metindir', 'başka bir örnek metin']
+    ... )
+    >>> matrix.shape
+    (2, 262144)
+    >>> vectorizer.roots_[matrix[0].indices[0]]
+    """
+
+    def __init__(
+        self,
+        n_features: int = 2**20,
+        tokenizer: Union[str, Callable[[str], Iterable[str]]] = "nltk",
+        root_cache: Optional[RootCache] = None,
+        chunksize: int = 10_000,
+        n_jobs: Optional[int] = None,
+        store_roots: bool = False,
+        column_name: Optional[str] = None,
+    ) -> None:
+        super().__init__(
+            column_name=column_name,
+            tokenizer=tokenizer,
+            root_cache=root_cache,
+            chunksize=chunksize,
+            n_jobs=n_jobs,
+        )
+        self.n_features = n_features
+        self.store_roots = store_roots
+
+    @property
+    def hasher(self) -> FeatureHasher:
+        """
+        The feature hasher of the roots, following n_features when it is changed by
+        ``set_params``.
+        """
+        # Counts rather than signed hashes, like the matrices of TextRootDTMVectorizer.
+        return FeatureHasher(
+            self.n_features, input_type="string", dtype=np.int64, alternate_sign=False
+        )
+
+    def fit(self, X=None, y=None) -> "HashingRootVectorizer":
+        """
+        Does nothing, the vectorizer is stateless. Only there for compatibility with
+        scikit-learn.
+        """
+        return self
+
+    def partial_fit(self, X=None, y=None) -> "HashingRootVectorizer":
+        """
+        Does nothing, the vectorizer is stateless. Only there for compatibility with
+        scikit-learn.
+        """
+        return self
+
+    def transform(self, X) -> sp.csr_matrix:
+        """
+        Count the roots of the given texts in their hashed columns.
+
+        Parameters
+        ----------
+        X : iterable of str, pandas.DataFrame, str or path-like
+            The texts, streamed chunk by chunk, see
+            ``TextRootDTMVectorizer.fit_transform``.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            The document-term matrix, with n_features columns.
+        """
+        hasher = self.hasher
+        blocks = []
+        for documents in self._iter_document_chunks(X):
+            blocks.append(hasher.transform(documents))
+            if self.store_roots:
+                self._store_roots(documents)
+        if not blocks:
+            return sp.csr_matrix((0, self.n_features), dtype=np.int64)
+        return sp.vstack(blocks, format="csr")
 
-        return pd.DataFrame(X.toarray(), columns=self.vectorizer.get_feature_names_out())
\ No newline at end of file
+    def fit_transform(self, X, y=None) -> sp.csr_matrix:
+        """
+        Same as ``transform``, the vectorizer is stateless.
+        """
+        return self.transform(X)
+
+    def _store_roots(self, documents: List[List[str]]) -> None:
+        """
+        Records the columns of the roots of the documents not met yet in ``roots_``.
+        """
+        if not hasattr(self, "roots_"):
+            self.roots_: Dict[int, Set[str]] = {}
+            self._stored_roots: Set[str] = set()
+        new_roots = sorted(
+            {term for document in documents for term in document}.difference(
+                self._stored_roots
+            )
+        )
+        if not new_roots:
+            return
+        self._stored_roots.update(new_roots)
+        # Every row holds a single root, hashed to a single column.
+        columns = self.hasher.transform([[root] for root in new_roots]).indices
+        for root, column in zip(new_roots, columns.tolist()):
+            self.roots_.setdefault(column, set()).add(root)
@@ -1,9 +1,160 @@
+import os
 import re
-from typing import List
+import warnings
+from collections import deque
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .._batch import map_texts
+from .._parallel import effective_n_jobs, imap_chunks
+
+if TYPE_CHECKING:
+    import numpy
+    import pandas
 
 PATH = str(Path(__file__).parent.parent / "data/TR_non_breaking_prefixes.txt")
 
+SENTENCE_BOUNDARY_REGEX = re.compile(r"(?<=[.!?])\s")
+# The same boundaries in UTF-8 encoded bytes, where \s only matches ASCII whitespace.
+BYTES_SENTENCE_BOUNDARY_REGEX = re.compile(rb"(?<=[.!?])\s")
+_ASCII_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+# The deprecated prefix_pattern attribute, an alternation of the escaped prefixes.
+_PREFIX_PATTERN_REGEX = re.compile(r"\(\?:\^\|\\s\)\((.*)\)\\\.", re.DOTALL)
+_UNESCAPE_REGEX = re.compile(r"\\(.)", re.DOTALL)
+_PREFIX_PATTERN_DEPRECATION = (
+    "SentenceSplitter.prefix_pattern is deprecated and will be removed, use "
+    "non_breaking_prefixes_tr instead."
+)
+
+
+@lru_cache(maxsize=None)
+def _load_prefixes(
+    path: str,
+) -> Tuple[List[str], FrozenSet[str], Dict[str, Tuple[str, ...]]]:
+    """
+    Reads the non-breaking prefixes once per process.
+
+    Returns the prefixes, the set of the single word prefixes and the prefixes of
+    several words, such as "Ar. Gör", indexed by their last word.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        prefixes = file.read().splitlines()
+    return (prefixes, *_index_prefixes(prefixes))
+
+
+def _index_prefixes(
+    prefixes: Iterable[str],
+) -> Tuple[FrozenSet[str], Dict[str, Tuple[str, ...]]]:
+    """
+    Returns the set of the single word prefixes and the prefixes of several words
+    indexed by their last word.
+    """
+    words = set()
+    phrases = {}
+    for prefix in filter(None, map(str.strip, prefixes)):
+        if any(char.isspace() for char in prefix):
+            last_word = prefix.split()[-1]
+            phrases[last_word] = phrases.get(last_word, ()) + (prefix,)
+        else:
+            words.add(prefix)
+    return frozenset(words), phrases
+
+
+def _encode_prefixes(
+    words: FrozenSet[str], phrases: Dict[str, Tuple[str, ...]]
+) -> Tuple[FrozenSet[bytes], Dict[bytes, Tuple[bytes, ...]]]:
+    """Returns the prefix words and phrases encoded in UTF-8, to split bytes."""
+    return (
+        frozenset(word.encode("utf-8") for word in words),
+        {
+            word.encode("utf-8"): tuple(
+                phrase.encode("utf-8") for phrase in phrases[word]
+            )
+            for word in phrases
+        },
+    )
+
+
+_SPLITTER = None
+
+
+def _init_split_worker(
+    prefix_words: FrozenSet[str], prefix_phrases: Dict[str, Tuple[str, ...]]
+) -> None:
+    """
+    Creates the splitter of a split_stream worker process, with the prefixes of the
+    caller.
+    """
+    global _SPLITTER
+    _SPLITTER = SentenceSplitter()
+    _SPLITTER._prefix_words = prefix_words
+    _SPLITTER._prefix_phrases = prefix_phrases
+
+
+def _block_boundaries(
+    blocks: List[Tuple[str, str]], splitter: Optional["SentenceSplitter"] = None
+) -> List[List[int]]:
+    """
+    Returns the offsets of the whitespaces ending sentences in every block, the text
+    preceding the block being given as its context. The blocks are split by the splitter
+    of the worker process unless a splitter is given.
+    """
+    splitter = _SPLITTER if splitter is None else splitter
+    results = []
+    for context, block in blocks:
+        spans = list(splitter.iter_spans(context + block))
+        results.append(
+            [end - len(context) for _, end in spans[:-1] if end >= len(context)]
+        )
+    return results
+
+
+def _iter_blocks(
+    pieces: Iterable[str], block_size: int, context_size: int
+) -> Iterator[Tuple[str, str]]:
+    """
+    Joins the pieces of a text into blocks of about block_size characters ending with a
+    whitespace, each given with the last context_size characters preceding it.
+
+    As the words of a block start in it, whether a dot of the block ends a sentence can
+    be decided from the block and its context only.
+    """
+    buffer = []
+    size = 0
+    # The length of the buffered text up to its last whitespace, 0 if it has none. Every
+    # piece is only scanned once, and the buffer only joined once it can be cut.
+    cut = 0
+    context = ""
+    for piece in pieces:
+        end = len(piece)
+        while end and not piece[end - 1].isspace():
+            end -= 1
+        if end:
+            cut = size + end
+        buffer.append(piece)
+        size += len(piece)
+        if size < block_size or not cut:
+            continue
+        text = "".join(buffer)
+        yield context, text[:cut]
+        context = (context + text[max(cut - context_size, 0) : cut])[-context_size:]
+        buffer = [text[cut:]]
+        size -= cut
+        cut = 0
+    yield context, "".join(buffer)
+
+
 class SentenceSplitter:
     """
     SentenceSplitter is a class used for splitting a text into sentences by considering `Turkish non-breaking prefixes <https://github.com/tnltk/tnltk/blob/main/resources/TR_non_breaking_prefixes.txt>`_
@@ -11,16 +162,198 @@ class SentenceSplitter:
     Methods:
     --------
     split_sentences(text: str) : List[str]
-        Split the given text into sentences by considering Turkish non-breaking prefixes.
+        Split the given text into sentences by considering Turkish non-breaking
+        prefixes.
+    split_sentences_many(texts: Iterable[str]) : List[List[str]]
+        Split every given text into sentences.
+    iter_spans(text: str or bytes-like) : Iterator[Tuple[int, int]]
+        Lazily yield the start and end offsets of the sentences of the text.
+    iter_sentences(text: str or bytes-like) : Iterator
+        Lazily yield the sentences of the text.
+    split_stream(pieces: Iterable[str]) : Iterator[str]
+        Lazily yield the sentences of a text given in pieces.
+    split_file(path: str) : Iterator[str]
+        Lazily yield the sentences of a text file.
     """
+
     def __init__(self) -> None:
-        with open(PATH, "r", encoding="utf-8") as file:
-            self.non_breaking_prefixes_tr = file.read().splitlines()
-        self.prefix_pattern = r"(?:^|\s)(" + "|".join(self.non_breaking_prefixes_tr) + r")\."
+        prefixes, self._prefix_words, self._prefix_phrases = _load_prefixes(PATH)
+        self._prefixes = list(prefixes)
+        self._encoded_prefixes = None
+
+    @property
+    def non_breaking_prefixes_tr(self) -> List[str]:
+        """
+        The non-breaking prefixes, whose dot does not end a sentence. Assigning a list
+        of prefixes replaces them.
+        """
+        return self._prefixes
+
+    @non_breaking_prefixes_tr.setter
+    def non_breaking_prefixes_tr(self, prefixes: Iterable[str]) -> None:
+        self._prefixes = list(prefixes)
+        self._prefix_words, self._prefix_phrases = _index_prefixes(self._prefixes)
+
+    @property
+    def prefix_pattern(self) -> str:
+        r"""
+        The regular expression matching a non-breaking prefix followed by its dot.
+
+        Deprecated, sentences are no longer split with it. Assigning a pattern of the
+        same form, ``(?:^|\s)(<prefix>|<prefix>|...)\.``, replaces the non-breaking
+        prefixes of the splitter.
+        """
+        warnings.warn(_PREFIX_PATTERN_DEPRECATION, DeprecationWarning, stacklevel=2)
+        return (
+            r"(?:^|\s)("
+            + "|".join(map(re.escape, self.non_breaking_prefixes_tr))
+            + r")\."
+        )
+
+    @prefix_pattern.setter
+    def prefix_pattern(self, pattern: str) -> None:
+        warnings.warn(_PREFIX_PATTERN_DEPRECATION, DeprecationWarning, stacklevel=2)
+        match = _PREFIX_PATTERN_REGEX.fullmatch(pattern)
+        if match is None:
+            raise ValueError(
+                "prefix_pattern must be of the form (?:^|\\s)(<prefix>|...)\\."
+            )
+        prefixes = [
+            _UNESCAPE_REGEX.sub(r"\1", prefix) for prefix in match.group(1).split("|")
+        ]
+        self.non_breaking_prefixes_tr = prefixes
+
+    def _is_prefix(self, text: str, dot: int) -> bool:
+        """
+        Returns whether the dot at the given index of the text ends a non-breaking
+        prefix, which starts the text or follows a whitespace.
+        """
+        start = dot
+        while start and not text[start - 1].isspace():
+            start -= 1
+        word = text[start:dot]
+        if word in self._prefix_words:
+            return True
+        for phrase in self._prefix_phrases.get(word, ()):
+            start = dot - len(phrase)
+            if (
+                start >= 0
+                and text.startswith(phrase, start)
+                and (start == 0 or text[start - 1].isspace())
+            ):
+                return True
+        return False
+
+    def _is_encoded_prefix(self, text, dot: int) -> bool:
+        """
+        Same as ``_is_prefix`` for UTF-8 encoded bytes, a memoryview or an mmap.
+        """
+        # The encoded prefixes follow the prefix sets of the splitter, which are
+        # replaced rather than modified.
+        encoded = self._encoded_prefixes
+        if (
+            encoded is None
+            or encoded[0] is not self._prefix_words
+            or encoded[1] is not self._prefix_phrases
+        ):
+            encoded = self._encoded_prefixes = (
+                self._prefix_words,
+                self._prefix_phrases,
+                *_encode_prefixes(self._prefix_words, self._prefix_phrases),
+            )
+        _, _, words, phrases = encoded
+        start = dot
+        while start and text[start - 1] not in _ASCII_WHITESPACE:
+            start -= 1
+        word = bytes(text[start:dot])
+        if word in words:
+            return True
+        for phrase in phrases.get(word, ()):
+            start = dot - len(phrase)
+            if start < 0 or bytes(text[start:dot]) != phrase:
+                continue
+            if start == 0 or text[start - 1] in _ASCII_WHITESPACE:
+                return True
+        return False
+
+    def iter_spans(self, text) -> Iterator[Tuple[int, int]]:
+        """
+        Lazily yield the offsets of the sentences of the text, without copying it.
+
+        Parameters
+        ----------
+        text : str, bytes, bytearray, memoryview or mmap.mmap
+            The text to be split into sentences. Bytes-like objects, such as a
+            memory-mapped file, must hold UTF-8 encoded text and only ASCII whitespace
+            separates their sentences.
+
+        Yields
+        ------
+        span : tuple of int
+            The start and end offsets of a sentence, ``text[start:end]`` being the
+            sentence. The offsets are character offsets for a str and byte offsets for a
+            bytes-like object.
+
+        Examples
+        --------
+        >>> from mintlemon import SentenceSplitter
+        >>> splitter = SentenceSplitter()
+        >>> list(splitter.iter_spans("Dr. Ahmet geldi. Ayşe gitti!"))
+        Output: [(0, 16), (17, 28)]
+        """
+        if isinstance(text, str):
+            boundaries, dot, is_prefix = (
+                SENTENCE_BOUNDARY_REGEX.finditer(text),
+                ".",
+                self._is_prefix,
+            )
+        else:
+            boundaries, dot, is_prefix = (
+                BYTES_SENTENCE_BOUNDARY_REGEX.finditer(text),
+                ord("."),
+                self._is_encoded_prefix,
+            )
+        # A single scan over the candidate boundaries, a whitespace following ".", "!"
+        # or "?", skipping the dots of non-breaking prefixes.
+        start = 0
+        for match in boundaries:
+            end = match.start()
+            if text[end - 1] == dot and is_prefix(text, end - 1):
+                continue
+            yield start, end
+            start = match.end()
+        yield start, len(text)
+
+    def iter_sentences(self, text) -> Iterator:
+        """
+        Lazily yield the sentences of the text.
+
+        Parameters
+        ----------
+        text : str, bytes, bytearray, memoryview or mmap.mmap
+            The text to be split into sentences, see ``iter_spans``.
+
+        Yields
+        ------
+        sentence : str, bytes or memoryview
+            A slice of the text, which for a memoryview shares its memory.
+
+        Examples
+        --------
+        >>> from mintlemon import SentenceSplitter
+        >>> splitter = SentenceSplitter()
+        >>> for sentence in splitter.iter_sentences("Dr. Ahmet geldi. Ayşe gitti!"):
+        ...     print(sentence)
+        Output: Dr. Ahmet geldi.
+                Ayşe gitti!
+        """
+        for start, end in self.iter_spans(text):
+            yield text[start:end]
 
     def split_sentences(self, text: str) -> List[str]:
         """
-        Split the given text into sentences by considering Turkish non-breaking prefixes.
+        Split the given text into sentences by considering Turkish non-breaking
+        prefixes.
 
         Parameters
         ----------
@@ -40,6 +373,148 @@ class SentenceSplitter:
         >>> splitter.split_sentences(text)
         Output: ["Bu cümle bir örnektir.", "Bu cümle de bir örnektir!"]
         """
-        text = re.sub(self.prefix_pattern, r"\1", text)
+        return [text[start:end] for start, end in self.iter_spans(text)]
+
+    def split_sentences_many(
+        self, texts: Union[Iterable[str], "numpy.ndarray", "pandas.Series"]
+    ):
+        """
+        Split every given text into sentences by considering Turkish non-breaking
+        prefixes.
+
+        Parameters
+        ----------
+        texts : Iterable[str], numpy.ndarray or pandas.Series
+            The input texts to be split into sentences.
+
+        Returns
+        -------
+        sentences : list, numpy.ndarray or pandas.Series
+            The list of sentences of every text, in the same kind of container as the
+            input.
+
+        Examples
+        --------
+        >>> from mintlemon import SentenceSplitter
+        >>> splitter = SentenceSplitter()
+        >>> splitter.split_sentences_many(["Bu bir örnektir. Bu da!", "Tek cümle."])
+        Output: [["Bu bir örnektir.", "Bu da!"], ["Tek cümle."]]
+        """
+        return map_texts(self.split_sentences, texts)
+
+    def split_stream(
+        self,
+        pieces: Iterable[str],
+        block_size: int = 1 << 20,
+        n_jobs: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Lazily yield the sentences of a text given in pieces, such as the lines of a
+        file.
+
+        The pieces are read in blocks of about block_size characters and the sentences
+        crossing the blocks are put back together, so the sentences are those of
+        ``split_sentences`` on the whole text while only a few blocks are held in
+        memory.
+
+        Parameters
+        ----------
+        pieces : Iterable[str]
+            The consecutive pieces of the text.
+        block_size : int, optional
+            The number of characters split at once, and sent at once to a worker
+            process.
+        n_jobs : int, optional
+            The number of worker processes splitting the blocks, -1 using every CPU. The
+            sentences do not depend on n_jobs.
+
+        Yields
+        ------
+        sentence : str
+            A sentence of the text.
+
+        Examples
+        --------
+        >>> from mintlemon import SentenceSplitter
+        >>> splitter = SentenceSplitter()
+        >>> list(splitter.split_stream(["Dr. Ahmet gel", "di. Ayşe gitti!"]))
+        Output: ["Dr. Ahmet geldi.", "Ayşe gitti!"]
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be a positive integer.")
+        # The context of a block covers the longest prefix of several words ending in
+        # the block.
+        phrases = [
+            phrase for phrases in self._prefix_phrases.values() for phrase in phrases
+        ]
+        context_size = max(map(len, phrases), default=0) + 2
+        blocks = deque()
 
-        return re.split(r"(?<=[.!?])\s", text)
+        def iter_blocks():
+            for context, block in _iter_blocks(pieces, block_size, context_size):
+                blocks.append(block)
+                yield context, block
+
+        # Worker processes get the prefixes of this splitter, a single process uses it
+        # directly.
+        if effective_n_jobs(n_jobs) == 1:
+            function = partial(_block_boundaries, splitter=self)
+        else:
+            function = _block_boundaries
+        parts = []
+        for [boundaries] in imap_chunks(
+            function,
+            iter_blocks(),
+            n_jobs=n_jobs,
+            chunksize=1,
+            initializer=_init_split_worker,
+            initargs=(self._prefix_words, self._prefix_phrases),
+        ):
+            block = blocks.popleft()
+            start = 0
+            for end in boundaries:
+                parts.append(block[start:end])
+                yield "".join(parts)
+                parts = []
+                start = end + 1
+            parts.append(block[start:])
+        yield "".join(parts)
+
+    def split_file(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        encoding: str = "utf-8",
+        block_size: int = 1 << 20,
+        n_jobs: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Lazily yield the sentences of a text file, reading it block by block.
+
+        Parameters
+        ----------
+        path : str or path-like
+            The text file to be split into sentences. Its line endings are kept as they
+            are.
+        encoding : str, optional
+            The encoding of the file.
+        block_size : int, optional
+            The number of characters read and split at once, see ``split_stream``.
+        n_jobs : int, optional
+            The number of worker processes, see ``split_stream``.
+
+        Yields
+        ------
+        sentence : str
+            A sentence of the file.
+
+        Examples
+        --------
+        >>> from mintlemon import SentenceSplitter
+        >>> splitter = SentenceSplitter()
+        >>> for sentence in splitter.split_file("dump.txt", n_jobs=-1):
+        ...     print(sentence)
+        """
+        with open(path, "r", encoding=encoding, newline="") as file:
+            yield from self.split_stream(
+                iter(lambda: file.read(block_size), ""), block_size, n_jobs
+            )
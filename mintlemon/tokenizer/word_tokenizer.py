@@ -0,0 +1,84 @@
+import re
+from typing import Iterator, List
+
+# Letters, digits and the combining marks left behind by lowercasing "İ" with
+# str.lower().
+_WORD_CHAR = r"[\w\u0300-\u036f]"
+
+TOKEN_REGEX = re.compile(
+    # Numbers with decimal, thousands or time separators and their suffixes: 3,5
+    # 1.000.000'dan  12:30'da
+    r"\d+(?:[.,:]\d+)+(?:['’]"
+    + _WORD_CHAR
+    + r"+)*"
+    # Words with apostrophe suffixes, hyphens or inner dots: İstanbul'da  e-posta  x.com
+    r"|"
+    + _WORD_CHAR
+    + r"+(?:[-'’.]"
+    + _WORD_CHAR
+    + r"+)*"
+    # Ellipses and any other punctuation character.
+    r"|\.{2,}|[^\w\s]"
+)
+
+
+class WordTokenizer:
+    """
+    WordTokenizer is a class used for splitting a Turkish text into words and
+    punctuation with a single compiled regular expression.
+
+    Suffixes separated by an apostrophe stay attached to their word ("İstanbul'da",
+    "1990'lı"), as do hyphenated words and decimal numbers ("3,5", "12.30"). Every other
+    punctuation character is a token of its own, except for ellipses. It needs no
+    downloaded models.
+
+    Methods:
+    --------
+    tokenize(text: str) : List[str]
+        Split the given text into tokens.
+    iter_tokens(text: str) : Iterator[str]
+        Lazily yield the tokens of the given text.
+    """
+
+    def tokenize(self, text: str) -> List[str]:
+        """
+        Split the given text into tokens.
+
+        Parameters
+        ----------
+        text : str
+            The input text to be tokenized.
+
+        Returns
+        -------
+        tokens : list
+            A list of tokens.
+
+        Examples
+        --------
+        >>> from mintlemon import WordTokenizer
+        >>> tokenizer = WordTokenizer()
+        >>> tokenizer.tokenize("İstanbul'da 3,5 saat kaldık... Harika!")
+        Output: ["İstanbul'da", "3,5", "saat", "kaldık", "...", "Harika", "!"]
+        """
+        return TOKEN_REGEX.findall(text)
+
+    def iter_tokens(self, text: str) -> Iterator[str]:
+        """
+        Lazily yield the tokens of the given text, without building the whole list.
+
+        Parameters
+        ----------
+        text : str
+            The input text to be tokenized.
+
+        Yields
+        ------
+        token : str
+            The tokens of the text, in order.
+        """
+        for match in TOKEN_REGEX.finditer(text):
+            yield match.group()
+
+    def __call__(self, text: str) -> List[str]:
+        return self.tokenize(text)
@@ -1,12 +1,14 @@
-from setuptools import setup, find_packages
+from setuptools import find_packages, setup
+
 
 def get_long_description():
     with open("README.md", "r", encoding="utf-8") as f:
         return f.read()
 
+
 setup(
     name="mintlemon-turkish-nlp",
-    version = "0.3.2",
+    version="0.3.2",
     description="Mint & Lemon Turkish NLP Library developed by Mint & Lemon Development Team.",
     author="Mint&Lemon",
     license="Apache License, Version 2.0",
@@ -45,11 +47,11 @@ setup(
     package_data={"mintlemon": ["data/*"]},
     include_package_data=True,
     install_requires=[
-        "numpy>=1.20.0",    
-        "regex>=2021.4.4",    
-        "zeyrek>=0.1.3",    
-        "nltk>=3.8.1",    
-        "pandas>=1.3.4",    
+        "numpy>=1.20.0",
+        "regex>=2021.4.4",
+        "zeyrek>=0.1.3,<0.2",
+        "nltk>=3.8.1",
+        "pandas>=1.3.4",
         "scikit-learn>=1.2.0",
     ],
     extras_require={"dev": ["yapf", "bumpver", "flake8", "coverage", "pytest"]},
@@ -0,0 +1,271 @@
+import os
+import pickle
+import random
+import tempfile
+import threading
+import unittest
+
+from mintlemon.normalizer import _builtin
+from mintlemon.normalizer._builtin import (
+    ASCII_PICKLE_PATH,
+    TURKISH_ASCIIFY_TABLE,
+    DeasciifierBuiltin,
+    get_pattern_table,
+)
+from mintlemon.normalizer._deasciifier import Deasciifier
+from mintlemon.normalizer._patterns import PatternAutomaton, PatternTable
+
+with open(ASCII_PICKLE_PATH, "rb") as file:
+    PICKLED_PATTERN_TABLE = pickle.load(file)
+
+
+def reference_deasciifier(text):
+    """Returns a DeasciifierBuiltin matching with the original pickled patterns"""
+    reference = DeasciifierBuiltin(text)
+    reference.turkish_pattern_table = PICKLED_PATTERN_TABLE
+    return reference
+
+
+class TestDeasciifier(unittest.TestCase):
+    """Equivalence tests between Deasciifier and the reference DeasciifierBuiltin"""
+
+    texts = [
+        "",
+        "c",
+        "I",
+        "O sirada bahcede cicekleri kokluyorduk. "
+        "Hersey bahcivanin islik calmasiyla yasandi...",
+        "Opusmegi cagristiran catirtilar.",
+        "SIRADA BAHCEDE CICEKLERI KOKLUYORDUK",
+        "Istanbul'da cok guzel bir gun gecirdik, Izmir'e gitmeyi dusunuyoruz!",
+        "O sırada bahçede çiçekleri kokluyorduk. "
+        "Herşey bahçıvanın ıslık çalmasıyla yaşandı...",
+        "2023 yilinda 15.000 kisi    gorustu;;; --- ugur  ,  sogus   ISIK isik",
+        "cocuk\tgozluk\nsogan\r\nagac ",
+    ]
+
+    def setUp(self):
+        self.deasciifier = Deasciifier()
+
+    def assertEquivalent(self, text):
+        expected = reference_deasciifier(text).convert_to_turkish()
+        self.assertEqual(self.deasciifier.convert(text), expected, msg=repr(text))
+
+    def test_known_texts(self):
+        """Test hand picked texts against the reference implementation"""
+        for text in self.texts:
+            self.assertEquivalent(text)
+
+    def test_long_text(self):
+        """Test a text whose context windows overlap sentence boundaries"""
+        self.assertEquivalent(" ".join(self.texts) * 3)
+
+    def test_random_texts(self):
+        """Test random texts of letters, Turkish letters, digits and punctuation"""
+        alphabet = "abcdefghijklmnopqrstuvwxyzCGIOSUçğıöşüÇĞİÖŞÜ0123456789 .,'-\n"
+        rng = random.Random(1923)
+        for _ in range(50):
+            length = rng.randint(1, 200)
+            self.assertEquivalent("".join(rng.choice(alphabet) for _ in range(length)))
+
+    def test_convert_is_reusable(self):
+        """Test that the same instance converts several texts independently"""
+        first = self.deasciifier.convert(self.texts[3])
+        self.deasciifier.convert(self.texts[6])
+        self.assertEqual(self.deasciifier.convert(self.texts[3]), first)
+
+    def test_text_without_candidates(self):
+        """Test that a text without candidate letters is returned as it is"""
+        deasciifier = Deasciifier()
+        text = "2023 - 15.000 TL, 42 adet * Ahmet Bey"
+        self.assertIs(deasciifier.convert(text), text)
+        self.assertEqual(
+            deasciifier.stats(), {"texts": 1, "characters": len(text), "evaluated": 0}
+        )
+
+    def test_stats(self):
+        """Test that only candidate positions are evaluated"""
+        deasciifier = Deasciifier()
+        deasciifier.convert("Opusmegi cagristiran catirtilar.")
+        self.assertEqual(
+            deasciifier.stats(), {"texts": 1, "characters": 32, "evaluated": 13}
+        )
+        deasciifier.reset_stats()
+        self.assertEqual(
+            deasciifier.stats(), {"texts": 0, "characters": 0, "evaluated": 0}
+        )
+
+
+class TestWordCache(unittest.TestCase):
+    """Differential tests between the cached and the uncached deasciifier"""
+
+    def test_matches_uncached(self):
+        """Test the cached path on known, repeated and random texts"""
+        uncached = Deasciifier()
+        cached = Deasciifier(cache_size=1024)
+        alphabet = "abcdefghijklmnopqrstuvwxyzCGIOSUçğıöşüÇĞİÖŞÜ .,'-\n"
+        rng = random.Random(1453)
+        texts = TestDeasciifier.texts * 2 + [" ".join(TestDeasciifier.texts) * 3]
+        texts += [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 200)))
+            for _ in range(100)
+        ]
+        for text in texts:
+            self.assertEqual(
+                cached.convert(text), uncached.convert(text), msg=repr(text)
+            )
+        self.assertGreater(cached.cache_info()["hits"], 0)
+
+    def test_eviction(self):
+        """Test that the least recently used words are evicted once the cache is full"""
+        deasciifier = Deasciifier(cache_size=2)
+        for text in ["cok", "guzel", "icin", "cok"]:
+            deasciifier.convert(text)
+        self.assertEqual(
+            deasciifier.cache_info(),
+            {"hits": 0, "misses": 4, "maxsize": 2, "currsize": 2},
+        )
+        deasciifier.convert("cok")
+        self.assertEqual(deasciifier.cache_info()["hits"], 1)
+
+    def test_cache_size(self):
+        """Test that the cache is opt-in and can be resized or disabled"""
+        deasciifier = Deasciifier()
+        self.assertIsNone(deasciifier.cache_size)
+        self.assertIsNone(deasciifier.cache_info())
+        deasciifier.set_cache_size(10)
+        self.assertEqual(deasciifier.cache_size, 10)
+        deasciifier.set_cache_size(0)
+        self.assertIsNone(deasciifier.cache_info())
+        with self.assertRaises(ValueError):
+            deasciifier.set_cache_size(-1)
+
+
+class TestPatternAutomaton(unittest.TestCase):
+    """Tests for the compiled pattern automaton"""
+
+    def test_matches_reference_rank_logic(self):
+        """Test every candidate context of a text against turkish_match_pattern"""
+        table = PICKLED_PATTERN_TABLE
+        automata = {
+            letter: PatternAutomaton.from_patterns(patterns)
+            for letter, patterns in table.items()
+        }
+        text = " ".join(TestDeasciifier.texts)
+        reference = reference_deasciifier(text)
+        for point, char in enumerate(text):
+            letter = TURKISH_ASCIIFY_TABLE.get(char, char).lower()
+            if letter in table:
+                context = reference.turkish_get_context(
+                    DeasciifierBuiltin.context_size, point
+                )
+                expected = reference.turkish_match_pattern(table[letter], point)
+                self.assertEqual(
+                    automata[letter].match(context), expected, msg=repr(context)
+                )
+
+    def test_ties_prefer_earlier_start(self):
+        """Test that ties between patterns go to the one starting first"""
+        context = "         aXb"
+        self.assertTrue(
+            PatternAutomaton.from_patterns({"aX": 3, "Xb": -3}).match(context)
+        )
+        self.assertFalse(
+            PatternAutomaton.from_patterns({"aX": -3, "Xb": 3}).match(context)
+        )
+        self.assertFalse(
+            PatternAutomaton.from_patterns({"Xb": 3, "aXb": -3}).match(context)
+        )
+
+    def test_no_match(self):
+        """Test that a context without any pattern keeps the positive default"""
+        self.assertTrue(PatternAutomaton.from_patterns({"zX": -1}).match("          X"))
+
+    def test_patterns_without_placeholder_never_match(self):
+        """Test that patterns that cannot cover the centre of the context are ignored"""
+        automaton = PatternAutomaton.from_patterns({"ab": -1, "XabX": -1, "Xc": 5})
+        self.assertTrue(automaton.match("        abXc"))
+        self.assertEqual(automaton["ab"], -1)
+
+    def test_mapping(self):
+        """Test that the automaton can be used as the dictionary it was compiled from"""
+        patterns = PICKLED_PATTERN_TABLE["g"]
+        automaton = PatternAutomaton.from_patterns(patterns)
+        self.assertEqual(len(automaton), len(patterns))
+        self.assertEqual(dict(automaton.items()), patterns)
+        self.assertIsNone(automaton.get("Xzzzz"))
+        self.assertNotIn(next(iter(patterns))[:-1] + "#", automaton)
+
+
+class TestPatternTable(unittest.TestCase):
+    """Tests for the process-wide deasciifier pattern table"""
+
+    def test_loaded_once(self):
+        """Test that every deasciifier shares the same pattern table"""
+        table = get_pattern_table()
+        self.assertIs(get_pattern_table(), table)
+        self.assertIs(DeasciifierBuiltin("").turkish_pattern_table, table)
+        self.assertIs(Deasciifier().pattern_table, table)
+
+    def test_concurrent_first_load(self):
+        """Test that threads racing on the first load all receive the same table"""
+        self.addCleanup(setattr, _builtin, "_pattern_table", _builtin._pattern_table)
+        _builtin._pattern_table = None
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_pattern_table()))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_binary_file_matches_pickle(self):
+        """Test that the shipped pattern file holds the patterns of the pickle"""
+        table = get_pattern_table()
+        self.assertEqual(set(table), set(PICKLED_PATTERN_TABLE))
+        for letter, patterns in PICKLED_PATTERN_TABLE.items():
+            self.assertEqual(dict(table[letter].items()), patterns)
+
+    def test_save_and_load(self):
+        """Test that a saved table is memory-mapped back to identical automata"""
+        compiled = PatternTable.from_dict(PICKLED_PATTERN_TABLE)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "patterns.bin")
+            compiled.save(path)
+            loaded = PatternTable.load(path)
+            for letter, automaton in compiled.items():
+                for name in (
+                    "transitions",
+                    "best_ranks",
+                    "best_lengths",
+                    "ranks",
+                    "depths",
+                ):
+                    self.assertEqual(
+                        bytes(getattr(loaded[letter], name)),
+                        bytes(getattr(automaton, name)),
+                    )
+                self.assertEqual(loaded[letter].alphabet, automaton.alphabet)
+                self.assertEqual(len(loaded[letter]), len(automaton))
+            del loaded
+
+    def test_load_rejects_other_files(self):
+        """Test that loading a file that is not a pattern file raises ValueError"""
+        with self.assertRaises(ValueError):
+            PatternTable.load(ASCII_PICKLE_PATH)
+
+    def test_builtin_uses_binary_table(self):
+        """Test that DeasciifierBuiltin gives the same result with the binary table"""
+        text = " ".join(TestDeasciifier.texts)
+        self.assertEqual(
+            DeasciifierBuiltin(text).convert_to_turkish(),
+            reference_deasciifier(text).convert_to_turkish(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import subprocess
+import sys
+import unittest
+
+HEAVY_MODULES = ("zeyrek", "pandas", "sklearn", "nltk", "numpy", "scipy")
+
+
+def imported_modules(code):
+    """Runs code in a fresh interpreter and returns the heavy modules it imported"""
+    script = (
+        code
+        + "\nimport sys\n"
+        + f"print(','.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    return set(filter(None, output.strip().split(",")))
+
+
+class TestImports(unittest.TestCase):
+    """Tests that importing mintlemon stays cheap"""
+
+    def test_import_is_light(self):
+        """Test that the package and its light classes import no heavy dependency"""
+        code = "\n".join(
+            [
+                "import mintlemon",
+                "from mintlemon import Normalizer, SentenceSplitter, Deasciifier",
+                "from mintlemon.normalizer import Normalizer",
+                "Normalizer.lower_case('İSTANBUL')",
+                "SentenceSplitter().split_sentences('Bir. İki.')",
+            ]
+        )
+        self.assertEqual(imported_modules(code), set())
+
+    def test_text_root_dtm_vectorizer_is_lazy(self):
+        """Test that TextRootDTMVectorizer is still available from both packages"""
+        import mintlemon
+        import mintlemon.normalizer
+        from mintlemon.normalizer.text_to_root_dtm import TextRootDTMVectorizer
+
+        self.assertIs(mintlemon.TextRootDTMVectorizer, TextRootDTMVectorizer)
+        self.assertIs(mintlemon.normalizer.TextRootDTMVectorizer, TextRootDTMVectorizer)
+        self.assertIn("TextRootDTMVectorizer", dir(mintlemon))
+        self.assertIs(
+            mintlemon.HashingRootVectorizer,
+            mintlemon.normalizer.text_to_root_dtm.HashingRootVectorizer,
+        )
+        with self.assertRaises(AttributeError):
+            mintlemon.DoesNotExist
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,11 @@
+import itertools
+import random
+import re
 import unittest
+import warnings
 
 from mintlemon import Normalizer
+from mintlemon.normalizer._builtin import NormBuiltin
 
 
 class TestNormalizer(unittest.TestCase):
@@ -15,12 +20,90 @@ class TestNormalizer(unittest.TestCase):
         self.text_accent_marks = "merhâbâ"
         self.text_norm_turkish_chars = "Gazi Üniversitesi'ne hoş geldiniz."
         self.text_with_mixed_numbers = "Bu cümle 12.34 ile başlıyor ve 56 ile bitiyor. 2,5 +3,5 -3,4 ile ilgili bir şeyler söyleyebiliriz."
-        self.text_with_extra_spaces = "Ahmet Selam,  Nerelerdeydin? Seni ÇOOOOK      ÖZLEDİK!!!"
+        self.text_with_extra_spaces = (
+            "Ahmet Selam,  Nerelerdeydin? Seni ÇOOOOK      ÖZLEDİK!!!"
+        )
 
     def test_lower_case(self):
         """Test the lower_case() method"""
         self.assertEqual(self.normalizer.lower_case(self.text_low), "ex: iığüöşç")
 
+    def test_many(self):
+        """Test the remove_punctuations_many(), remove_numbers_many() and
+        num_to_tr_text_many() methods"""
+        import numpy
+        import pandas
+
+        texts = [
+            self.text_with_punctuations,
+            self.text_with_numbers,
+            self.text_with_extra_spaces,
+            "3 elma",
+        ]
+        for many, single in [
+            (
+                self.normalizer.remove_punctuations_many,
+                self.normalizer.remove_punctuations,
+            ),
+            (self.normalizer.remove_numbers_many, self.normalizer.remove_numbers),
+            (self.normalizer.num_to_tr_text_many, self.normalizer.num_to_tr_text),
+        ]:
+            expected = [single(text) for text in texts]
+            self.assertEqual(many(texts), expected)
+            self.assertEqual(many(iter(texts)), expected)
+            self.assertEqual(many(numpy.array(texts)).tolist(), expected)
+            series = many(pandas.Series(texts, index=[4, 3, 2, 1]))
+            self.assertEqual(series.tolist(), expected)
+            self.assertEqual(series.index.tolist(), [4, 3, 2, 1])
+            with self.assertRaises(TypeError):
+                many(pandas.DataFrame({"text": texts}))
+        self.assertEqual(
+            self.normalizer.remove_numbers_many(texts, remove_signed=False),
+            [
+                self.normalizer.remove_numbers(text, remove_signed=False)
+                for text in texts
+            ],
+        )
+
+    def test_lower_case_turkish_capitals(self):
+        """Test lower_case against replacing Turkish capitals before str.lower()"""
+        text = "ÇAĞRI İLE IŞIK ÖĞÜŞ Ç ΟΔΟΣ Ş" * 3
+        expected = text
+        for capital, small in zip("İIĞÜÖŞÇ", "iığüöşç"):
+            expected = expected.replace(capital, small)
+        self.assertEqual(self.normalizer.lower_case(text), expected.lower())
+
+    def test_remove_accent_marks_mapping(self):
+        """Test that custom mappings are applied one replacement after the other"""
+        self.assertEqual(
+            self.normalizer.remove_accent_marks("âab", {"â": "a", "a": "e"}), "eeb"
+        )
+        self.assertEqual(
+            self.normalizer.remove_accent_marks("âab", {"a": "e", "â": "a"}), "aeb"
+        )
+        self.assertEqual(
+            self.normalizer.remove_accent_marks("ââb", {"ââ": "a", "ab": "x"}), "x"
+        )
+
+    def test_remove_accent_marks_large_mapping(self):
+        """Test that large custom mappings are compiled once and give the same result"""
+        from mintlemon.normalizer._mapping import MAX_REPLACEMENTS, compile_replacements
+
+        mapping = {
+            chr(0x4E00 + index): chr(0x4E00 + index + 1)
+            for index in range(MAX_REPLACEMENTS + 1)
+        }
+        text = "".join(mapping)[::7] + " merhâbâ"
+        expected = text
+        for mark, letter in mapping.items():
+            expected = expected.replace(mark, letter)
+        compile_replacements.cache_clear()
+        for _ in range(3):
+            self.assertEqual(
+                self.normalizer.remove_accent_marks(text, mapping), expected
+            )
+        self.assertEqual(compile_replacements.cache_info().hits, 2)
+
     def test_remove_punctuations(self):
         """Test the remove_punctuations() method"""
         self.assertEqual(
@@ -48,6 +131,38 @@ class TestNormalizer(unittest.TestCase):
             "O sırada bahçede çiçekleri kokluyorduk. Herşey bahçıvanın ıslık çalmasıyla yaşandı...",
         )
 
+    def test_deasciify_batch(self):
+        """Test the deasciify_batch() and deasciify_iter() methods"""
+        texts = [
+            self.text_deasc,
+            "",
+            "Opusmegi cagristiran catirtilar.",
+            self.text_low,
+        ] * 3
+        expected = [self.normalizer.deasciify(text) for text in texts]
+        self.assertEqual(self.normalizer.deasciify_batch(texts), expected)
+        self.assertEqual(
+            self.normalizer.deasciify_batch(texts, n_jobs=2, chunksize=2), expected
+        )
+        self.assertEqual(
+            list(self.normalizer.deasciify_iter(iter(texts), n_jobs=2, chunksize=3)),
+            expected,
+        )
+
+    def test_deasciify_cache(self):
+        """Test the set_deasciify_cache() and deasciify_cache_info() methods"""
+        expected = self.normalizer.deasciify(self.text_deasc)
+        self.normalizer.set_deasciify_cache(1000)
+        try:
+            self.assertEqual(self.normalizer.deasciify(self.text_deasc), expected)
+            self.assertEqual(self.normalizer.deasciify(self.text_deasc), expected)
+            info = self.normalizer.deasciify_cache_info()
+            self.assertEqual(info["hits"], info["misses"])
+            self.assertEqual(info["maxsize"], 1000)
+        finally:
+            self.normalizer.set_deasciify_cache(None)
+        self.assertIsNone(self.normalizer.deasciify_cache_info())
+
     def test_normalize_turkish_chars(self):
         """Test the normalize_turkish_chars() method"""
         self.assertEqual(
@@ -62,20 +177,357 @@ class TestNormalizer(unittest.TestCase):
             "Bu cümle ile başlıyor ve ile bitiyor. ile ilgili bir şeyler söyleyebiliriz.",
         )
 
+    def test_collapse_whitespace(self):
+        """Test that remove_punctuations() and remove_numbers() collapse whitespace"""
+        rng = random.Random(0)
+        for _ in range(2000):
+            text = "".join(rng.choices(" \t\n\xa0\u3000,.!a1", k=rng.randrange(12)))
+            self.assertEqual(
+                self.normalizer.remove_punctuations(text),
+                " ".join(re.sub(r"[^\w\s.,']", "", text).split()),
+            )
+            self.assertEqual(
+                self.normalizer.remove_numbers(
+                    text, remove_signed=False, remove_decimal=False
+                ),
+                " ".join(re.sub(r"\d+", "", text).replace(",", " ").split()),
+            )
+
     def test_remove_more_space(self):
-        self.assertEqual(self.normalizer.remove_more_space(self.text_with_extra_spaces), "Ahmet Selam, Nerelerdeydin? Seni ÇOOOOK ÖZLEDİK!!!")
-        
+        self.assertEqual(
+            self.normalizer.remove_more_space(self.text_with_extra_spaces),
+            "Ahmet Selam, Nerelerdeydin? Seni ÇOOOOK ÖZLEDİK!!!",
+        )
+
     def test_drop_empty_values(self):
         """Test the drop_empty_values() method"""
-        data = {'id': [1, 2, 3, 4, 5],
-                'name': ['Şeyma', 'Murat', 'Elif', 'Tarık Kaan', 'Erdinç'],
-                'text': ['Bilgisayar Mühendisi', 'Doç. Dr', '', 'Yazılım Mühendisi', '']}
+        data = {
+            "id": [1, 2, 3, 4, 5],
+            "name": ["Şeyma", "Murat", "Elif", "Tarık Kaan", "Erdinç"],
+            "text": ["Bilgisayar Mühendisi", "Doç. Dr", "", "Yazılım Mühendisi", ""],
+        }
         df = pd.DataFrame(data)
 
-        expected_output = pd.DataFrame({'id': [1, 2, 4],
-                                        'name': ['Şeyma', 'Murat', 'Tarık Kaan'],
-                                        'text': ['Bilgisayar Mühendisi', 'Doç. Dr', 'Yazılım Mühendisi']})
+        expected_output = pd.DataFrame(
+            {
+                "id": [1, 2, 4],
+                "name": ["Şeyma", "Murat", "Tarık Kaan"],
+                "text": ["Bilgisayar Mühendisi", "Doç. Dr", "Yazılım Mühendisi"],
+            }
+        )
 
-        cleaned_df = self.normalizer.drop_empty_values(df, 'text')
+        cleaned_df = self.normalizer.drop_empty_values(df, "text")
 
         self.assertTrue(expected_output.equals(cleaned_df))
+
+
+class TestNumberToWords(unittest.TestCase):
+    """Tests for the conversion of numbers to words"""
+
+    ONES = ["", "bir", "iki", "üç", "dört", "beş", "altı", "yedi", "sekiz", "dokuz"]
+    TENS = [
+        "",
+        "on",
+        "yirmi",
+        "otuz",
+        "kırk",
+        "elli",
+        "altmış",
+        "yetmiş",
+        "seksen",
+        "doksan",
+    ]
+    SCALES = ["", "bin", "milyon", "milyar", "trilyon", "katrilyon", "kentilyon"]
+
+    def spell(self, number):
+        """Spells a number digit by digit from its decimal string"""
+        if number == 0:
+            return "sıfır"
+        digits = str(abs(number))
+        digits = "0" * (-len(digits) % 3) + digits
+        words = []
+        for scale, start in zip(
+            reversed(range(len(digits) // 3)), range(0, len(digits), 3)
+        ):
+            hundreds, tens, ones = map(int, digits[start : start + 3])
+            group = [
+                self.ONES[hundreds] + " yüz"
+                if hundreds > 1
+                else "yüz"
+                if hundreds
+                else "",
+                self.TENS[tens],
+                self.ONES[ones],
+            ]
+            group = " ".join(word for word in group if word)
+            if group:
+                words.append(group + " " + self.SCALES[scale] if scale else group)
+        return ("eksi " if number < 0 else " ") + " ".join(words)
+
+    def test_small_numbers(self):
+        """Test every number with up to four digits"""
+        for number in range(-9999, 10000):
+            self.assertEqual(NormBuiltin.number_to_word(number), self.spell(number))
+
+    def test_full_range(self):
+        """Test numbers of every length and the powers of ten up to 10**21"""
+        rng = random.Random(0)
+        numbers = [
+            rng.randrange(10 ** (digits - 1), 10**digits)
+            for digits in range(1, 22)
+            for _ in range(200)
+        ]
+        numbers += [
+            10**power + offset for power in range(21) for offset in (-1, 0, 1)
+        ]
+        for number in numbers:
+            self.assertEqual(NormBuiltin.number_to_word(number), self.spell(number))
+            self.assertEqual(NormBuiltin.number_to_word(-number), self.spell(-number))
+        self.assertEqual(NormBuiltin.number_to_word(str(10**20)), " yüz kentilyon")
+        for number in (10**21, -(10**21)):
+            with self.assertRaises(ValueError):
+                NormBuiltin.number_to_word(number)
+        with self.assertRaises(TypeError):
+            NormBuiltin.number_to_word(2.5)
+
+    def test_num_to_tr_text_precision(self):
+        """Test that numbers above 2**53 are converted without rounding"""
+        self.assertEqual(
+            Normalizer.num_to_tr_text("Toplam 9007199254740993 TL"),
+            "Toplam dokuz katrilyon yedi trilyon yüz doksan dokuz milyar iki yüz elli "
+            "dört milyon yedi yüz kırk bin dokuz yüz doksan üç TL",
+        )
+        self.assertEqual(Normalizer.num_to_tr_text("-1005 TL"), "eksi bir bin beş TL")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.assertEqual(
+                Normalizer.num_to_tr_text("1000000000000000000000 TL"), "TL"
+            )
+        self.assertEqual(len(caught), 1)
+
+    def test_num_to_tr_text_decimal_spaces(self):
+        """Test that a decimal comma followed by spaces gives a single space"""
+        self.assertEqual(Normalizer.num_to_tr_text("8, 0"), "sekiz virgül sıfır")
+        self.assertEqual(Normalizer.num_to_tr_text("8,0"), "sekiz virgül sıfır")
+        self.assertEqual(
+            Normalizer.num_to_tr_text("Fiyat 2,  5 TL\n3 adet"),
+            "Fiyat iki virgül beş TL üç adet",
+        )
+
+    def test_num_to_tr_text_separated_digits(self):
+        """Test that only a dot joins digits into a single number"""
+        self.assertEqual(Normalizer.num_to_tr_text("a'3 b"), "a' üç b")
+        self.assertEqual(Normalizer.num_to_tr_text("2+3"), "iki üç")
+        self.assertEqual(Normalizer.num_to_tr_text("ğ7"), "ğ yedi")
+        self.assertEqual(
+            Normalizer.num_to_tr_text("123 456"), "yüz yirmi üç dört yüz elli altı"
+        )
+        self.assertEqual(
+            Normalizer.num_to_tr_text("Sıcaklık -5 ile 0 arası"),
+            "Sıcaklık eksi beş ile sıfır arası",
+        )
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.assertEqual(
+                Normalizer.num_to_tr_text("Toplam 2.5 kilo"), "Toplam kilo"
+            )
+        self.assertEqual(len(caught), 1)
+
+    def test_numbers_to_words_many(self):
+        """Test the numbers_to_words_many() method"""
+        import numpy
+        import pandas
+
+        numbers = [0, 3, -12, 1000000, "250"]
+        expected = ["sıfır", "üç", "eksi on iki", "bir milyon", "iki yüz elli"]
+        self.assertEqual(Normalizer.numbers_to_words_many(numbers), expected)
+        self.assertEqual(
+            Normalizer.numbers_to_words_many(numpy.array([0, 3, -12])).tolist(),
+            expected[:3],
+        )
+        series = pandas.Series([3, 1000000], index=["a", "b"])
+        self.assertEqual(
+            Normalizer.numbers_to_words_many(series).to_dict(),
+            {"a": "üç", "b": "bir milyon"},
+        )
+        with self.assertRaises(TypeError):
+            Normalizer.numbers_to_words_many([2.5])
+
+
+class TestNormalizationPipeline(unittest.TestCase):
+    """Differential tests between Normalizer.pipeline and calling the steps in turn"""
+
+    steps = [
+        "lower_case",
+        "remove_accent_marks",
+        "remove_punctuations",
+        "remove_numbers",
+        "normalize_chars",
+        "remove_stopwords",
+    ]
+
+    def setUp(self):
+        alphabet = "abcçdefgğhıijklmnoöprsştuüvyzABCÇĞIİÖŞÜâîûÂÎ0123456789 ,.;!?'-+\t\n"
+        rng = random.Random(2023)
+        self.texts = [
+            "",
+            " ,, ,a, ",
+            "ΟΔΟΣ ΣΑΣ",
+            "Bu bir örnek cümle, 12.34 ile -3,4 ve +5 arasında bir şey!",
+            "Ahmet Selam,  Nerelerdeydin? Seni ÇOOOOK      ÖZLEDİK!!!",
+        ]
+        self.texts += [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 80)))
+            for _ in range(20)
+        ]
+
+    def assertSameAsSequential(self, steps):
+        pipeline = Normalizer.pipeline(steps)
+        for text in self.texts:
+            expected = text
+            for step in steps:
+                name, kwargs = (step, {}) if isinstance(step, str) else step
+                expected = getattr(Normalizer, name)(expected, **kwargs)
+            self.assertEqual(pipeline(text), expected, msg=f"{steps!r} {text!r}")
+
+    def test_step_orders(self):
+        """Test every ordering of up to three steps"""
+        for length in range(1, 4):
+            for steps in itertools.permutations(self.steps, length):
+                self.assertSameAsSequential(steps)
+
+    def test_all_steps(self):
+        """Test the full chain in a few orders"""
+        self.assertSameAsSequential(self.steps)
+        self.assertSameAsSequential(self.steps[::-1])
+        self.assertSameAsSequential(self.steps[2:] + self.steps[:2])
+
+    def test_step_arguments(self):
+        """Test steps given with keyword arguments"""
+        self.assertSameAsSequential(
+            [
+                (
+                    "remove_accent_marks",
+                    {"accent_mapping": {"â": "a", "a": "e", "ğ": "gh"}},
+                ),
+                ("remove_accent_marks", {"accent_mapping": {"ab": "x"}}),
+                ("remove_numbers", {"remove_signed": False}),
+                ("normalize_chars", {"translation_table": str.maketrans("ıi", "iı")}),
+                ("remove_stopwords", {"stopwords": ["bir", "ve"]}),
+                "lower_case",
+            ]
+        )
+
+    def test_plan(self):
+        """Test that character mappings are merged and whitespace is cleaned up once"""
+        pipeline = Normalizer.pipeline(
+            [
+                "remove_accent_marks",
+                "normalize_chars",
+                "remove_punctuations",
+                "remove_numbers",
+                "remove_stopwords",
+            ]
+        )
+        self.assertEqual(pipeline.plan, ["map", "delete", "delete", "squeeze", "words"])
+
+    def test_unknown_step(self):
+        """Test that an unknown step raises ValueError"""
+        with self.assertRaises(ValueError):
+            Normalizer.pipeline(["lower_case", "stem"])
+
+
+class TestTokenSequence(unittest.TestCase):
+    """Differential tests between Normalizer.tokens steps and the Normalizer methods"""
+
+    steps = [
+        "lower_case",
+        "remove_accent_marks",
+        "remove_punctuations",
+        "remove_numbers",
+        "normalize_chars",
+        "remove_stopwords",
+    ]
+
+    def setUp(self):
+        alphabet = "abcçdefgğhıijklmnoöprsştuüvyzABCÇĞIİÖŞÜâîûÂÎ0123456789 ,.;!?'-+\t\n"
+        rng = random.Random(2024)
+        self.texts = [
+            "",
+            " ,, ,a, ",
+            "Bu bir örnek cümle, 12.34 ile -3,4 ve +5 arasında bir şey!",
+        ]
+        self.texts += [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 80)))
+            for _ in range(20)
+        ]
+
+    def assertSameAsSequential(self, steps):
+        for text in self.texts:
+            expected = text
+            tokens = Normalizer.tokens(text)
+            for step in steps:
+                name, kwargs = (step, {}) if isinstance(step, str) else step
+                expected = getattr(Normalizer, name)(expected, **kwargs)
+                tokens = getattr(tokens, name)(**kwargs)
+            self.assertEqual(
+                tokens.join(), " ".join(expected.split()), msg=f"{steps!r} {text!r}"
+            )
+
+    def test_step_orders(self):
+        """Test every ordering of up to three steps"""
+        for length in range(1, 4):
+            for steps in itertools.permutations(self.steps, length):
+                self.assertSameAsSequential(steps)
+
+    def test_step_arguments(self):
+        """Test steps given with keyword arguments, which may not keep the offsets"""
+        self.assertSameAsSequential(
+            [
+                (
+                    "remove_accent_marks",
+                    {"accent_mapping": {"â": "a", "a": "e", "ğ": "gh"}},
+                ),
+                "lower_case",
+                ("remove_numbers", {"remove_signed": False}),
+                ("normalize_chars", {"translation_table": str.maketrans("ıi", "iı")}),
+                ("remove_stopwords", {"stopwords": ["bir", "ve"]}),
+                "lower_case",
+            ]
+        )
+
+    def test_deasciify(self):
+        """Test that the tokens are deasciified as the text is"""
+        text = "Bugun hava cok guzel, disari cikalim mi?"
+        self.assertEqual(
+            Normalizer.tokens(text).deasciify().join(), Normalizer.deasciify(text)
+        )
+        tokens = (
+            Normalizer.tokens("Bugun, hava cok guzel!")
+            .remove_punctuations()
+            .deasciify()
+        )
+        self.assertEqual(tokens.join(), Normalizer.deasciify("Bugun, hava cok guzel"))
+
+    def test_offsets(self):
+        """Test that the tokens keep the offsets of the tokens they come from"""
+        text = "Bu  İSTANBUL'da 2,5 gün kaldık!"
+        tokens = Normalizer.tokens(text)
+        self.assertEqual(list(tokens), ["Bu", "İSTANBUL'da", "2,5", "gün", "kaldık!"])
+        self.assertEqual([text[start:end] for start, end in tokens.spans], list(tokens))
+
+        normalized = (
+            tokens.lower_case()
+            .remove_stopwords()
+            .remove_numbers()
+            .remove_punctuations()
+        )
+        self.assertEqual(list(normalized), ["istanbul'da", "gün", "kaldık"])
+        self.assertEqual(normalized.spans, [(4, 15), (20, 23), (24, 31)])
+        self.assertIs(normalized.spans, normalized.spans)
+        self.assertEqual(list(tokens), ["Bu", "İSTANBUL'da", "2,5", "gün", "kaldık!"])
+
+        split = Normalizer.tokens(text, split_punctuation=True)
+        self.assertEqual(
+            list(split), ["Bu", "İSTANBUL'da", "2,5", "gün", "kaldık", "!"]
+        )
@@ -0,0 +1,121 @@
+import random
+import unittest
+import warnings
+
+import pandas as pd
+
+from mintlemon import Normalizer
+
+# Registers the Series.mintlemon accessor.
+from mintlemon.normalizer import pandas_accessor  # noqa: F401
+
+
+class TestNormalizerAccessor(unittest.TestCase):
+    """Tests for the mintlemon pandas Series accessor"""
+
+    TEXTS = [
+        "Merhâbâ DÜNYA!!! Bugün 2,5 kilo elma aldım.",
+        "  #Selam,  nasılsın?\tİYİ misin ?  ",
+        "",
+        "ΟΔΟΣ ΣΑΣ, Işık ve İstanbul; -3,4 +12.5 ile 1000 ",
+        "bu bir örnek ve gereksiz kelimeler için",
+        "Hersey bahcivanin islik calmasiyla yasandi...",
+        "123 elma 456 armut",
+        "   ",
+        ",,, ve ,,,",
+        "Σ 'Σ' AΣ. ÇOOOOK GÜZEL   ÖZLEDİK",
+    ]
+
+    def setUp(self):
+        rng = random.Random(0)
+        texts = self.TEXTS + [" ".join(rng.choices(self.TEXTS, k=3)) for _ in range(50)]
+        self.series = pd.Series(
+            texts, index=[f"row{index % 7}" for index in range(len(texts))], name="text"
+        )
+
+    def assertSameAsApply(self, result, function, series=None):
+        series = self.series if series is None else series
+        self.assertEqual(result.tolist(), [function(text) for text in series])
+        pd.testing.assert_index_equal(result.index, series.index)
+        self.assertEqual(result.name, series.name)
+
+    def test_steps(self):
+        """Test that every step matches the Normalizer method applied to every text"""
+        accessor = self.series.mintlemon
+        self.assertSameAsApply(accessor.lower_case(), Normalizer.lower_case)
+        self.assertSameAsApply(
+            accessor.remove_accent_marks(), Normalizer.remove_accent_marks
+        )
+        self.assertSameAsApply(accessor.normalize_chars(), Normalizer.normalize_chars)
+        self.assertSameAsApply(
+            accessor.remove_punctuations(), Normalizer.remove_punctuations
+        )
+        self.assertSameAsApply(accessor.remove_numbers(), Normalizer.remove_numbers)
+        self.assertSameAsApply(
+            accessor.remove_numbers(remove_signed=False, remove_decimal=False),
+            lambda text: Normalizer.remove_numbers(
+                text, remove_signed=False, remove_decimal=False
+            ),
+        )
+        self.assertSameAsApply(accessor.remove_stopwords(), Normalizer.remove_stopwords)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.assertSameAsApply(accessor.num_to_tr_text(), Normalizer.num_to_tr_text)
+        self.assertSameAsApply(accessor.deasciify(), Normalizer.deasciify)
+        steps = [
+            "lower_case",
+            "remove_punctuations",
+            ("remove_numbers", {"remove_decimal": False}),
+        ]
+        self.assertSameAsApply(accessor.pipeline(steps), Normalizer.pipeline(steps))
+
+    def test_arguments(self):
+        """Test custom mappings and stop words"""
+        accessor = self.series.mintlemon
+        mapping = {"â": "a", "ş": "sh", "ΟΔ": "od"}
+        self.assertSameAsApply(
+            accessor.remove_accent_marks(mapping),
+            lambda text: Normalizer.remove_accent_marks(text, mapping),
+        )
+        table = str.maketrans("çı", "ci", "!")
+        self.assertSameAsApply(
+            accessor.normalize_chars(table),
+            lambda text: Normalizer.normalize_chars(text, table),
+        )
+        stopwords = ["Ve", "kilo"]
+        self.assertSameAsApply(
+            accessor.remove_stopwords(stopwords),
+            lambda text: Normalizer.remove_stopwords(text, stopwords),
+        )
+
+    def test_missing_values_and_dtypes(self):
+        """Test that missing values are kept and string dtypes are preserved"""
+        series = pd.Series(["İYİ", None, "Işık", float("nan")], dtype=object)
+        result = series.mintlemon.lower_case()
+        self.assertEqual(result.tolist()[0::2], ["iyi", "ışık"])
+        self.assertIsNone(result[1])
+        self.assertTrue(pd.isna(result[3]))
+
+        strings = pd.Series(["İYİ", None, "Işık"], dtype="string")
+        result = strings.mintlemon.remove_punctuations().mintlemon.lower_case()
+        self.assertEqual(result.dtype, strings.dtype)
+        self.assertEqual(result.isna().tolist(), [False, True, False])
+        self.assertEqual(result.dropna().tolist(), ["iyi", "ışık"])
+
+        categories = pd.Series(["A!", "B", "A!"], dtype="category")
+        self.assertEqual(
+            categories.mintlemon.remove_punctuations().tolist(), ["A", "B", "A"]
+        )
+        self.assertEqual(
+            pd.Series([], dtype=object).mintlemon.lower_case().tolist(), []
+        )
+
+    def test_deasciify_n_jobs(self):
+        """Test that deasciifying in worker processes gives the same texts"""
+        self.assertSameAsApply(
+            self.series.mintlemon.deasciify(n_jobs=2, chunksize=8), Normalizer.deasciify
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import os
+import pickle
+import tempfile
+import threading
+import unittest
+
+from mintlemon import RootCache
+
+
+class TestRootCache(unittest.TestCase):
+    """Tests for the RootCache class"""
+
+    def setUp(self):
+        self.calls = []
+
+    def analyze(self, word):
+        self.calls.append(word)
+        return None if word == "," else word[:3]
+
+    def test_distinct_words_are_analyzed_once(self):
+        """Test that repeated words, including words without a root, hit the cache"""
+        cache = RootCache()
+        words = ["kitaplar", ",", "kitaplar", "evler", ",", "kitaplar"]
+        roots = [cache.get(word, self.analyze) for word in words]
+        self.assertEqual(roots, ["kit", None, "kit", "evl", None, "kit"])
+        self.assertEqual(self.calls, ["kitaplar", ",", "evler"])
+        self.assertEqual(
+            cache.stats(), {"hits": 3, "misses": 3, "maxsize": 2**18, "currsize": 3}
+        )
+
+    def test_lru_eviction(self):
+        """Test that the least recently used word is evicted first"""
+        cache = RootCache(maxsize=2)
+        for word in ["a1", "b1", "a1", "c1"]:
+            cache.get(word, self.analyze)
+        self.assertIn("a1", cache)
+        self.assertNotIn("b1", cache)
+        self.assertEqual(len(cache), 2)
+        with self.assertRaises(ValueError):
+            RootCache(maxsize=0)
+
+    def test_save_and_load(self):
+        """Test that a saved cache is loaded back by a new cache with the same path"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "roots.json")
+            cache = RootCache(path=path)
+            cache.get("İstanbul'da", self.analyze)
+            cache.get(",", self.analyze)
+            cache.save()
+
+            loaded = RootCache(path=path)
+            self.assertEqual(loaded.get("İstanbul'da", self.analyze), "İst")
+            self.assertIsNone(loaded.get(",", self.analyze))
+            self.assertEqual(self.calls, ["İstanbul'da", ","])
+            self.assertEqual(os.listdir(directory), ["roots.json"])
+        with self.assertRaises(ValueError):
+            RootCache().save()
+
+    def test_update(self):
+        """Test that roots found elsewhere are added to the cache"""
+        cache = RootCache(maxsize=2)
+        cache.update({"kitaplar": "kitap", "evler": "ev", ",": None})
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn("kitaplar", cache)
+        self.assertIsNone(cache.get(",", self.analyze))
+        self.assertEqual(self.calls, [])
+        cache.update({"evler": "ev"}, hits=4, misses=1)
+        self.assertEqual(cache.stats()["hits"], 5)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_pickle(self):
+        """Test that a pickled cache keeps its roots and gets a lock of its own"""
+        cache = RootCache(maxsize=10)
+        cache.get("İstanbul'da", self.analyze)
+        restored = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(restored.get("İstanbul'da", self.analyze), "İst")
+        self.assertEqual(self.calls, ["İstanbul'da"])
+        self.assertEqual(restored.maxsize, 10)
+
+    def test_shared_between_threads(self):
+        """Test that threads sharing a cache see consistent counters"""
+        cache = RootCache()
+        words = [f"kelime{index % 50}" for index in range(1000)]
+        threads = [
+            threading.Thread(
+                target=lambda: [cache.get(word, self.analyze) for word in words]
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = cache.stats()
+        self.assertEqual(stats["hits"] + stats["misses"], 4000)
+        self.assertEqual(stats["currsize"], 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
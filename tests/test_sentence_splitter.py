@@ -1,4 +1,9 @@
 # -*- coding: utf-8 -*-
+import mmap
+import os
+import random
+import tempfile
+import types
 import unittest
 
 from mintlemon import SentenceSplitter
@@ -34,5 +39,212 @@ class TestSentenceSplitter(unittest.TestCase):
             "Dr Öztürk, özellikle kalp ve damar cerrahisi alanında uzmanlaşmıştır ve uluslararası çok sayıda makale yazmıştır.",
             "Ayrıca Dr Öztürk, Türk Kardiyoloji Derneği üyesidir ve derneğin yönetim kurulu üyesi olarak görev yapmaktadır.",
         ]
-        
+
         self.assertEqual(self.splitter.split_sentences(text), expected_output)
+
+    def test_split_sentences_many(self):
+        """
+        Test that split_sentences_many gives the same sentences as split_sentences for
+        every text.
+        """
+        texts = [
+            "Dr Ahmet geldi. Sonra gitti!",
+            "Tek cümle.",
+            "Prof. Dr. Ayşe Hanım. Selam?",
+        ]
+        self.assertEqual(
+            self.splitter.split_sentences_many(texts),
+            [self.splitter.split_sentences(text) for text in texts],
+        )
+
+    def test_non_breaking_prefixes(self):
+        """
+        Test that the dots of non-breaking prefixes do not end sentences and that the
+        sentences keep the original text.
+        """
+        text = (
+            "Bu Prof. Dr. Ahmet geldi. Ph.D. derecesi var. Saat 5. "
+            "Ar. Gör. Ayşe de geldi mi? Evet!  Tamam."
+        )
+        expected_output = [
+            "Bu Prof. Dr. Ahmet geldi.",
+            "Ph.D. derecesi var.",
+            "Saat 5. Ar. Gör. Ayşe de geldi mi?",
+            "Evet!",
+            " Tamam.",
+        ]
+        self.assertEqual(self.splitter.split_sentences(text), expected_output)
+        self.assertEqual(self.splitter.split_sentences("Dr. Ahmet."), ["Dr. Ahmet."])
+        self.assertEqual(self.splitter.split_sentences(""), [""])
+
+    def test_iter_spans(self):
+        """
+        Test that the spans index the sentences in the original text, whether it is a
+        str or UTF-8 encoded bytes.
+        """
+        text = "Doç. Dr. Şükrü Öztürk geldi. Ar. Gör. Ayşe de geldi mi? Evet!"
+        sentences = self.splitter.split_sentences(text)
+        spans = self.splitter.iter_spans(text)
+        self.assertIsInstance(spans, types.GeneratorType)
+        self.assertEqual([text[start:end] for start, end in spans], sentences)
+        self.assertEqual(list(self.splitter.iter_sentences(text)), sentences)
+
+        encoded = text.encode("utf-8")
+        expected = [sentence.encode("utf-8") for sentence in sentences]
+        self.assertEqual(
+            [encoded[start:end] for start, end in self.splitter.iter_spans(encoded)],
+            expected,
+        )
+        view = memoryview(encoded)
+        views = list(self.splitter.iter_sentences(view))
+        self.assertTrue(all(isinstance(sentence, memoryview) for sentence in views))
+        self.assertEqual([bytes(sentence) for sentence in views], expected)
+
+        with tempfile.TemporaryFile() as file:
+            file.write(encoded)
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.assertEqual(list(self.splitter.iter_sentences(mapped)), expected)
+
+    def test_split_stream(self):
+        """
+        Test that the sentences of a text given in pieces are those of the whole text,
+        whatever the pieces and blocks.
+        """
+        rng = random.Random(0)
+        words = [
+            "Dr.",
+            "Prof.",
+            "Ar.",
+            "Gör.",
+            "Ali",
+            "geldi.",
+            "mi?",
+            "evet!",
+            "Ph.D.",
+            "5.",
+            "Dz.",
+            "Kuv.",
+            "K.",
+            "çok.",
+        ]
+        for _ in range(100):
+            text = "".join(
+                rng.choice(words) + rng.choice([" ", "  ", "\n", ""])
+                for _ in range(rng.randint(0, 30))
+            )
+            cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, 5)))
+            pieces = [
+                text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])
+            ]
+            for block_size in (1, 4, 1 << 20):
+                sentences = list(
+                    self.splitter.split_stream(pieces, block_size=block_size)
+                )
+                self.assertEqual(sentences, self.splitter.split_sentences(text))
+        with self.assertRaises(ValueError):
+            list(self.splitter.split_stream([], block_size=0))
+
+    def test_split_file(self):
+        """
+        Test that the sentences of a file split by worker processes are those of the
+        whole text.
+        """
+        text = "Doç. Dr. Şükrü Öztürk geldi.\r\nAr. Gör. Ayşe de geldi mi? Evet!\n" * 50
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "dump.txt")
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                file.write(text)
+            expected = self.splitter.split_sentences(text)
+            self.assertEqual(
+                list(self.splitter.split_file(path, block_size=64)), expected
+            )
+            self.assertEqual(
+                list(self.splitter.split_file(path, block_size=64, n_jobs=2)), expected
+            )
+
+    def test_split_stream_custom_prefixes(self):
+        """
+        Test that worker processes split the blocks with the prefixes of the splitter,
+        not the default ones.
+        """
+        splitter = SentenceSplitter()
+        splitter._prefix_words = splitter._prefix_words | {"Sn"}
+        text = ("Sn. Ayşe geldi. Sn. Ali gitti mi? Evet! " * 20).rstrip()
+        expected = splitter.split_sentences(text)
+        self.assertEqual(
+            expected[:3], ["Sn. Ayşe geldi.", "Sn. Ali gitti mi?", "Evet!"]
+        )
+        self.assertEqual(len(expected), 60)
+        for n_jobs in (1, 2):
+            self.assertEqual(
+                list(splitter.split_stream([text], block_size=32, n_jobs=n_jobs)),
+                expected,
+            )
+
+    def test_custom_prefixes_bytes(self):
+        """Test that bytes are split with the prefixes of the splitter, like str"""
+        splitter = SentenceSplitter()
+        splitter._prefix_words = splitter._prefix_words | {"Sn", "Şb", "Uzm"}
+        splitter._prefix_phrases = {
+            **splitter._prefix_phrases,
+            "Dt": ("Uzm. Dt",),
+        }
+        text = "Sn. Ayşe geldi. Şb. Müdürü Uzm. Dt. Ali de geldi mi? Evet!"
+        expected = splitter.split_sentences(text)
+        self.assertEqual(
+            expected,
+            ["Sn. Ayşe geldi.", "Şb. Müdürü Uzm. Dt. Ali de geldi mi?", "Evet!"],
+        )
+        encoded = text.encode("utf-8")
+        self.assertEqual(
+            [
+                bytes(sentence).decode("utf-8")
+                for sentence in splitter.iter_sentences(encoded)
+            ],
+            expected,
+        )
+        self.assertEqual(list(self.splitter.iter_sentences(encoded))[0], b"Sn.")
+
+    def test_prefix_pattern_deprecated(self):
+        """Test that the deprecated prefix_pattern warns and replaces the prefixes"""
+        splitter = SentenceSplitter()
+        with self.assertWarns(DeprecationWarning):
+            pattern = splitter.prefix_pattern
+        with self.assertWarns(DeprecationWarning):
+            splitter.prefix_pattern = pattern
+        self.assertEqual(splitter._prefix_words, self.splitter._prefix_words)
+        self.assertEqual(splitter._prefix_phrases, self.splitter._prefix_phrases)
+
+        text = "Sn. Ali ve Uzm. Dt. Veli geldi. Dr. Can gitti."
+        with self.assertWarns(DeprecationWarning):
+            splitter.prefix_pattern = r"(?:^|\s)(Sn|Uzm|Uzm\. Dt)\."
+        self.assertEqual(splitter.non_breaking_prefixes_tr, ["Sn", "Uzm", "Uzm. Dt"])
+        self.assertEqual(
+            splitter.split_sentences(text),
+            ["Sn. Ali ve Uzm. Dt. Veli geldi.", "Dr.", "Can gitti."],
+        )
+        self.assertEqual(
+            [bytes(sentence) for sentence in splitter.iter_sentences(text.encode())],
+            [b"Sn. Ali ve Uzm. Dt. Veli geldi.", b"Dr.", b"Can gitti."],
+        )
+        with self.assertWarns(DeprecationWarning):
+            with self.assertRaises(ValueError):
+                splitter.prefix_pattern = r"(Sn|Dr)\."
+
+        splitter.non_breaking_prefixes_tr = ["Dr"]
+        self.assertEqual(
+            splitter.split_sentences(text),
+            ["Sn.", "Ali ve Uzm.", "Dt.", "Veli geldi.", "Dr. Can gitti."],
+        )
+
+    def test_split_stream_long_words(self):
+        """
+        Test that pieces without whitespace are buffered until the block can be cut.
+        """
+        text = "a" * 1000 + ". Bu da!"
+        pieces = list(text[:1000]) + [text[1000:]]
+        self.assertEqual(
+            list(self.splitter.split_stream(pieces, block_size=8)),
+            ["a" * 1000 + ".", "Bu da!"],
+        )
@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+
+from mintlemon import Normalizer, StopwordFilter
+from mintlemon.normalizer.normalizer import _stopword_filter
+
+
+class TestStopwordFilter(unittest.TestCase):
+    """Tests for the StopwordFilter class"""
+
+    def test_filter(self):
+        """Test that stop words are removed whatever their case, the Turkish way"""
+        stopwords = StopwordFilter()
+        text = "Bu bir örnek cümle, İÇİN gereksiz kelimeleri Işte çıkarmak istiyorum."
+        self.assertEqual(
+            stopwords.filter(text),
+            "örnek cümle, gereksiz kelimeleri Işte çıkarmak istiyorum.",
+        )
+        self.assertEqual(stopwords.filter("  "), "")
+        self.assertIn("İçin", stopwords)
+        self.assertNotIn("örnek", stopwords)
+        self.assertEqual(
+            stopwords.filter_tokens(["Ve", "elma", "İLE", "armut"]), ["elma", "armut"]
+        )
+        self.assertEqual(
+            stopwords.filter_many([text, "ve"]), [stopwords.filter(text), ""]
+        )
+
+    def test_sources(self):
+        """Test stop words given as a file, a list or a set"""
+        self.assertEqual(
+            StopwordFilter(["IŞIK", "İz"]).stopwords, frozenset(["ışık", "iz"])
+        )
+        normalized = {"ışık", "iz"}
+        stopwords = StopwordFilter(normalized)
+        self.assertIs(stopwords.stopwords, normalized)
+        normalized.add("yol")
+        self.assertEqual(stopwords.filter("Işık yol İz ağaç"), "ağaç")
+        self.assertEqual(StopwordFilter({"Işık"}).stopwords, frozenset(["ışık"]))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stop_words.txt")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("Bir\nİki üç\n")
+            self.assertEqual(
+                StopwordFilter(path).stopwords, frozenset(["bir", "iki", "üç"])
+            )
+
+    def test_remove_stopwords(self):
+        """Test that Normalizer.remove_stopwords accepts every kind of stop words"""
+        text = "Bir elma ve İKİ armut"
+        self.assertEqual(Normalizer.remove_stopwords(text), "elma armut")
+        self.assertEqual(
+            Normalizer.remove_stopwords(text, ["elma", "İki"]), "Bir ve armut"
+        )
+        self.assertEqual(
+            Normalizer.remove_stopwords(text, {"elma"}), "Bir ve İKİ armut"
+        )
+        self.assertEqual(
+            Normalizer.remove_stopwords(text, StopwordFilter(["armut"])),
+            "Bir elma ve İKİ",
+        )
+
+    def test_cached_filters(self):
+        """Test that the filters of caller-supplied sets are reused only while valid"""
+        normalized = {"elma", "iki"}
+        stopwords = _stopword_filter(normalized)
+        self.assertIs(_stopword_filter(normalized), stopwords)
+        normalized.add("armut")
+        self.assertEqual(
+            Normalizer.remove_stopwords("Bir elma ve İKİ armut", normalized), "Bir ve"
+        )
+
+        frozen = frozenset(["Elma"])
+        self.assertIs(_stopword_filter(frozen), _stopword_filter(frozen))
+
+        mixed = {"Elma"}
+        self.assertIsNot(_stopword_filter(mixed), _stopword_filter(mixed))
+        mixed.add("Armut")
+        self.assertEqual(
+            Normalizer.remove_stopwords("Bir elma ve armut", mixed), "Bir ve"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,324 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+import zeyrek
+from scipy import sparse
+from sklearn.base import clone
+from sklearn.exceptions import NotFittedError
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import MaxAbsScaler
+
+from mintlemon import HashingRootVectorizer, RootCache, TextRootDTMVectorizer
+from mintlemon.normalizer import text_to_root_dtm
+
+
+class TestTextRootDTMVectorizer(unittest.TestCase):
+    """Tests for the TextRootDTMVectorizer class"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dataframe = pd.DataFrame(
+            {"text": ["bu bir örnek metindir", "başka bir örnek metin"]}
+        )
+        # Loading the morphological analyzer takes seconds, share a single vectorizer.
+        cls.shared_vectorizer = TextRootDTMVectorizer(
+            cls.dataframe, "text", tokenizer="builtin", root_cache=RootCache()
+        )
+
+    def vectorizer(self):
+        return self.shared_vectorizer
+
+    def test_fit_transform(self):
+        """Test the dense document-term matrix of a small corpus"""
+        expected = pd.DataFrame(
+            [[0, 1, 1, 1, 1], [1, 1, 0, 1, 1]],
+            columns=["başka", "bir", "bu", "metîn", "örnek"],
+        )
+        pd.testing.assert_frame_equal(self.vectorizer().fit_transform(), expected)
+
+    def test_sparse_output(self):
+        """Test that the sparse outputs hold the same matrix as the dense one"""
+        vectorizer = self.vectorizer()
+        dense = vectorizer.fit_transform(sparse=False)
+
+        frame = vectorizer.fit_transform(sparse=True)
+        self.assertTrue(
+            all(isinstance(dtype, pd.SparseDtype) for dtype in frame.dtypes)
+        )
+        pd.testing.assert_frame_equal(frame.sparse.to_dense(), dense)
+
+        matrix, roots = vectorizer.fit_transform(sparse=True, as_frame=False)
+        self.assertTrue(sparse.isspmatrix_csr(matrix))
+        self.assertEqual(list(roots), list(dense.columns))
+        self.assertEqual(matrix.toarray().tolist(), dense.values.tolist())
+
+        array, _ = vectorizer.fit_transform(sparse=False, as_frame=False)
+        self.assertEqual(array.tolist(), dense.values.tolist())
+
+    def test_sparse_by_default_for_large_matrices(self):
+        """Test that a matrix with more than DENSE_CELL_LIMIT cells is kept sparse"""
+        limit = text_to_root_dtm.DENSE_CELL_LIMIT
+        text_to_root_dtm.DENSE_CELL_LIMIT = 9
+        try:
+            frame = self.vectorizer().fit_transform()
+        finally:
+            text_to_root_dtm.DENSE_CELL_LIMIT = limit
+        self.assertTrue(
+            all(isinstance(dtype, pd.SparseDtype) for dtype in frame.dtypes)
+        )
+
+    def test_fit_then_transform(self):
+        """Test that fit and transform of any iterable match fit_transform"""
+        vectorizer = self.vectorizer()
+        expected = vectorizer.fit_transform()
+        texts = iter(self.dataframe["text"].tolist())
+        pd.testing.assert_frame_equal(
+            vectorizer.fit(texts).transform(self.dataframe), expected
+        )
+        pd.testing.assert_frame_equal(
+            vectorizer.fit_transform(self.dataframe["text"]), expected
+        )
+
+    def test_transform_ignores_unknown_roots(self):
+        """Test that roots outside of the fitted vocabulary are not counted"""
+        vectorizer = self.vectorizer().fit()
+        matrix, roots = vectorizer.transform(
+            ["bir kitap", "örnek metin"], sparse=True, as_frame=False
+        )
+        self.assertEqual(list(roots), ["başka", "bir", "bu", "metîn", "örnek"])
+        self.assertEqual(matrix.toarray().tolist(), [[0, 1, 0, 0, 0], [0, 0, 0, 1, 1]])
+
+    def test_partial_fit(self):
+        """Test that partial_fit appends new roots without moving the fitted ones"""
+        vectorizer = self.vectorizer()
+        vectorizer.fit(["bu bir örnek metindir"])
+        self.assertEqual(
+            list(vectorizer.get_feature_names_out()), ["bir", "bu", "metîn", "örnek"]
+        )
+        vectorizer.partial_fit(["başka bir kitap"])
+        self.assertEqual(
+            list(vectorizer.get_feature_names_out()),
+            ["bir", "bu", "metîn", "örnek", "başka", "kitap"],
+        )
+        self.assertEqual(vectorizer.vocabulary_["kitap"], 5)
+
+        frame = vectorizer.transform(["başka bir örnek"])
+        self.assertEqual(frame.values.tolist(), [[1, 0, 0, 1, 1, 0]])
+
+    def test_not_fitted(self):
+        """Test that transform needs a fitted vocabulary"""
+        vectorizer = TextRootDTMVectorizer(
+            tokenizer="builtin", root_cache=self.shared_vectorizer.root_cache
+        )
+        with self.assertRaises(NotFittedError):
+            vectorizer.transform(["bir metin"])
+        with self.assertRaises(ValueError):
+            vectorizer.fit()
+        with self.assertRaises(ValueError):
+            TextRootDTMVectorizer(chunksize=0)
+
+    def test_deprecated_vectorizer(self):
+        """Test that the deprecated vectorizer attribute follows the vocabulary"""
+        vectorizer = TextRootDTMVectorizer(
+            tokenizer="builtin", root_cache=self.shared_vectorizer.root_cache
+        )
+        with self.assertWarns(DeprecationWarning):
+            with self.assertRaises(NotFittedError):
+                vectorizer.vectorizer.get_feature_names_out()
+        vectorizer.fit_transform(["bu bir örnek metindir"])
+        vectorizer.partial_fit(["başka bir örnek metin"])
+        with self.assertWarns(DeprecationWarning):
+            names = vectorizer.vectorizer.get_feature_names_out()
+        self.assertEqual(names.tolist(), vectorizer.get_feature_names_out().tolist())
+
+    def test_pickle(self):
+        """Test that a fitted vectorizer pickles its vocabulary and root cache"""
+        vectorizer = self.vectorizer().fit()
+        restored = pickle.loads(pickle.dumps(vectorizer))
+        self.assertEqual(restored.vocabulary_, vectorizer.vocabulary_)
+        self.assertIsNone(restored._analyzer)
+        self.assertIsNone(restored.dataframe)
+        self.assertIn("metindir", restored.root_cache)
+        pd.testing.assert_frame_equal(
+            restored.transform(self.dataframe), vectorizer.transform(self.dataframe)
+        )
+        self.assertNotIn(
+            b"metindir", pickle.dumps(TextRootDTMVectorizer(self.dataframe, "text"))
+        )
+        # Every word was cached, the analyzer is not even loaded.
+        self.assertIsNone(restored._analyzer)
+
+    def test_sklearn_estimator(self):
+        """Test that the vectorizer can be cloned, reconfigured and put in a Pipeline"""
+        vectorizer = self.vectorizer().fit()
+        params = vectorizer.get_params()
+        self.assertEqual(params["tokenizer"], "builtin")
+        self.assertIs(params["dataframe"], self.dataframe)
+
+        cloned = clone(vectorizer)
+        self.assertFalse(hasattr(cloned, "vocabulary_"))
+        self.assertEqual(cloned.set_params(chunksize=1).chunksize, 1)
+        self.assertEqual(vectorizer.chunksize, 10_000)
+
+        pipeline = Pipeline([("roots", cloned), ("scale", MaxAbsScaler())])
+        matrix = pipeline.fit_transform(self.dataframe["text"].tolist())
+        self.assertEqual(matrix.shape, (2, 5))
+
+    def test_streaming(self):
+        """Test that texts streamed in small chunks give the same matrix"""
+        expected = self.vectorizer().fit_transform()
+        vectorizer = TextRootDTMVectorizer(
+            column_name="text",
+            tokenizer="builtin",
+            root_cache=self.shared_vectorizer.root_cache,
+            chunksize=1,
+        )
+        texts = self.dataframe["text"].tolist()
+        pd.testing.assert_frame_equal(vectorizer.fit_transform(iter(texts)), expected)
+        pd.testing.assert_frame_equal(
+            vectorizer.fit_transform(self.dataframe), expected
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = {}
+            for extension in ("csv", "tsv", "jsonl", "txt"):
+                paths[extension] = os.path.join(directory, f"corpus.{extension}")
+            self.dataframe.to_csv(paths["csv"], index=False)
+            self.dataframe.to_csv(paths["tsv"], sep="\t", index=False)
+            self.dataframe.to_json(
+                paths["jsonl"], orient="records", lines=True, force_ascii=False
+            )
+            with open(paths["txt"], "w", encoding="utf-8") as file:
+                file.write("\n".join(texts) + "\n")
+
+            for path in paths.values():
+                pd.testing.assert_frame_equal(vectorizer.fit_transform(path), expected)
+            with pd.read_csv(paths["csv"], chunksize=1) as reader:
+                pd.testing.assert_frame_equal(
+                    vectorizer.fit(reader).transform(paths["jsonl"]), expected
+                )
+            with self.assertRaises(ValueError):
+                TextRootDTMVectorizer(tokenizer="builtin").fit(paths["csv"])
+
+    def test_parse_word_matches_analyze(self):
+        """Test that the private zeyrek parser of words gives the roots of analyze"""
+        vectorizer = self.shared_vectorizer
+        self.assertTrue(
+            callable(getattr(zeyrek.MorphAnalyzer, "_parse", None)),
+            "zeyrek removed _parse",
+        )
+        words = ["metindir", "kelimelerimiz", "İstanbul'da", "gidiyorum", "xqzw", "bir"]
+        # analyze tokenizes with nltk, a single word is its own token.
+        with mock.patch.object(
+            zeyrek.morphology, "word_tokenize", lambda text, language: [text]
+        ):
+            for word in words:
+                self.assertEqual(
+                    vectorizer._parse_word(word),
+                    vectorizer.analyzer.analyze(word)[0][0].lemma,
+                    word,
+                )
+
+    def test_n_jobs(self):
+        """Test that worker processes give the same matrix and fill the root cache"""
+        expected = self.vectorizer().fit_transform()
+        root_cache = RootCache()
+        vectorizer = TextRootDTMVectorizer(
+            self.dataframe,
+            "text",
+            tokenizer="builtin",
+            root_cache=root_cache,
+            chunksize=1,
+            n_jobs=2,
+        )
+        pd.testing.assert_frame_equal(vectorizer.fit_transform(), expected)
+        self.assertEqual(len(root_cache), 6)
+        self.assertEqual(root_cache.get("metindir", None), "metîn")
+
+    def test_n_jobs_stats(self):
+        """Test that the lookups of worker processes are counted in the root cache"""
+        stats = []
+        for n_jobs in (1, 2):
+            root_cache = RootCache()
+            TextRootDTMVectorizer(
+                self.dataframe,
+                "text",
+                tokenizer="builtin",
+                root_cache=root_cache,
+                n_jobs=n_jobs,
+            ).fit_transform()
+            stats.append(root_cache.stats())
+        self.assertEqual(stats[1], stats[0])
+        self.assertEqual(stats[0]["misses"], 6)
+
+
+class TestHashingRootVectorizer(unittest.TestCase):
+    """Tests for the HashingRootVectorizer class"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.texts = ["bu bir örnek metindir", "başka bir örnek metin"]
+        cls.root_cache = RootCache()
+
+    def test_transform(self):
+        """Test that the hashed matrix holds the counts of TextRootDTMVectorizer"""
+        vectorizer = HashingRootVectorizer(
+            n_features=2**10,
+            tokenizer="builtin",
+            root_cache=self.root_cache,
+            store_roots=True,
+        )
+        matrix = vectorizer.fit_transform(self.texts)
+        self.assertTrue(sparse.isspmatrix_csr(matrix))
+        self.assertEqual(matrix.shape, (2, 2**10))
+
+        expected = TextRootDTMVectorizer(
+            tokenizer="builtin", root_cache=self.root_cache
+        ).fit_transform(self.texts)
+        for root in expected.columns:
+            [column] = [
+                column for column, roots in vectorizer.roots_.items() if root in roots
+            ]
+            self.assertEqual(
+                matrix[:, column].toarray().ravel().tolist(), expected[root].tolist()
+            )
+        self.assertEqual(sum(len(roots) for roots in vectorizer.roots_.values()), 5)
+
+    def test_stateless(self):
+        """Test that separate vectorizers and chunks hash to the same columns"""
+        first = HashingRootVectorizer(
+            n_features=64, tokenizer="builtin", root_cache=self.root_cache
+        )
+        second = HashingRootVectorizer(
+            n_features=64, tokenizer="builtin", root_cache=self.root_cache, chunksize=1
+        )
+        matrix = first.transform(self.texts)
+        self.assertEqual((second.transform(self.texts) != matrix).nnz, 0)
+        stacked = sparse.vstack(
+            [second.transform(self.texts[:1]), second.transform(self.texts[1:])]
+        )
+        self.assertEqual((stacked != matrix).nnz, 0)
+        self.assertEqual(first.transform([]).shape, (0, 64))
+        self.assertFalse(hasattr(first, "roots_"))
+
+    def test_not_a_vocabulary_vectorizer(self):
+        """Test that the hashing vectorizer has no vocabulary nor feature names"""
+        vectorizer = HashingRootVectorizer(
+            n_features=64, tokenizer="builtin", root_cache=self.root_cache
+        )
+        self.assertNotIsInstance(vectorizer, TextRootDTMVectorizer)
+        self.assertFalse(hasattr(vectorizer, "get_feature_names_out"))
+        self.assertFalse(hasattr(vectorizer.fit(self.texts), "vocabulary_"))
+
+        vectorizer.set_params(n_features=32, store_roots=True)
+        self.assertEqual(vectorizer.transform(self.texts).shape, (2, 32))
+        self.assertEqual(sum(len(roots) for roots in vectorizer.roots_.values()), 5)
+        self.assertEqual(clone(vectorizer).get_params()["n_features"], 32)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from mintlemon import WordTokenizer
+
+
+class TestWordTokenizer(unittest.TestCase):
+    """Tests for the WordTokenizer class"""
+
+    def setUp(self):
+        self.tokenizer = WordTokenizer()
+
+    def test_tokenize(self):
+        """Test a text with apostrophe suffixes, numbers, hyphens and punctuation"""
+        text = (
+            "İstanbul'da 3,5 saat kaldık... "
+            "1990'lı yıllarda e-posta yoktu, saat 12:30'da geldi!"
+        )
+        expected = [
+            "İstanbul'da",
+            "3,5",
+            "saat",
+            "kaldık",
+            "...",
+            "1990'lı",
+            "yıllarda",
+            "e-posta",
+            "yoktu",
+            ",",
+            "saat",
+            "12:30'da",
+            "geldi",
+            "!",
+        ]
+        self.assertEqual(self.tokenizer.tokenize(text), expected)
+
+    def test_sentence_final_period(self):
+        """Test that periods are split from the words they end"""
+        self.assertEqual(
+            self.tokenizer.tokenize("Geldi. Gitti."), ["Geldi", ".", "Gitti", "."]
+        )
+
+    def test_typographic_apostrophe_and_combining_dot(self):
+        """Test the right single quotation mark and the dot of İ under str.lower()"""
+        self.assertEqual(self.tokenizer.tokenize("Ankara’ya"), ["Ankara’ya"])
+        self.assertEqual(
+            self.tokenizer.tokenize("İSTANBUL'DA".lower()), ["İSTANBUL'DA".lower()]
+        )
+
+    def test_iter_tokens(self):
+        """Test that iter_tokens lazily yields the same tokens as tokenize"""
+        text = "Bu bir örnek cümle, değil mi?"
+        tokens = self.tokenizer.iter_tokens(text)
+        self.assertEqual(next(tokens), "Bu")
+        self.assertEqual(["Bu"] + list(tokens), self.tokenizer.tokenize(text))
+        self.assertEqual(self.tokenizer(text), self.tokenizer.tokenize(text))
+        self.assertEqual(self.tokenizer.tokenize("  \n "), [])
+
+
+if __name__ == "__main__":
+    unittest.main()